@@ -9,9 +9,12 @@ from typing import Any
 import asyncio
 
 # Internal imports
-from mlflow_assistant.utils.config import load_config, get_mlflow_uri, get_provider_config
+from mlflow_assistant.utils.config import load_config, get_mlflow_uri, get_provider_config, get_snapshot_path
 from mlflow_assistant.utils.constants import Command, CONFIG_KEY_MLFLOW_URI, CONFIG_KEY_PROVIDER, CONFIG_KEY_TYPE, CONFIG_KEY_MODEL, DEFAULT_STATUS_NOT_CONFIGURED, LOG_FORMAT
-from mlflow_assistant.engine.processor import process_query
+from mlflow_assistant.engine.definitions import EVENT_KEY_TYPE, EVENT_RESULT, EVENT_TOKEN, EVENT_TOOL_END, EVENT_TOOL_START
+from mlflow_assistant.engine.processor import stream_query
+from mlflow_assistant.engine.memory import ConversationMemory
+from mlflow_assistant.engine.tool_cache import ToolCallCache
 from mlflow_assistant.cli.setup import setup_wizard
 from mlflow_assistant.cli.validation import validate_setup
 
@@ -52,20 +55,60 @@ def _handle_special_commands(query: str) -> str | None:
     return None  # Process normally
 
 
-async def _process_user_query(query: str, provider_config: dict, verbose: bool) -> None:
+async def _process_user_query(
+    query: str,
+    provider_config: dict,
+    verbose: bool,
+    tool_cache: ToolCallCache,
+    memory: ConversationMemory | None = None,
+) -> None:
     """Process a user query and display the response.
 
     Args:
         query: The user's query
         provider_config: The AI provider configuration
         verbose: Whether to show verbose output
+        tool_cache: The tool call cache of the chat session
+        memory: The conversation memory of the chat session
 
     """
     try:
-        result = await process_query(query, provider_config, verbose)
-
-        # Display response
-        click.echo(f"\n🤖 {result['response'].content}")
+        result = {}
+        # Whether the cursor is in the middle of a streamed answer line
+        streaming = False
+        async for event in stream_query(
+            query, provider_config, verbose, tool_cache=tool_cache, memory=memory,
+        ):
+            event_type = event[EVENT_KEY_TYPE]
+            if event_type == EVENT_TOKEN:
+                if not streaming:
+                    click.echo("\n🤖 ", nl=False)
+                    streaming = True
+                click.echo(event["content"], nl=False)
+            elif event_type == EVENT_TOOL_START:
+                if streaming:
+                    click.echo()
+                    streaming = False
+                click.echo(f"\n🔧 Running {event['name']}...")
+            elif event_type == EVENT_TOOL_END:
+                status = "cached" if event["cache_hit"] else f"{event['duration']:.1f}s"
+                mark = "❌" if event["error"] else "✅"
+                click.echo(f"{mark} {event['name']} ({status})")
+            elif event_type == EVENT_RESULT:
+                result = event
+
+        # Display the response when it was not streamed, e.g. on errors
+        if streaming:
+            click.echo()
+        elif "error" in result:
+            click.echo(f"\n❌ {result['response']}")
+        else:
+            click.echo(f"\n🤖 {result['response'].content}")
+
+        timing = f"Total: {result['duration']:.2f}s"
+        if result.get("time_to_first_token") is not None:
+            timing = f"First token: {result['time_to_first_token']:.2f}s | {timing}"
+        click.echo(f"\n⏱️  {timing}")
 
         # Show verbose info if requested
         if verbose:
@@ -78,7 +121,11 @@ async def _process_user_query(query: str, provider_config: dict, verbose: bool)
             click.echo("\n--- Debug Information ---")
             click.echo(f"Provider: {provider_type}")
             click.echo(f"Model: {model}")
-            click.echo("Query processed with mock function")
+            if usage := result.get("context_budget"):
+                click.echo(
+                    f"Context: ~{usage['tokens_after']}/{usage['budget']} tokens"
+                    f" (cut ~{usage['tokens_before'] - usage['tokens_after']})",
+                )
             click.echo("-------------------------")
 
     except Exception as e:
@@ -152,7 +199,11 @@ def setup():
 
 @cli.command()
 @click.option("--verbose", "-v", is_flag=True, help="Show verbose output")
-def start(verbose):
+@click.option(
+    "--session", "-s", default=None,
+    help="Name of the conversation to continue (kept across runs with the sqlite memory backend)",
+)
+def start(verbose, session):
     """Start an interactive chat session with MLflow Assistant.
 
     This opens an interactive chat session where you can ask questions about
@@ -193,6 +244,11 @@ def start(verbose):
     click.echo(f"Type {Command.EXIT.value} to exit.")
     click.echo("=" * 70)
 
+    # Repeated tool calls within the session are answered from this cache
+    tool_cache = ToolCallCache()
+    # Follow-up questions continue the conversation kept here
+    memory = ConversationMemory.from_config(session)
+
     # Start interactive loop
     while True:
         # Get user input with a prompt
@@ -210,7 +266,71 @@ def start(verbose):
             continue
 
         # Process the query
-        asyncio.run(_process_user_query(query, provider_config, verbose))
+        asyncio.run(_process_user_query(query, provider_config, verbose, tool_cache, memory))
+
+
+@cli.group()
+def index():
+    """Manage the local metadata snapshot.
+
+    The snapshot mirrors experiments, runs and registered models into a local
+    SQLite file, so questions can be answered without querying the MLflow
+    server while it is fresh.
+    """
+
+
+def _update_snapshot(rebuild: bool) -> None:
+    """Build or incrementally refresh the local metadata snapshot.
+
+    Args:
+        rebuild: Whether to discard the existing snapshot first
+
+    """
+    from mlflow_assistant.core.connection import MLflowConnection
+    from mlflow_assistant.core.snapshot import MetadataSnapshot
+
+    mlflow_uri = get_mlflow_uri()
+    if not mlflow_uri:
+        click.echo(
+            "❌ Error: MLflow URI not configured. Run 'mlflow-assistant setup' first.",
+        )
+        return
+
+    connection = MLflowConnection(tracking_uri=mlflow_uri)
+    success, message = connection.connect()
+    if not success:
+        click.echo(f"❌ Error: {message}")
+        return
+
+    snapshot = MetadataSnapshot(get_snapshot_path())
+    action = "Building" if rebuild else "Refreshing"
+    click.echo(f"{action} metadata snapshot at {snapshot.path}...")
+
+    try:
+        if rebuild:
+            counts = snapshot.build(connection.get_client(), mlflow_uri)
+        else:
+            counts = snapshot.refresh(connection.get_client(), mlflow_uri)
+    except Exception as e:
+        click.echo(f"❌ Error updating snapshot: {e!s}")
+        return
+
+    click.echo(
+        f"✅ Snapshot updated: {counts['experiments']} experiments, "
+        f"{counts['runs']} runs, {counts['models']} models",
+    )
+
+
+@index.command()
+def build():
+    """Build the local metadata snapshot from scratch."""
+    _update_snapshot(rebuild=True)
+
+
+@index.command()
+def refresh():
+    """Incrementally refresh the local metadata snapshot."""
+    _update_snapshot(rebuild=False)
 
 
 @cli.command()
@@ -6,7 +6,7 @@ operation of MLflow Assistant.
 """
 import logging
 from typing import Any
-import requests
+from mlflow_assistant.core.http import get_probe_session
 
 # Import from utils module
 from mlflow_assistant.utils.constants import Provider, CONFIG_KEY_TYPE, CONFIG_KEY_API_KEY, OPENAI_API_KEY_ENV, MLFLOW_VALIDATION_ENDPOINTS, MLFLOW_CONNECTION_TIMEOUT, OLLAMA_CONNECTION_TIMEOUT, OLLAMA_TAGS_ENDPOINT
@@ -76,7 +76,7 @@ def validate_mlflow_uri(uri: str) -> bool:
             url = f"{clean_uri}{endpoint}"
             logger.debug(f"Trying to connect to MLflow at: {url}")
 
-            response = requests.get(url, timeout=MLFLOW_CONNECTION_TIMEOUT)
+            response = get_probe_session().get(url, timeout=MLFLOW_CONNECTION_TIMEOUT)
             if response.status_code == 200:
                 logger.info(f"Successfully connected to MLflow at {url}")
                 return True
@@ -102,7 +102,7 @@ def validate_ollama_connection(uri: str) -> tuple[bool, dict[str, Any]]:
 
     """
     try:
-        response = requests.get(
+        response = get_probe_session().get(
             f"{uri}{OLLAMA_TAGS_ENDPOINT}", timeout=OLLAMA_CONNECTION_TIMEOUT,
         )
         if response.status_code == 200:
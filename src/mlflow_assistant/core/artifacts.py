@@ -0,0 +1,144 @@
+"""Partial reads of MLflow run artifacts.
+
+Artifacts can be large model files, so previews only read the requested byte
+range: files in local artifact stores are memory-mapped, and artifacts proxied
+by the tracking server are streamed and closed as soon as enough bytes arrived.
+"""
+import mmap
+import os
+import posixpath
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import quote, urlparse
+
+from mlflow.utils.file_utils import local_file_uri_to_path
+from mlflow.utils.uri import is_local_uri
+
+from mlflow_assistant.core.http import get_http_session, get_mlflow_auth
+from mlflow_assistant.utils.definitions import (
+    ARTIFACT_REQUEST_TIMEOUT,
+    ARTIFACT_STREAM_CHUNK_SIZE,
+    MLFLOW_ARTIFACTS_API_PREFIX,
+)
+
+PROXIED_ARTIFACTS_SCHEME = "mlflow-artifacts"
+
+
+@dataclass
+class ArtifactChunk:
+    """A byte range read from an artifact."""
+
+    data: bytes
+    offset: int
+    size: int | None  # Total artifact size, if known
+
+
+def resolve_local_artifact(artifact_uri: str, path: str) -> Path | None:
+    """Resolve an artifact to a file path when the artifact store is local.
+
+    Args:
+        artifact_uri: The artifact root URI of the run.
+        path: The artifact path, relative to the artifact root.
+
+    Returns:
+        The local file path, or None if the artifact store is not local.
+
+    Raises:
+        ValueError: If the path points outside the artifact root.
+
+    """
+    if not is_local_uri(artifact_uri, is_tracking_or_registry_uri=False):
+        return None
+    root = Path(local_file_uri_to_path(artifact_uri)).resolve()
+    target = (root / path).resolve()
+    if not target.is_relative_to(root):
+        msg = f"Artifact path is outside the run's artifacts: {path}"
+        raise ValueError(msg)
+    return target
+
+
+def read_local_range(path: Path, offset: int, length: int) -> ArtifactChunk:
+    """Read a byte range of a local file through a read-only memory map.
+
+    Only the pages covering the range are loaded, however large the file is.
+
+    Args:
+        path: The file to read.
+        offset: Index of the first byte to read.
+        length: Maximum number of bytes to read.
+
+    Returns:
+        ArtifactChunk: The bytes read and the file size.
+
+    """
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if offset >= size or length <= 0:
+            return ArtifactChunk(b"", offset, size)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return ArtifactChunk(mapped[offset:offset + length], offset, size)
+
+
+def is_proxied_artifact(artifact_uri: str) -> bool:
+    """Check if artifacts are served by the tracking server's artifact proxy."""
+    return urlparse(artifact_uri).scheme == PROXIED_ARTIFACTS_SCHEME
+
+
+def stream_proxied_range(
+    tracking_uri: str,
+    artifact_uri: str,
+    path: str,
+    offset: int,
+    length: int,
+    timeout: float = ARTIFACT_REQUEST_TIMEOUT,
+) -> ArtifactChunk:
+    """Read a byte range of an artifact served by the tracking server.
+
+    A Range header is sent, and the response is streamed and closed once the
+    range has been received, so servers ignoring the header do not send the
+    rest of the file either.
+
+    Args:
+        tracking_uri: HTTP(S) URI of the tracking server.
+        artifact_uri: The ``mlflow-artifacts:`` artifact root URI of the run.
+        path: The artifact path, relative to the artifact root.
+        offset: Index of the first byte to read.
+        length: Maximum number of bytes to read.
+        timeout: Request timeout, in seconds.
+
+    Returns:
+        ArtifactChunk: The bytes read and, if the server reports it, the artifact size.
+
+    """
+    parsed = urlparse(artifact_uri)
+    base_uri = tracking_uri
+    if parsed.netloc:
+        base_uri = f"{urlparse(tracking_uri).scheme}://{parsed.netloc}"
+    artifact_path = posixpath.join(parsed.path.lstrip("/"), path)
+    url = f"{base_uri.rstrip('/')}{MLFLOW_ARTIFACTS_API_PREFIX}/{quote(artifact_path)}"
+
+    headers, auth = get_mlflow_auth()
+    headers["Range"] = f"bytes={offset}-{offset + length - 1}"
+
+    with get_http_session().get(
+        url, headers=headers, auth=auth, stream=True, timeout=timeout,
+    ) as response:
+        response.raise_for_status()
+        partial = response.status_code == 206
+        skip = 0 if partial else offset
+
+        data = bytearray()
+        for chunk in response.iter_content(ARTIFACT_STREAM_CHUNK_SIZE):
+            data += chunk
+            if len(data) >= skip + length:
+                break
+
+        size = None
+        content_range = response.headers.get("Content-Range", "")
+        if partial and "/" in content_range:
+            total = content_range.rsplit("/", 1)[1]
+            size = int(total) if total.isdigit() else None
+        elif not partial and "Content-Length" in response.headers:
+            size = int(response.headers["Content-Length"])
+
+    return ArtifactChunk(bytes(data[skip:skip + length]), offset, size)
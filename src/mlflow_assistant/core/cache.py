@@ -0,0 +1,151 @@
+"""Caching layer for read-only MLflow client calls.
+
+This module provides a wrapper around `MlflowClient` that memoizes read-only
+metadata queries in a bounded, time-limited LRU cache, so repeated questions in a
+session are answered from memory instead of the tracking server.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from mlflow.tracking import MlflowClient
+
+from mlflow_assistant.utils.definitions import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTLS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a call argument into a hashable cache key component."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple | set):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class CachedMlflowClient:
+    """MlflowClient wrapper that caches read-only metadata calls.
+
+    Calls to the methods listed in ``ttls`` are memoized per set of arguments for
+    that method's TTL. Every other attribute is delegated to the wrapped client
+    unchanged, except that errors raised by its methods are reported to
+    ``on_error`` before propagating.
+    """
+
+    def __init__(
+        self,
+        client: MlflowClient,
+        ttls: dict[str, float] | None = None,
+        max_size: int = DEFAULT_CACHE_MAX_SIZE,
+        on_error: Callable[[Exception], None] | None = None,
+    ):
+        """Initialize the caching wrapper.
+
+        Args:
+            client: The MlflowClient instance to wrap.
+            ttls: Mapping of client method name to cache TTL in seconds.
+                Defaults to DEFAULT_CACHE_TTLS.
+            max_size: Maximum number of cached entries before the least
+                recently used entries are evicted.
+            on_error: Optional callback receiving every exception raised by a
+                client method, e.g. to mark the connection unhealthy.
+
+        """
+        self.client = client
+        self.on_error = on_error
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        """Return a cached version of read methods, or the client attribute."""
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+        if name in self.ttls:
+            attr = self._cached(name, attr)
+        if self.on_error is not None:
+            attr = self._reporting(attr)
+        return attr
+
+    def _reporting(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a client method so its errors are reported to on_error."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                self.on_error(e)
+                raise
+
+        return wrapper
+
+    def _cached(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a client method so its results are memoized."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (name, _freeze(args), _freeze(kwargs))
+            now = time.monotonic()
+
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+
+            result = method(*args, **kwargs)
+
+            with self._lock:
+                self._entries[key] = (now + self.ttls[name], result)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+
+            return result
+
+        return wrapper
+
+    def invalidate(self, method: str | None = None) -> None:
+        """Drop cached entries.
+
+        Args:
+            method: Name of the client method whose entries should be dropped.
+                If None, the whole cache is cleared.
+
+        """
+        with self._lock:
+            if method is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == method]:
+                    del self._entries[key]
+        logger.debug(f"Invalidated MLflow client cache ({method or 'all methods'})")
+
+    def cache_info(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns
+        -------
+            Dict[str, Any]: Hit and miss counters and current cache size.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
@@ -4,22 +4,311 @@ This module provides functionality to connect to both local and remote MLflow Tr
 using environment variables or direct configuration.
 """
 
+import asyncio
 import os
 import logging
-from typing import Any
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
+import httpx
 import mlflow
+import requests
+from mlflow.exceptions import MlflowException, RestException
 from mlflow.tracking import MlflowClient
 
+from mlflow_assistant.core.cache import CachedMlflowClient
+from mlflow_assistant.core.http import (
+    configure_mlflow_http,
+    get_http_session,
+    get_mlflow_auth,
+    get_pool_stats,
+    get_probe_session,
+)
+from mlflow_assistant.utils.config import get_http_pool_config
 from mlflow_assistant.utils.definitions import (
+    HttpPoolConfig,
     MLflowConnectionConfig,
     MLFLOW_TRACKING_URI_ENV,
+    MLFLOW_TRACKING_INSECURE_TLS_ENV,
+    MLFLOW_REST_API_PREFIX,
+    ASYNC_CLIENT_MAX_CONNECTIONS,
+    ASYNC_CLIENT_TIMEOUT,
+    ASYNC_CLIENT_PAGE_SIZE,
     DEFAULT_MLFLOW_TRACKING_URI,
+    HEALTH_CHECK_TTL,
+    HEALTH_PROBE_TIMEOUT,
+    RECONNECT_BASE_DELAY,
+    RECONNECT_MAX_ATTEMPTS,
+    RECONNECT_MAX_DELAY,
+    REMOTE_CONNECTION,
 )
 from mlflow_assistant.utils.exceptions import MLflowConnectionError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class AsyncMLflowClient:
+    """Asyncio client for the MLflow REST API.
+
+    All requests share one pooled ``httpx.AsyncClient``, so many requests can be
+    awaited together with ``asyncio.gather`` while reusing keep-alive connections.
+    Responses are returned as the decoded REST JSON payloads. The client is bound
+    to the event loop it is first used in; ``MLflowConnection.run_async`` keeps
+    one on a dedicated loop.
+    """
+
+    def __init__(
+        self,
+        tracking_uri: str,
+        max_connections: int = ASYNC_CLIENT_MAX_CONNECTIONS,
+        timeout: float = ASYNC_CLIENT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the async MLflow client.
+
+        Args:
+            tracking_uri: HTTP(S) URI of the MLflow Tracking Server.
+            max_connections: Maximum number of concurrent connections to the server.
+            timeout: Timeout of each request, in seconds. Waiting for a free
+                connection is not limited.
+            transport: Optional httpx transport, mainly for tests.
+
+        Raises:
+            MLflowConnectionError: If the tracking URI is not an HTTP(S) URI.
+
+        """
+        if MLflowConnectionConfig(tracking_uri).connection_type != REMOTE_CONNECTION:
+            msg = f"The async client requires an HTTP(S) tracking URI, got {tracking_uri}"
+            raise MLflowConnectionError(msg)
+
+        headers, auth = get_mlflow_auth()
+        insecure = os.environ.get(MLFLOW_TRACKING_INSECURE_TLS_ENV, "").lower() == "true"
+
+        self.tracking_uri = tracking_uri
+        self.http = httpx.AsyncClient(
+            base_url=tracking_uri.rstrip("/") + MLFLOW_REST_API_PREFIX,
+            headers=headers,
+            auth=auth,
+            verify=not insecure,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=httpx.Timeout(timeout, pool=None),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncMLflowClient":
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the client when leaving the async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self.http.aclose()
+
+    async def _request(self, method: str, endpoint: str, **kwargs: Any) -> dict[str, Any]:
+        """Send a request to a REST endpoint and decode its JSON response.
+
+        Args:
+            method: HTTP method.
+            endpoint: Endpoint path relative to the MLflow REST API prefix.
+            **kwargs: Extra arguments for ``httpx.AsyncClient.request``.
+
+        Returns:
+            The decoded JSON response.
+
+        Raises:
+            RestException: If the server returns an MLflow error.
+            MlflowException: If the server returns a non-JSON error response.
+
+        """
+        response = await self.http.request(method, endpoint, **kwargs)
+        if response.is_success:
+            return response.json()
+        try:
+            error = response.json()
+        except ValueError:
+            msg = f"MLflow API request to {endpoint} failed with status {response.status_code}: {response.text}"
+            raise MlflowException(msg) from None
+        raise RestException(error)
+
+    async def search_experiments(
+        self,
+        filter_string: str = "",
+        max_results: int = ASYNC_CLIENT_PAGE_SIZE,
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Search one page of experiments.
+
+        Returns:
+            The response with ``experiments`` and an optional ``next_page_token``.
+
+        """
+        body = {"filter": filter_string, "max_results": max_results}
+        if page_token:
+            body["page_token"] = page_token
+        return await self._request("POST", "/experiments/search", json=body)
+
+    async def search_runs(
+        self,
+        experiment_ids: list[str],
+        filter_string: str = "",
+        max_results: int = ASYNC_CLIENT_PAGE_SIZE,
+        order_by: list[str] | None = None,
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Search one page of runs.
+
+        Returns:
+            The response with ``runs`` and an optional ``next_page_token``.
+
+        """
+        body = {
+            "experiment_ids": experiment_ids,
+            "filter": filter_string,
+            "max_results": max_results,
+            "order_by": order_by or [],
+        }
+        if page_token:
+            body["page_token"] = page_token
+        return await self._request("POST", "/runs/search", json=body)
+
+    async def get_run(self, run_id: str) -> dict[str, Any]:
+        """Get a run by ID.
+
+        Returns:
+            The run, with ``info`` and ``data``.
+
+        """
+        response = await self._request("GET", "/runs/get", params={"run_id": run_id})
+        return response["run"]
+
+    async def search_model_versions(
+        self,
+        filter_string: str = "",
+        max_results: int = ASYNC_CLIENT_PAGE_SIZE,
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Search one page of model versions.
+
+        Returns:
+            The response with ``model_versions`` and an optional ``next_page_token``.
+
+        """
+        params = {"filter": filter_string, "max_results": max_results}
+        if page_token:
+            params["page_token"] = page_token
+        return await self._request("GET", "/model-versions/search", params=params)
+
+    async def get_runs(self, run_ids: list[str]) -> dict[str, dict[str, Any] | Exception]:
+        """Get several runs concurrently.
+
+        Args:
+            run_ids: The run IDs. Duplicates are fetched once.
+
+        Returns:
+            The run, or the exception raised while getting it, by run ID.
+
+        """
+        unique_ids = list(dict.fromkeys(run_ids))
+        results = await asyncio.gather(
+            *(self.get_run(run_id) for run_id in unique_ids),
+            return_exceptions=True,
+        )
+        return dict(zip(unique_ids, results, strict=True))
+
+    async def count_runs(
+        self,
+        experiment_ids: list[str],
+        filter_string: str = "",
+        time_budget: float | None = None,
+    ) -> dict[str, tuple[int | None, bool] | Exception]:
+        """Count the runs of several experiments concurrently.
+
+        Each experiment's runs are paged through independently, so the pages of
+        different experiments are requested in parallel.
+
+        Args:
+            experiment_ids: The experiment IDs.
+            filter_string: Optional run filter.
+            time_budget: Seconds after which counting stops and the partial
+                counts are returned. None waits for every count.
+
+        Returns:
+            By experiment ID, the run count and whether it is exact, or the
+            exception raised while counting. The count is None if no page had
+            been received when counting stopped.
+
+        """
+        unique_ids = list(dict.fromkeys(experiment_ids))
+        if not unique_ids:
+            return {}
+        counts = dict.fromkeys(unique_ids)
+
+        async def count(experiment_id: str) -> None:
+            page_token = None
+            while True:
+                page = await self.search_runs(
+                    [experiment_id], filter_string, page_token=page_token,
+                )
+                counts[experiment_id] = (counts[experiment_id] or 0) + len(page.get("runs", []))
+                page_token = page.get("next_page_token")
+                if not page_token:
+                    return
+
+        tasks = {
+            experiment_id: asyncio.create_task(count(experiment_id))
+            for experiment_id in unique_ids
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=time_budget)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results = {}
+        for experiment_id, task in tasks.items():
+            if task in pending:
+                results[experiment_id] = (counts[experiment_id], False)
+            elif (error := task.exception()) is not None:
+                results[experiment_id] = error
+            else:
+                results[experiment_id] = (counts[experiment_id], True)
+        return results
+
+
+def is_network_error(error: BaseException) -> bool:
+    """Check whether an error was caused by the server being unreachable.
+
+    The MLflow client wraps network failures in an MlflowException, so the
+    chain of exceptions the error was raised from is inspected too.
+
+    Args:
+        error: The exception raised by a client call.
+
+    Returns:
+        bool: True if a connection error or timeout, from either the sync or
+            the async client, is part of the chain.
+
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(
+            error,
+            requests.ConnectionError | requests.Timeout | httpx.TransportError,
+        ):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
 
 class MLflowConnection:
     """MLflow connection class to handle connections to MLflow Tracking Server.
@@ -28,17 +317,38 @@ class MLflowConnection:
     MLflow Tracking Servers.
     """
 
-    def __init__(self, tracking_uri: str | None = None, client_factory: Any = None):
+    def __init__(
+        self,
+        tracking_uri: str | None = None,
+        client_factory: Any = None,
+        http_config: HttpPoolConfig | None = None,
+        make_default: bool = True,
+    ):
         """Initialize MLflow connection.
 
         Args:
             tracking_uri: URI of the MLflow Tracking Server. If None, will try to get from environment.
             client_factory: A callable to create the MlflowClient instance. Defaults to MlflowClient.
+            http_config: Pool settings of the HTTP sessions. If None, will be read from the configuration.
+            make_default: Whether connecting also sets the tracking URI as MLflow's global
+                tracking URI. Disable it for secondary servers.
 
         """
         self.config = self._load_config(tracking_uri=tracking_uri)
+        self.http_config = http_config or get_http_pool_config()
+        self.make_default = make_default
         self.client = None
+        self.cached_client = None
+        self.async_client = None
+        self.event_loop = None
+        self.event_loop_thread = None
+        self.event_loop_lock = threading.Lock()
         self.is_connected_flag = False
+        self.last_health_check = None
+        self.health_check_ttl = HEALTH_CHECK_TTL
+        self.reconnect_lock = threading.Lock()
+        self.reconnect_count = 0
+        self.reconnect_result = None
         self.client_factory = client_factory or MlflowClient
 
     def _load_config(self, tracking_uri: str | None = None) -> MLflowConnectionConfig:
@@ -64,17 +374,149 @@ class MLflowConnection:
         """
         try:
             logger.debug(f"Connecting to MLflow Tracking Server at {self.config.tracking_uri}")
-            mlflow.set_tracking_uri(self.config.tracking_uri)
+            configure_mlflow_http(self.http_config)
+            if self.make_default:
+                mlflow.set_tracking_uri(self.config.tracking_uri)
             self.client = self.client_factory(tracking_uri=self.config.tracking_uri)
-            self.client.search_experiments()  # Trigger connection attempt
+            self.cached_client = None
+            self._probe()
             self.is_connected_flag = True
+            self.last_health_check = time.monotonic()
             logger.debug(f"Successfully connected to MLflow Tracking Server at {self.config.tracking_uri}")
             return True, f"Successfully connected to MLflow Tracking Server at {self.config.tracking_uri}"
         except Exception as e:
             self.is_connected_flag = False
+            self.last_health_check = time.monotonic()
             logger.exception(f"Failed to connect to MLflow Tracking Server: {e}")
             return False, f"Failed to connect to MLflow Tracking Server: {e!s}"
 
+    def _probe(self) -> None:
+        """Send a minimal request to the tracking server, raising if it fails.
+
+        Tracking servers are probed through the non-retrying probe session with
+        a short timeout, so a dead or hung server fails the probe at once rather
+        than after the MLflow client's retries. File and database stores are
+        queried through the client.
+        """
+        if self.config.connection_type != REMOTE_CONNECTION:
+            self.client.search_experiments(max_results=1)
+            return
+
+        headers, auth = get_mlflow_auth()
+        insecure = os.environ.get(MLFLOW_TRACKING_INSECURE_TLS_ENV, "").lower() == "true"
+        response = get_probe_session().get(
+            self.config.tracking_uri.rstrip("/") + MLFLOW_REST_API_PREFIX + "/experiments/search",
+            params={"max_results": 1},
+            headers=headers,
+            auth=auth,
+            verify=not insecure,
+            timeout=HEALTH_PROBE_TIMEOUT,
+        )
+        response.raise_for_status()
+
+    def check_health(self, force: bool = False) -> bool:
+        """Check that the tracking server still answers.
+
+        The result is cached for ``health_check_ttl`` seconds, so frequent calls
+        only reach the server once per interval.
+
+        Args:
+            force: Probe the server even if a recent result is cached.
+
+        Returns:
+            bool: True if the server answered the probe, False otherwise.
+
+        """
+        if self.client is None:
+            return False
+
+        now = time.monotonic()
+        if (
+            not force
+            and self.last_health_check is not None
+            and now - self.last_health_check < self.health_check_ttl
+        ):
+            return self.is_connected_flag
+
+        try:
+            self._probe()
+            self.is_connected_flag = True
+        except Exception as e:
+            logger.warning(f"MLflow Tracking Server health check failed: {e}")
+            self.is_connected_flag = False
+        self.last_health_check = now
+        return self.is_connected_flag
+
+    def reconnect(
+        self,
+        max_attempts: int = RECONNECT_MAX_ATTEMPTS,
+        base_delay: float = RECONNECT_BASE_DELAY,
+        max_delay: float = RECONNECT_MAX_DELAY,
+    ) -> tuple[bool, str]:
+        """Reconnect to MLflow Tracking Server, retrying with exponential backoff.
+
+        Args:
+            max_attempts: Maximum number of connection attempts.
+            base_delay: Delay before the second attempt, in seconds. It doubles
+                after every failed attempt.
+            max_delay: Upper bound of the delay between attempts, in seconds.
+
+        Returns:
+            Tuple[bool, str]: (success, message) of the last attempt
+
+        """
+        success, message = False, "No connection attempt made"
+        for attempt in range(max_attempts):
+            if attempt:
+                delay = min(base_delay * 2 ** (attempt - 1), max_delay)
+                logger.debug(f"Reconnecting to MLflow Tracking Server in {delay:.1f}s")
+                time.sleep(delay)
+            success, message = self.connect()
+            if success:
+                break
+        return success, message
+
+    def ensure_connected(self) -> tuple[bool, str]:
+        """Check the connection, reconnecting with backoff if the server stopped answering.
+
+        Concurrent callers finding the connection down share one reconnection:
+        those arriving while it runs wait for its outcome instead of starting
+        their own attempts. No lock outside the connection is held meanwhile.
+
+        Returns:
+            Tuple[bool, str]: (success, message)
+
+        """
+        if self.is_connected():
+            return True, f"Connected to MLflow Tracking Server at {self.config.tracking_uri}"
+
+        reconnect_count = self.reconnect_count
+        with self.reconnect_lock:
+            if self.reconnect_count != reconnect_count:
+                # Another caller reconnected while this one was waiting
+                return self.reconnect_result
+            self.reconnect_result = self.reconnect()
+            self.reconnect_count += 1
+            return self.reconnect_result
+
+    def report_error(self, error: Exception) -> None:
+        """Record that a client call failed, so the next use checks the connection.
+
+        Network failures mark the connection unhealthy, so it is reconnected on
+        next use. Other errors, e.g. a missing run, only expire the cached health
+        check, so the server is probed again before being trusted.
+
+        Args:
+            error: The exception raised by the client call.
+
+        """
+        if is_network_error(error):
+            logger.warning(f"MLflow Tracking Server unreachable: {error}")
+            self.is_connected_flag = False
+            self.last_health_check = time.monotonic()
+        else:
+            self.last_health_check = None
+
     def get_client(self) -> MlflowClient:
         """Get MLflow client instance.
 
@@ -92,15 +534,133 @@ class MLflowConnection:
             raise MLflowConnectionError(msg)
         return self.client
 
+    def get_cached_client(self) -> CachedMlflowClient:
+        """Get a caching wrapper around the MLflow client.
+
+        The wrapper is created on first use and shared by later calls, so its
+        cache lives as long as the connection. Failed calls are reported to
+        report_error.
+
+        Returns
+        -------
+            CachedMlflowClient: Caching wrapper around the MLflow client instance.
+
+        Raises
+        ------
+            MLflowConnectionError: If not connected to MLflow Tracking Server.
+
+        """
+        if self.cached_client is None:
+            self.cached_client = CachedMlflowClient(
+                self.get_client(), on_error=self.report_error,
+            )
+        return self.cached_client
+
+    def get_http_session(self) -> requests.Session:
+        """Get the pooled HTTP session for requests outside the MLflow client.
+
+        Returns
+        -------
+            requests.Session: The session shared by all HTTP probes of the process.
+
+        """
+        return get_http_session()
+
+    def get_pool_stats(self) -> list[dict[str, Any]]:
+        """Get statistics of the pooled HTTP session.
+
+        Returns
+        -------
+            List[Dict[str, Any]]: Connections opened, requests sent and idle
+            connections per host.
+
+        """
+        return get_pool_stats(self.get_http_session())
+
+    def supports_async(self) -> bool:
+        """Check whether the tracking server can be queried with the async REST client.
+
+        Returns
+        -------
+            bool: True for HTTP(S) tracking servers, False for local and database stores.
+
+        """
+        return self.config.connection_type == REMOTE_CONNECTION
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the event loop of the async client, starting it on first use."""
+        with self.event_loop_lock:
+            if self.event_loop is None:
+                self.event_loop = asyncio.new_event_loop()
+                self.event_loop_thread = threading.Thread(
+                    target=self.event_loop.run_forever,
+                    name="mlflow-async-client",
+                    daemon=True,
+                )
+                self.event_loop_thread.start()
+            return self.event_loop
+
+    async def _run_with_async_client(
+        self, query: Callable[[AsyncMLflowClient], Awaitable[T]],
+    ) -> T:
+        """Run a query with the async client, creating the client on first use."""
+        if self.async_client is None:
+            self.async_client = AsyncMLflowClient(self.config.tracking_uri)
+        return await query(self.async_client)
+
+    def run_async(self, query: Callable[[AsyncMLflowClient], Awaitable[T]]) -> T:
+        """Run a query with the async REST client and wait for its result.
+
+        Queries run on an event loop owned by the connection, in a background
+        thread, so one async client and its connection pool serve every query,
+        whatever thread or event loop the caller runs in.
+
+        Args:
+            query: Function receiving the async client and returning the
+                coroutine to run, e.g. ``lambda client: client.get_runs(ids)``.
+
+        Returns:
+            The result of the query.
+
+        Raises:
+            MLflowConnectionError: If the tracking URI is not an HTTP(S) URI.
+
+        """
+        loop = self._get_event_loop()
+        try:
+            return asyncio.run_coroutine_threadsafe(
+                self._run_with_async_client(query), loop,
+            ).result()
+        except Exception as e:
+            self.report_error(e)
+            raise
+
+    def close(self) -> None:
+        """Close the async client and stop its event loop."""
+        with self.event_loop_lock:
+            loop, thread = self.event_loop, self.event_loop_thread
+            self.event_loop = self.event_loop_thread = None
+        if loop is None:
+            return
+        if self.async_client is not None:
+            asyncio.run_coroutine_threadsafe(self.async_client.aclose(), loop).result()
+            self.async_client = None
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
     def is_connected(self) -> bool:
         """Check if connected to MLflow Tracking Server.
 
+        The server is probed again once the last health check is older than
+        ``health_check_ttl`` seconds.
+
         Returns
         -------
             bool: True if connected, False otherwise.
 
         """
-        return self.is_connected_flag
+        return self.check_health()
 
     def get_connection_info(self) -> dict[str, Any]:
         """Get connection information.
@@ -114,4 +674,5 @@ class MLflowConnection:
             "tracking_uri": self.config.tracking_uri,
             "connection_type": self.config.connection_type,
             "is_connected": self.is_connected_flag,
+            "http_pool": self.get_pool_stats(),
         }
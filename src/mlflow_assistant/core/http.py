@@ -0,0 +1,200 @@
+"""Pooled HTTP sessions for MLflow Assistant.
+
+Every HTTP call made by the assistant goes through one shared ``requests``
+session whose adapters keep connections alive and retry transient failures, so
+repeated calls to the same server reuse a connection instead of paying a new TCP
+and TLS handshake each time. The MLflow client keeps its own sessions, which are
+tuned with the same settings through MLflow's environment variables.
+"""
+import logging
+import os
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from mlflow_assistant.utils.config import get_http_pool_config
+from mlflow_assistant.utils.definitions import (
+    HTTP_RETRY_STATUS_CODES,
+    MLFLOW_HTTP_POOL_CONNECTIONS_ENV,
+    MLFLOW_HTTP_POOL_MAXSIZE_ENV,
+    MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR_ENV,
+    MLFLOW_HTTP_REQUEST_MAX_RETRIES_ENV,
+    MLFLOW_TRACKING_PASSWORD_ENV,
+    MLFLOW_TRACKING_TOKEN_ENV,
+    MLFLOW_TRACKING_USERNAME_ENV,
+    HttpPoolConfig,
+)
+
+logger = logging.getLogger("mlflow_assistant.core.http")
+
+_http_session = None
+_probe_session = None
+_http_session_lock = threading.Lock()
+
+
+def create_http_session(config: HttpPoolConfig) -> requests.Session:
+    """Create a session with pooled, retrying HTTP and HTTPS adapters.
+
+    Args:
+        config: Pool size, keep-alive and retry settings.
+
+    Returns:
+        requests.Session: The configured session.
+
+    """
+    retry = Retry(
+        total=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_probe_session(session: requests.Session) -> requests.Session:
+    """Create a session that never retries, sharing the connection pools of another.
+
+    Probes that check whether a server is up must fail fast: retrying a refused
+    connection with backoff only delays the answer.
+
+    Args:
+        session: The session whose connection pools are reused.
+
+    Returns:
+        requests.Session: The non-retrying session.
+
+    """
+    probe_session = requests.Session()
+    probe_adapters = {}
+    for prefix, adapter in session.adapters.items():
+        if id(adapter) not in probe_adapters:
+            probe_adapter = HTTPAdapter(max_retries=0)
+            probe_adapter.poolmanager = adapter.poolmanager
+            probe_adapters[id(adapter)] = probe_adapter
+        probe_session.mount(prefix, probe_adapters[id(adapter)])
+    return probe_session
+
+
+def get_http_session() -> requests.Session:
+    """Get the HTTP session shared by the whole process.
+
+    The session is created on first use from the configured pool settings.
+
+    Returns:
+        requests.Session: The shared session.
+
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            config = get_http_pool_config()
+            logger.debug(f"Creating shared HTTP session with {config}")
+            _http_session = create_http_session(config)
+        return _http_session
+
+
+def get_probe_session() -> requests.Session:
+    """Get the non-retrying HTTP session used to check whether servers are up.
+
+    It shares the connection pools of the shared session.
+
+    Returns:
+        requests.Session: The shared probe session.
+
+    """
+    global _probe_session
+    session = get_http_session()
+    with _http_session_lock:
+        if _probe_session is None:
+            _probe_session = create_probe_session(session)
+        return _probe_session
+
+
+def reset_http_session() -> None:
+    """Close the shared HTTP sessions so the next use creates new ones."""
+    global _http_session, _probe_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+        _http_session = None
+        _probe_session = None
+
+
+def configure_mlflow_http(config: HttpPoolConfig) -> None:
+    """Apply the pool settings to the HTTP sessions of the MLflow client.
+
+    MLflow creates and caches its own sessions from environment variables, so
+    the settings are exported before the first request. Values already set in
+    the environment take precedence.
+
+    Args:
+        config: Pool size, keep-alive and retry settings.
+
+    """
+    os.environ.setdefault(MLFLOW_HTTP_POOL_CONNECTIONS_ENV, str(config.pool_connections))
+    os.environ.setdefault(MLFLOW_HTTP_POOL_MAXSIZE_ENV, str(config.pool_maxsize))
+    os.environ.setdefault(MLFLOW_HTTP_REQUEST_MAX_RETRIES_ENV, str(config.max_retries))
+    os.environ.setdefault(MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR_ENV, str(config.backoff_factor))
+
+
+def get_mlflow_auth() -> tuple[dict[str, str], tuple[str, str] | None]:
+    """Get the credentials for direct requests to the MLflow REST API.
+
+    The standard MLflow environment variables are used: a bearer token takes
+    precedence over a username and password.
+
+    Returns:
+        The headers to send, and the basic auth credentials or None.
+
+    """
+    if token := os.environ.get(MLFLOW_TRACKING_TOKEN_ENV):
+        return {"Authorization": f"Bearer {token}"}, None
+    if username := os.environ.get(MLFLOW_TRACKING_USERNAME_ENV):
+        return {}, (username, os.environ.get(MLFLOW_TRACKING_PASSWORD_ENV, ""))
+    return {}, None
+
+
+def get_pool_stats(session: requests.Session) -> list[dict[str, Any]]:
+    """Describe the connection pools of a session.
+
+    Args:
+        session: The session to inspect.
+
+    Returns:
+        One entry per host with the number of connections opened, requests sent
+        and idle keep-alive connections currently available for reuse.
+
+    """
+    stats = []
+    adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+    for adapter in adapters.values():
+        if not isinstance(adapter, HTTPAdapter):
+            continue
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():  # noqa: SIM118
+            pool = pools.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            # Free slots are queued as None until a connection is returned
+            idle = sum(conn is not None for conn in list(pool.pool.queue))
+            stats.append({
+                "scheme": pool.scheme,
+                "host": pool.host,
+                "port": pool.port,
+                "connections_opened": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle_connections": idle,
+                "max_size": pool.pool.maxsize,
+            })
+    return stats
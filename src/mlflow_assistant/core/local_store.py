@@ -0,0 +1,274 @@
+"""Fast read-only access to local MLflow file stores.
+
+For a local ``mlruns`` directory, the generic MLflow client builds full entities
+for every run it touches. For aggregate questions over tens of thousands of
+runs, this reader lists directories with ``os.scandir`` and parses ``meta.yaml``
+files concurrently with the LibYAML loader when available. Metric files are
+scanned line by line without building entities: the latest value is the one at
+the highest step, and steps can be logged out of order, so reading only the
+last line would be wrong. Its listing methods mirror the metadata snapshot, so
+tools can use either.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlparse
+
+import yaml
+from mlflow.entities import LifecycleStage, RunStatus
+from mlflow.utils.file_utils import local_file_uri_to_path
+
+from mlflow_assistant.utils.definitions import LOCAL_STORE_MAX_WORKERS
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # LibYAML is not available
+    from yaml import SafeLoader as YamlLoader
+
+META_FILE = "meta.yaml"
+TRASH_FOLDER = ".trash"
+MODELS_FOLDER = "models"
+METRICS_FOLDER = "metrics"
+EXPERIMENT_TAGS_FOLDER = "tags"
+RESERVED_EXPERIMENT_FOLDERS = frozenset({EXPERIMENT_TAGS_FOLDER, "datasets"})
+
+
+class LocalFileStore:
+    """Read-only view of a local MLflow file store (``mlruns`` directory)."""
+
+    def __init__(self, root: str | Path, max_workers: int = LOCAL_STORE_MAX_WORKERS):
+        """Initialize the reader.
+
+        Args:
+            root: The ``mlruns`` directory.
+            max_workers: Maximum number of files read concurrently.
+
+        """
+        self.root = Path(root)
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_tracking_uri(cls, tracking_uri: str) -> "LocalFileStore | None":
+        """Create a reader if a tracking URI points to a local file store.
+
+        Args:
+            tracking_uri: A tracking URI, e.g. ``./mlruns`` or ``file:///data/mlruns``.
+
+        Returns:
+            The reader, or None for database, remote or missing stores.
+
+        """
+        if urlparse(tracking_uri).scheme not in {"", "file"}:
+            return None
+        root = Path(local_file_uri_to_path(tracking_uri))
+        return cls(root) if root.is_dir() else None
+
+    @staticmethod
+    def _subdirs(directory: str | Path, exclude: frozenset[str] = frozenset()) -> list[str]:
+        """List the subdirectories of a directory with a single scandir call."""
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.name not in exclude and entry.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _read_meta(directory: str) -> dict[str, Any] | None:
+        """Parse the meta.yaml file of a directory, or return None if unreadable."""
+        try:
+            with open(os.path.join(directory, META_FILE), "rb") as file:
+                meta = yaml.load(file, Loader=YamlLoader)
+        except (OSError, yaml.YAMLError):
+            return None
+        if not isinstance(meta, dict):
+            return None
+        meta["path"] = directory
+        return meta
+
+    def _read_metas(self, directories: list[str]) -> list[dict[str, Any]]:
+        """Parse the meta.yaml files of many directories concurrently."""
+        if not directories:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            metas = executor.map(self._read_meta, directories)
+            return [meta for meta in metas if meta is not None]
+
+    @staticmethod
+    def _read_values(directory: str) -> dict[str, str]:
+        """Read a folder of tag or param files, keyed by their relative path."""
+        values = {}
+        for current, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(current, name)
+                values[os.path.relpath(path, directory).replace(os.sep, "/")] = Path(path).read_text(encoding="utf-8")
+        return values
+
+    @staticmethod
+    def read_latest_value(path: str | Path) -> float | None:
+        """Read the latest value of a metric file, as MLflow defines it.
+
+        The latest value is the one logged at the highest step, ties broken by
+        the highest timestamp and then value, so steps logged out of order do
+        not change the result.
+
+        Args:
+            path: The metric file to read.
+
+        Returns:
+            The latest value, or None for an empty file.
+
+        """
+        latest = None
+        with open(path, "rb") as file:
+            for line in file:
+                # Each line is "<timestamp> <value> [<step>]"
+                fields = line.split()
+                if len(fields) < 2:
+                    continue
+                step = int(fields[2]) if len(fields) > 2 else 0
+                key = (step, int(fields[0]), float(fields[1]))
+                if latest is None or key > latest:
+                    latest = key
+        return None if latest is None else latest[2]
+
+    def _experiments(self) -> list[dict[str, Any]]:
+        """Parse the metadata of all active experiments."""
+        directories = self._subdirs(self.root, frozenset({TRASH_FOLDER, MODELS_FOLDER}))
+        experiments = []
+        for meta in self._read_metas(directories):
+            if meta.get("lifecycle_stage", LifecycleStage.ACTIVE) != LifecycleStage.ACTIVE:
+                continue
+            meta["experiment_id"] = str(meta.get("experiment_id", os.path.basename(meta["path"])))
+            experiments.append(meta)
+        return experiments
+
+    def _runs(self, experiment_paths: list[str]) -> list[dict[str, Any]]:
+        """Parse the metadata of the active runs of several experiments."""
+        directories = [
+            run_dir
+            for experiment_path in experiment_paths
+            for run_dir in self._subdirs(experiment_path, RESERVED_EXPERIMENT_FOLDERS)
+        ]
+        runs = []
+        for meta in self._read_metas(directories):
+            if meta.get("lifecycle_stage", LifecycleStage.ACTIVE) != LifecycleStage.ACTIVE:
+                continue
+            meta["status"] = RunStatus.to_string(meta.get("status", RunStatus.RUNNING))
+            runs.append(meta)
+        return runs
+
+    def list_experiments(
+        self, name_contains: str = "", max_results: int | None = None, offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List active experiments with their run counts.
+
+        Args:
+            name_contains: Optional case-insensitive name filter.
+            max_results: Maximum number of experiments to return.
+            offset: Number of matching experiments to skip.
+
+        Returns:
+            List[Dict[str, Any]]: Experiment rows, including a run_count.
+
+        """
+        needle = name_contains.lower()
+        experiments = [
+            exp for exp in self._experiments() if needle in str(exp.get("name", "")).lower()
+        ]
+        experiments.sort(key=lambda exp: exp.get("last_update_time") or 0, reverse=True)
+        end = None if max_results is None else offset + max_results
+        page = experiments[offset:end]
+
+        # Only the runs of the returned experiments are read
+        run_counts = {exp["experiment_id"]: 0 for exp in page}
+        for run in self._runs([exp["path"] for exp in page]):
+            experiment_id = str(run.get("experiment_id"))
+            if experiment_id in run_counts:
+                run_counts[experiment_id] += 1
+
+        return [
+            {
+                "experiment_id": exp["experiment_id"],
+                "name": exp.get("name"),
+                "artifact_location": exp.get("artifact_location"),
+                "lifecycle_stage": exp.get("lifecycle_stage", LifecycleStage.ACTIVE),
+                "creation_time": exp.get("creation_time"),
+                "last_update_time": exp.get("last_update_time"),
+                "tags": self._read_values(os.path.join(exp["path"], EXPERIMENT_TAGS_FOLDER)),
+                "run_count": run_counts[exp["experiment_id"]],
+            }
+            for exp in page
+        ]
+
+    def get_counts(self) -> dict[str, int]:
+        """Get the number of active experiments, models and running runs.
+
+        Returns:
+            Dict[str, int]: experiment_count, model_count and active_runs.
+
+        """
+        experiments = self._experiments()
+        runs = self._runs([exp["path"] for exp in experiments])
+        return {
+            "experiment_count": len(experiments),
+            "model_count": len(self._subdirs(self.root / MODELS_FOLDER)),
+            "active_runs": sum(run["status"] == "RUNNING" for run in runs),
+        }
+
+    def latest_metrics(self, run_path: str | Path) -> dict[str, float]:
+        """Read the latest value of every metric of a run.
+
+        Args:
+            run_path: The run directory.
+
+        Returns:
+            Dict[str, float]: Metric values by metric key.
+
+        """
+        metrics_dir = os.path.join(run_path, METRICS_FOLDER)
+        metrics = {}
+        for current, _, files in os.walk(metrics_dir):
+            for name in files:
+                path = os.path.join(current, name)
+                value = self.read_latest_value(path)
+                if value is not None:
+                    metrics[os.path.relpath(path, metrics_dir).replace(os.sep, "/")] = value
+        return metrics
+
+    def get_runs(self, run_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the metadata and latest metrics of runs, without knowing their experiments.
+
+        Args:
+            run_ids: The run IDs.
+
+        Returns:
+            Run metadata, with a ``metrics`` entry, by run ID. Like
+            ``MlflowClient.get_run``, deleted runs are included; missing runs are
+            left out.
+
+        """
+        # Run IDs are hex strings; anything else cannot name a run directory
+        wanted = {run_id for run_id in run_ids if run_id.isalnum()}
+        experiment_paths = self._subdirs(self.root, frozenset({TRASH_FOLDER, MODELS_FOLDER}))
+        directories = [
+            os.path.join(experiment_path, run_id)
+            for experiment_path in experiment_paths
+            for run_id in wanted
+            if os.path.isdir(os.path.join(experiment_path, run_id))
+        ]
+
+        runs = {}
+        for meta in self._read_metas(directories):
+            meta["status"] = RunStatus.to_string(meta.get("status", RunStatus.RUNNING))
+            runs[meta.get("run_id", os.path.basename(meta["path"]))] = meta
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            metrics = executor.map(self.latest_metrics, [run["path"] for run in runs.values()])
+            for run, run_metrics in zip(runs.values(), metrics, strict=True):
+                run["metrics"] = run_metrics
+        return runs
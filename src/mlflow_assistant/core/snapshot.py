@@ -0,0 +1,516 @@
+"""Local SQLite snapshot of MLflow metadata.
+
+This module mirrors experiments, runs (params, latest metrics and tags) and
+registered models from an MLflow Tracking Server into a local SQLite file. The
+snapshot can be refreshed incrementally and queried locally, so tools can answer
+questions about large tracking servers without fanning out to the network.
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from mlflow.entities import ViewType
+from mlflow.tracking import MlflowClient
+
+from mlflow_assistant.utils.definitions import (
+    SNAPSHOT_EXPERIMENT_CHUNK_SIZE,
+    SNAPSHOT_PAGE_SIZE,
+    SNAPSHOT_RUN_ID_CHUNK_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS experiments (
+    experiment_id TEXT PRIMARY KEY,
+    name TEXT,
+    artifact_location TEXT,
+    lifecycle_stage TEXT,
+    creation_time INTEGER,
+    last_update_time INTEGER,
+    tags TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    experiment_id TEXT,
+    run_name TEXT,
+    status TEXT,
+    lifecycle_stage TEXT,
+    start_time INTEGER,
+    end_time INTEGER,
+    params TEXT,
+    metrics TEXT,
+    tags TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_experiment_id ON runs (experiment_id);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status);
+CREATE TABLE IF NOT EXISTS registered_models (
+    name TEXT PRIMARY KEY,
+    creation_timestamp INTEGER,
+    last_updated_timestamp INTEGER,
+    description TEXT,
+    tags TEXT,
+    latest_versions TEXT
+);
+"""
+
+# Meta keys
+META_TRACKING_URI = "tracking_uri"
+META_REFRESHED_AT = "refreshed_at"
+META_EXPERIMENTS_WATERMARK = "experiments_watermark"
+META_MODELS_WATERMARK = "models_watermark"
+META_RUNS_WATERMARK = "runs_watermark"
+
+
+def _now_ms() -> int:
+    """Return the current time in milliseconds."""
+    return int(time.time() * 1000)
+
+
+def _iter_pages(search: Callable[..., Any], **kwargs: Any) -> Iterator[Any]:
+    """Iterate over every result of a paginated MLflow search."""
+    page_token = None
+    while True:
+        page = search(max_results=SNAPSHOT_PAGE_SIZE, page_token=page_token, **kwargs)
+        yield from page
+        page_token = page.token
+        if not page_token:
+            return
+
+
+def _tags(entity: Any) -> str:
+    """Serialize the tags of an MLflow entity to JSON."""
+    tags = getattr(entity, "tags", None) or {}
+    if isinstance(tags, dict):
+        return json.dumps(tags)
+    return json.dumps({tag.key: tag.value for tag in tags})
+
+
+def _contains_pattern(substring: str) -> str:
+    """Build a LIKE pattern, escaped with a backslash, matching values containing a substring."""
+    escaped = substring.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class MetadataSnapshot:
+    """Local SQLite mirror of MLflow Tracking Server metadata."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the snapshot.
+
+        Args:
+            path: Path of the SQLite file holding the snapshot.
+
+        """
+        self.path = Path(path)
+
+    @contextmanager
+    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
+        """Open a connection to the snapshot, committing on success."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.row_factory = sqlite3.Row
+        try:
+            connection.executescript(_SCHEMA)
+            yield connection
+            connection.commit()
+        finally:
+            connection.close()
+
+    def exists(self) -> bool:
+        """Check whether the snapshot file has been built."""
+        return self.path.exists()
+
+    def _get_meta(self, key: str) -> str | None:
+        """Read a value from the meta table."""
+        if not self.exists():
+            return None
+        with self._connect() as connection:
+            row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    def age(self) -> float | None:
+        """Get the number of seconds since the snapshot was last refreshed.
+
+        Returns:
+            Optional[float]: Age in seconds, or None if never built.
+
+        """
+        refreshed_at = self._get_meta(META_REFRESHED_AT)
+        if refreshed_at is None:
+            return None
+        return (_now_ms() - int(refreshed_at)) / 1000.0
+
+    def is_fresh(self, tracking_uri: str | None, max_age: float) -> bool:
+        """Check whether the snapshot can be used to answer queries.
+
+        Args:
+            tracking_uri: Tracking URI the answer is expected for.
+            max_age: Maximum acceptable age in seconds.
+
+        Returns:
+            bool: True if the snapshot mirrors tracking_uri and is recent enough.
+
+        """
+        if self._get_meta(META_TRACKING_URI) != tracking_uri:
+            return False
+        age = self.age()
+        return age is not None and age <= max_age
+
+    def build(self, client: MlflowClient, tracking_uri: str) -> dict[str, int]:
+        """Build the snapshot from scratch.
+
+        Args:
+            client: MLflow client used to read metadata.
+            tracking_uri: Tracking URI the client is connected to.
+
+        Returns:
+            Dict[str, int]: Number of experiments, runs and models mirrored.
+
+        """
+        if self.exists():
+            self.path.unlink()
+        return self.refresh(client, tracking_uri)
+
+    def refresh(self, client: MlflowClient, tracking_uri: str) -> dict[str, int]:
+        """Incrementally refresh the snapshot.
+
+        Only experiments and registered models updated since the previous
+        refresh, and runs started, finished or still running since then, are
+        fetched. Deleted registered models are removed and run deletions are
+        applied. A snapshot of a different tracking URI is rebuilt from scratch.
+
+        Args:
+            client: MLflow client used to read metadata.
+            tracking_uri: Tracking URI the client is connected to.
+
+        Returns:
+            Dict[str, int]: Number of experiments, runs and models updated.
+
+        """
+        if self.exists() and self._get_meta(META_TRACKING_URI) != tracking_uri:
+            logger.info("Snapshot belongs to a different tracking URI, rebuilding")
+            self.path.unlink()
+
+        refresh_started = _now_ms()
+
+        with self._connect() as connection:
+            meta = {
+                row["key"]: row["value"]
+                for row in connection.execute("SELECT key, value FROM meta")
+            }
+            experiments_watermark = int(meta.get(META_EXPERIMENTS_WATERMARK, 0))
+            models_watermark = int(meta.get(META_MODELS_WATERMARK, 0))
+            runs_watermark = int(meta.get(META_RUNS_WATERMARK, 0))
+
+            updated_experiments, experiments_watermark = self._refresh_experiments(
+                connection, client, experiments_watermark,
+            )
+            updated_runs = self._refresh_runs(connection, client, runs_watermark)
+            updated_models, models_watermark = self._refresh_models(
+                connection, client, models_watermark,
+            )
+
+            connection.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [
+                    (META_TRACKING_URI, tracking_uri),
+                    (META_REFRESHED_AT, str(_now_ms())),
+                    (META_EXPERIMENTS_WATERMARK, str(experiments_watermark)),
+                    (META_MODELS_WATERMARK, str(models_watermark)),
+                    (META_RUNS_WATERMARK, str(refresh_started)),
+                ],
+            )
+
+        logger.debug(
+            f"Snapshot refreshed: {updated_experiments} experiments, "
+            f"{updated_runs} runs, {updated_models} models",
+        )
+        return {
+            "experiments": updated_experiments,
+            "runs": updated_runs,
+            "models": updated_models,
+        }
+
+    @staticmethod
+    def _refresh_experiments(
+        connection: sqlite3.Connection, client: MlflowClient, watermark: int,
+    ) -> tuple[int, int]:
+        """Mirror experiments updated after the watermark."""
+        filter_string = f"last_update_time > {watermark}" if watermark else None
+        rows = []
+        for exp in _iter_pages(
+            client.search_experiments,
+            view_type=ViewType.ALL,
+            filter_string=filter_string,
+        ):
+            last_update_time = getattr(exp, "last_update_time", None) or 0
+            watermark = max(watermark, last_update_time)
+            rows.append((
+                exp.experiment_id,
+                exp.name,
+                exp.artifact_location,
+                exp.lifecycle_stage,
+                getattr(exp, "creation_time", None),
+                last_update_time,
+                _tags(exp),
+            ))
+        connection.executemany(
+            "INSERT OR REPLACE INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?)", rows,
+        )
+        return len(rows), watermark
+
+    @staticmethod
+    def _run_row(run: Any) -> tuple[Any, ...]:
+        """Convert a run into a row of the runs table."""
+        return (
+            run.info.run_id,
+            run.info.experiment_id,
+            run.info.run_name,
+            run.info.status,
+            run.info.lifecycle_stage,
+            run.info.start_time,
+            run.info.end_time,
+            json.dumps(run.data.params),
+            json.dumps(run.data.metrics),
+            json.dumps(run.data.tags),
+        )
+
+    @staticmethod
+    def _refresh_runs(
+        connection: sqlite3.Connection, client: MlflowClient, watermark: int,
+    ) -> int:
+        """Mirror runs started, finished or running since the watermark."""
+        experiment_ids = [
+            row["experiment_id"]
+            for row in connection.execute("SELECT experiment_id FROM experiments")
+        ]
+        if watermark:
+            # MLflow filters cannot be OR-ed, so each change kind is a query
+            filters = [
+                f"attributes.start_time > {watermark}",
+                f"attributes.end_time > {watermark}",
+                "attributes.status = 'RUNNING'",
+            ]
+        else:
+            filters = [None]
+
+        rows = {}
+        for start in range(0, len(experiment_ids), SNAPSHOT_EXPERIMENT_CHUNK_SIZE):
+            chunk = experiment_ids[start:start + SNAPSHOT_EXPERIMENT_CHUNK_SIZE]
+            for filter_string in filters:
+                for run in _iter_pages(
+                    client.search_runs,
+                    experiment_ids=chunk,
+                    filter_string=filter_string or "",
+                    run_view_type=ViewType.ALL,
+                ):
+                    rows[run.info.run_id] = MetadataSnapshot._run_row(run)
+        connection.executemany(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows.values(),
+        )
+        if not watermark:
+            return len(rows)
+        return len(rows) + MetadataSnapshot._reconcile_deleted_runs(
+            connection, client, experiment_ids,
+        )
+
+    @staticmethod
+    def _reconcile_deleted_runs(
+        connection: sqlite3.Connection, client: MlflowClient, experiment_ids: list[str],
+    ) -> int:
+        """Apply run deletions, restorations and purges since the last refresh.
+
+        Deleting or restoring a run does not change its start or end time, so
+        the incremental queries miss it. The deleted runs, usually few, are
+        listed instead and compared with the runs the snapshot holds as deleted.
+        """
+        deleted = set()
+        for start in range(0, len(experiment_ids), SNAPSHOT_EXPERIMENT_CHUNK_SIZE):
+            deleted.update(
+                run.info.run_id
+                for run in _iter_pages(
+                    client.search_runs,
+                    experiment_ids=experiment_ids[start:start + SNAPSHOT_EXPERIMENT_CHUNK_SIZE],
+                    filter_string="",
+                    run_view_type=ViewType.DELETED_ONLY,
+                )
+            )
+        known = {
+            row["run_id"]: row["lifecycle_stage"]
+            for row in connection.execute("SELECT run_id, lifecycle_stage FROM runs")
+        }
+        newly_deleted = [
+            run_id for run_id in deleted if known.get(run_id, "deleted") != "deleted"
+        ]
+        connection.executemany(
+            "UPDATE runs SET lifecycle_stage = 'deleted' WHERE run_id = ?",
+            [(run_id,) for run_id in newly_deleted],
+        )
+
+        # Runs no longer deleted on the server were either restored or purged
+        undeleted = [
+            run_id
+            for run_id, stage in known.items()
+            if stage == "deleted" and run_id not in deleted
+        ]
+        restored = {}
+        for start in range(0, len(undeleted), SNAPSHOT_RUN_ID_CHUNK_SIZE):
+            quoted = ", ".join(
+                f"'{run_id}'" for run_id in undeleted[start:start + SNAPSHOT_RUN_ID_CHUNK_SIZE]
+            )
+            for run in _iter_pages(
+                client.search_runs,
+                experiment_ids=experiment_ids,
+                filter_string=f"attributes.run_id IN ({quoted})",
+                run_view_type=ViewType.ACTIVE_ONLY,
+            ):
+                restored[run.info.run_id] = MetadataSnapshot._run_row(run)
+        connection.executemany(
+            "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            restored.values(),
+        )
+        purged = [(run_id,) for run_id in undeleted if run_id not in restored]
+        connection.executemany("DELETE FROM runs WHERE run_id = ?", purged)
+        return len(newly_deleted) + len(undeleted)
+
+    @staticmethod
+    def _refresh_models(
+        connection: sqlite3.Connection, client: MlflowClient, watermark: int,
+    ) -> tuple[int, int]:
+        """Mirror registered models updated after the watermark."""
+        new_watermark = watermark
+        rows = []
+        names = set()
+        # Registered model filters do not support timestamps, so every model is
+        # listed, which also reveals the models deleted since the last refresh
+        for model in _iter_pages(client.search_registered_models):
+            names.add(model.name)
+            last_updated = model.last_updated_timestamp or 0
+            if watermark and last_updated <= watermark:
+                continue
+            new_watermark = max(new_watermark, last_updated)
+            latest_versions = [
+                {
+                    "version": version.version,
+                    "status": version.status,
+                    "stage": version.current_stage,
+                    "creation_timestamp": version.creation_timestamp,
+                    "run_id": version.run_id,
+                }
+                for version in model.latest_versions or []
+            ]
+            rows.append((
+                model.name,
+                model.creation_timestamp,
+                last_updated,
+                model.description or "",
+                _tags(model),
+                json.dumps(latest_versions),
+            ))
+        connection.executemany(
+            "INSERT OR REPLACE INTO registered_models VALUES (?, ?, ?, ?, ?, ?)", rows,
+        )
+        deleted = [
+            (row["name"],)
+            for row in connection.execute("SELECT name FROM registered_models")
+            if row["name"] not in names
+        ]
+        connection.executemany("DELETE FROM registered_models WHERE name = ?", deleted)
+        return len(rows) + len(deleted), new_watermark
+
+    def list_experiments(
+        self, name_contains: str = "", max_results: int | None = None, offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List active experiments with their run counts.
+
+        Args:
+            name_contains: Optional case-insensitive name filter.
+            max_results: Maximum number of experiments to return.
+            offset: Number of matching experiments to skip.
+
+        Returns:
+            List[Dict[str, Any]]: Experiment rows, including a run_count.
+
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT e.*, (
+                    SELECT COUNT(*) FROM runs r
+                    WHERE r.experiment_id = e.experiment_id AND r.lifecycle_stage = 'active'
+                ) AS run_count
+                FROM experiments e
+                WHERE e.lifecycle_stage = 'active' AND e.name LIKE ? ESCAPE '\\'
+                ORDER BY e.last_update_time DESC
+                LIMIT ? OFFSET ?
+                """,
+                (_contains_pattern(name_contains), -1 if max_results is None else max_results, offset),
+            ).fetchall()
+        return [{**dict(row), "tags": json.loads(row["tags"])} for row in rows]
+
+    def list_models(
+        self, name_contains: str = "", max_results: int | None = None, offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """List registered models.
+
+        Args:
+            name_contains: Optional case-insensitive name filter.
+            max_results: Maximum number of models to return.
+            offset: Number of matching models to skip.
+
+        Returns:
+            List[Dict[str, Any]]: Registered model rows.
+
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                """
+                SELECT * FROM registered_models
+                WHERE name LIKE ? ESCAPE '\\'
+                ORDER BY name
+                LIMIT ? OFFSET ?
+                """,
+                (_contains_pattern(name_contains), -1 if max_results is None else max_results, offset),
+            ).fetchall()
+        return [
+            {
+                **dict(row),
+                "tags": json.loads(row["tags"]),
+                "latest_versions": json.loads(row["latest_versions"]),
+            }
+            for row in rows
+        ]
+
+    def get_counts(self) -> dict[str, int]:
+        """Get the number of active experiments, models and running runs.
+
+        Returns:
+            Dict[str, int]: experiment_count, model_count and active_runs.
+
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM experiments WHERE lifecycle_stage = 'active')
+                        AS experiment_count,
+                    (SELECT COUNT(*) FROM registered_models) AS model_count,
+                    (
+                        SELECT COUNT(*) FROM runs
+                        WHERE status = 'RUNNING' AND lifecycle_stage = 'active'
+                    ) AS active_runs
+                """,
+            ).fetchone()
+        return dict(row)
@@ -0,0 +1,128 @@
+"""Vectorized comparison of MLflow runs.
+
+Metrics of the compared runs are laid out as a runs x metrics NumPy matrix, so
+ranks, deltas and per-metric winners are computed with array operations and
+stay fast when comparing hundreds of runs.
+"""
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+
+from mlflow_assistant.engine.definitions import LOWER_IS_BETTER_HINTS
+
+
+@dataclass
+class MetricComparison:
+    """Aligned metric matrices for a set of runs.
+
+    Row ``i`` of every matrix corresponds to the ``i``-th compared run and column
+    ``j`` to ``metric_names[j]``. Missing metrics are NaN.
+    """
+
+    metric_names: list[str]
+    lower_is_better: np.ndarray
+    values: np.ndarray
+    ranks: np.ndarray
+    deltas: np.ndarray
+    winners: list[int | None]
+    mean_ranks: np.ndarray
+
+
+def is_lower_better(metric_name: str, lower_is_better: Iterable[str] = ()) -> bool:
+    """Decide whether lower values of a metric are better.
+
+    Args:
+        metric_name: The metric name.
+        lower_is_better: Metric names explicitly known to be minimized.
+
+    Returns:
+        True if the metric is listed, or its name looks like a loss or error.
+
+    """
+    if metric_name in set(lower_is_better):
+        return True
+    name = metric_name.lower()
+    return any(hint in name for hint in LOWER_IS_BETTER_HINTS)
+
+
+def compare_metrics(
+    metrics: list[dict[str, float]], lower_is_better: Iterable[str] = (),
+) -> MetricComparison:
+    """Compare the metrics of several runs.
+
+    Args:
+        metrics: Metrics of each run, as metric name to value.
+        lower_is_better: Metric names that are minimized, in addition to those
+            detected from their names.
+
+    Returns:
+        MetricComparison: Values, ranks (1 is best), deltas against the first
+        run, the winning run index per metric and each run's mean rank.
+
+    """
+    names = sorted(set().union(*metrics)) if metrics else []
+    columns = {name: j for j, name in enumerate(names)}
+
+    values = np.full((len(metrics), len(names)), np.nan)
+    for i, run_metrics in enumerate(metrics):
+        for name, value in run_metrics.items():
+            values[i, columns[name]] = value
+
+    lower = np.array([is_lower_better(name, lower_is_better) for name in names], dtype=bool)
+    missing = np.isnan(values)
+
+    # Orient every metric so that larger is better, with missing values last
+    scores = np.where(lower, -values, values)
+    scores[missing] = -np.inf
+
+    order = np.argsort(-scores, axis=0, kind="stable")
+    ranks = np.empty(values.shape)
+    ranks[order, np.arange(len(names))] = np.arange(1, len(metrics) + 1)[:, None]
+    ranks[missing] = np.nan
+
+    reported = ~missing.all(axis=0)
+    best = np.argmax(scores, axis=0) if metrics else np.array([], dtype=int)
+    winners = [int(i) if ok else None for i, ok in zip(best, reported, strict=True)]
+
+    deltas = values - values[0] if metrics else values
+
+    rank_counts = (~missing).sum(axis=1)
+    rank_sums = np.where(missing, 0, ranks).sum(axis=1)
+    mean_ranks = np.divide(
+        rank_sums,
+        rank_counts,
+        out=np.full(len(metrics), np.nan),
+        where=rank_counts > 0,
+    )
+
+    return MetricComparison(
+        metric_names=names,
+        lower_is_better=lower,
+        values=values,
+        ranks=ranks,
+        deltas=deltas,
+        winners=winners,
+        mean_ranks=mean_ranks,
+    )
+
+
+def differing_params(params: list[dict[str, str]]) -> list[str]:
+    """Find the params whose values are not identical across all runs.
+
+    Args:
+        params: Params of each run, as param name to value.
+
+    Returns:
+        Sorted names of params that differ, including params only some runs set.
+
+    """
+    if not params:
+        return []
+    names = sorted(set().union(*params))
+    table = np.array(
+        [[run_params.get(name) for name in names] for run_params in params],
+        dtype=object,
+    )
+    differs = (table != table[0]).any(axis=0)
+    return [name for name, changed in zip(names, differs, strict=True) if changed]
@@ -0,0 +1,215 @@
+"""Context-window budget of model calls.
+
+Tool outputs accumulate in the agent state, and a single large one (e.g. the
+details of a model with many versions) can push a prompt past the model's
+context window, making the call fail or slow. Before each call the prompt size
+is estimated and, when it exceeds the provider's budget, the largest tool
+outputs are re-encoded to fit, then the oldest turns are dropped. The state
+itself is not changed, only the messages sent to the model.
+"""
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from mlflow_assistant.engine.definitions import (
+    CHARS_PER_TOKEN,
+    CONTEXT_MESSAGE_OVERHEAD,
+    CONTEXT_MIN_TOOL_TOKENS,
+    CONTEXT_RESPONSE_RESERVE,
+    CONTEXT_TOKEN_BUDGETS,
+    CONTEXT_TOOL_OUTPUT_SHARE,
+    CONTEXT_TRUNCATION_NOTE,
+    DEFAULT_CONTEXT_TOKEN_BUDGET,
+    TOOL_TOKEN_BUDGET,
+)
+from mlflow_assistant.engine.encoder import encode_result, estimate_tokens
+from mlflow_assistant.utils.constants import CONFIG_KEY_CONTEXT_TOKEN_BUDGET, CONFIG_KEY_TYPE
+
+logger = logging.getLogger("mlflow_assistant.engine.context_budget")
+
+
+@dataclass
+class BudgetReport:
+    """How a prompt was fitted to its token budget."""
+
+    budget: int
+    tokens_before: int
+    tokens_after: int
+    trimmed_messages: int = 0
+    dropped_messages: int = 0
+
+    @property
+    def tokens_cut(self) -> int:
+        """Estimated tokens removed from the prompt."""
+        return self.tokens_before - self.tokens_after
+
+
+def context_budget(provider_config: dict[str, Any]) -> int:
+    """Get the token budget of the prompts sent to a provider.
+
+    Args:
+        provider_config: Provider configuration. A ``context_token_budget`` key
+            overrides the default of the provider type.
+
+    Returns:
+        int: The token budget.
+
+    """
+    configured = provider_config.get(CONFIG_KEY_CONTEXT_TOKEN_BUDGET)
+    if configured is not None:
+        return int(configured)
+    provider_type = str(provider_config.get(CONFIG_KEY_TYPE, "")).lower()
+    return CONTEXT_TOKEN_BUDGETS.get(provider_type, DEFAULT_CONTEXT_TOKEN_BUDGET)
+
+
+def prompt_budget(provider_config: dict[str, Any], tool_schema_tokens: int) -> int:
+    """Get the token budget of the messages of a prompt.
+
+    The bound tool schemas and a reserve for the answer are taken out of the
+    provider's context budget.
+
+    Args:
+        provider_config: Provider configuration.
+        tool_schema_tokens: Estimated tokens of the tool schemas bound to the model.
+
+    Returns:
+        int: The token budget of the messages.
+
+    """
+    return context_budget(provider_config) - tool_schema_tokens - CONTEXT_RESPONSE_RESERVE
+
+
+def tool_output_budget(provider_config: dict[str, Any], tool_schema_tokens: int) -> int:
+    """Get the token budget of each tool output for a provider.
+
+    A tool output may take CONTEXT_TOOL_OUTPUT_SHARE of the prompt budget, so it
+    fits in the prompt with the rest of the conversation instead of being cut
+    again before the model call. It is never above TOOL_TOKEN_BUDGET.
+
+    Args:
+        provider_config: Provider configuration.
+        tool_schema_tokens: Estimated tokens of the tool schemas bound to the model.
+
+    Returns:
+        int: The token budget of each tool output.
+
+    """
+    share = int(prompt_budget(provider_config, tool_schema_tokens) * CONTEXT_TOOL_OUTPUT_SHARE)
+    return max(CONTEXT_MIN_TOOL_TOKENS, min(TOOL_TOKEN_BUDGET, share))
+
+
+def _content_text(message: BaseMessage) -> str:
+    """Get the content of a message as text."""
+    if isinstance(message.content, str):
+        return message.content
+    return json.dumps(message.content, separators=(",", ":"), default=str)
+
+
+def estimate_message_tokens(message: BaseMessage) -> int:
+    """Estimate the tokens a message takes in a prompt, tool calls included."""
+    tokens = estimate_tokens(_content_text(message)) + CONTEXT_MESSAGE_OVERHEAD
+    if isinstance(message, AIMessage) and message.tool_calls:
+        tokens += estimate_tokens(json.dumps(message.tool_calls, default=str))
+    return tokens
+
+
+def shrink_tool_output(content: str, token_budget: int) -> str:
+    """Shrink a tool output to a token budget.
+
+    JSON outputs are re-encoded with the tool output encoder, which drops table
+    rows and notes the truncation. Other outputs are cut.
+
+    Args:
+        content: The tool output.
+        token_budget: Maximum estimated tokens of the result.
+
+    Returns:
+        str: The shrunk output.
+
+    """
+    try:
+        text = encode_result(json.loads(content), token_budget)
+    except ValueError:
+        text = content
+    if estimate_tokens(text) <= token_budget:
+        return text
+    chars = max(token_budget * CHARS_PER_TOKEN - len(CONTEXT_TRUNCATION_NOTE), 0)
+    return content[:chars] + CONTEXT_TRUNCATION_NOTE
+
+
+def _oldest_turn(messages: Sequence[BaseMessage]) -> slice | None:
+    """Find the oldest turn before the current one, leading system messages excluded."""
+    start = next(
+        (i for i, message in enumerate(messages) if not isinstance(message, SystemMessage)),
+        len(messages),
+    )
+    human = [i for i, message in enumerate(messages) if isinstance(message, HumanMessage)]
+    if not human or human[-1] <= start:
+        return None
+    end = next((i for i in human if i > start), human[-1])
+    return slice(start, end)
+
+
+def fit_to_budget(
+    messages: Sequence[BaseMessage], budget: int,
+) -> tuple[list[BaseMessage], BudgetReport]:
+    """Fit the messages of a prompt to a token budget.
+
+    The largest tool output is shrunk first, each time to what the budget still
+    requires but never below CONTEXT_MIN_TOOL_TOKENS. When tool outputs cannot
+    absorb the cut, whole turns before the current question are dropped, oldest
+    first. The current turn is always kept, so the result can still exceed the
+    budget.
+
+    Args:
+        messages: The prompt messages.
+        budget: Maximum estimated tokens of the prompt.
+
+    Returns:
+        Tuple of the fitted messages and a report of what was cut.
+
+    """
+    fitted = list(messages)
+    sizes = [estimate_message_tokens(message) for message in fitted]
+    report = BudgetReport(budget=budget, tokens_before=sum(sizes), tokens_after=sum(sizes))
+    # Tool outputs that cannot be shrunk any further
+    exhausted = set()
+
+    while sum(sizes) > budget:
+        candidates = [
+            i for i, message in enumerate(fitted)
+            if isinstance(message, ToolMessage) and i not in exhausted
+            and sizes[i] > CONTEXT_MIN_TOOL_TOKENS + CONTEXT_MESSAGE_OVERHEAD
+        ]
+        if not candidates:
+            break
+        largest = max(candidates, key=sizes.__getitem__)
+        target = max(sizes[largest] - (sum(sizes) - budget), CONTEXT_MIN_TOOL_TOKENS)
+        content = shrink_tool_output(
+            _content_text(fitted[largest]), target - CONTEXT_MESSAGE_OVERHEAD,
+        )
+        shrunk = fitted[largest].model_copy(update={"content": content})
+        size = estimate_message_tokens(shrunk)
+        exhausted.add(largest)
+        if size < sizes[largest]:
+            fitted[largest] = shrunk
+            sizes[largest] = size
+            report.trimmed_messages += 1
+
+    while sum(sizes) > budget and (turn := _oldest_turn(fitted)) is not None:
+        report.dropped_messages += turn.stop - turn.start
+        del fitted[turn]
+        del sizes[turn]
+
+    report.tokens_after = sum(sizes)
+    if report.tokens_cut:
+        logger.info(
+            f"Prompt cut from ~{report.tokens_before} to ~{report.tokens_after} tokens "
+            f"(budget {budget}): {report.trimmed_messages} tool outputs shrunk, "
+            f"{report.dropped_messages} messages dropped",
+        )
+    return fitted, report
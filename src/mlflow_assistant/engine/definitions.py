@@ -1,8 +1,148 @@
 """Constants for the MLflow Assistant engine."""
+from dataclasses import dataclass
+from pathlib import Path
+
 # State keys
 STATE_KEY_MESSAGES = "messages"
 STATE_KEY_PROVIDER_CONFIG = "provider_config"
+STATE_KEY_SUMMARY = "summary"
+STATE_KEY_CONTEXT_BUDGET = "context_budget"
+
+# Streamed query events
+EVENT_KEY_TYPE = "type"
+EVENT_TOKEN = "token"  # noqa: S105
+EVENT_TOOL_START = "tool_start"
+EVENT_TOOL_END = "tool_end"
+EVENT_RESULT = "result"
 
 TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 NA = "N/A"
 MLFLOW_MAX_RESULTS = 100
+MLFLOW_SEARCH_PAGE_SIZE = 1000
+
+# Conversation memory compaction
+MEMORY_MAX_TURNS = 6  # turns kept verbatim, older ones are summarized
+MEMORY_TOOL_OUTPUT_TURNS = 2  # turns whose tool outputs are kept in full
+MEMORY_SUMMARY_MAX_CHARS = 2000
+MEMORY_ELIDED_PREVIEW_CHARS = 200
+MEMORY_CHECKPOINTS_KEPT = 5  # checkpoints kept per conversation by the SQLite backend
+MEMORY_ELIDED_PREFIX = "[Elided output of an earlier turn]"
+MEMORY_SUMMARY_PROMPT = (
+    "Summarize this conversation between a user and an MLflow assistant. Keep "
+    "experiment, run and model names and ids, metric values and conclusions the "
+    "user may refer back to. Extend the current summary, answer in a few sentences."
+)
+
+# Compiled workflow cache
+WORKFLOW_CACHE_MAX_SIZE = 8
+
+# Tool call execution
+TOOL_MAX_CONCURRENCY = 4
+TOOL_CALL_TIMEOUT = 60.0  # seconds
+
+# Per-session tool call cache
+TOOL_CALL_CACHE_TTL = 60.0  # seconds
+TOOL_CALL_CACHE_MAX_SIZE = 256
+KEY_CACHE_HIT = "cache_hit"
+
+# Tool result pages
+TOOL_PAGE_SIZE = 50
+TOOL_MAX_PAGE_SIZE = 100
+
+# Tool output encoding
+TOOL_TOKEN_BUDGET = 4000  # upper bound; providers with small contexts get less
+CHARS_PER_TOKEN = 4
+KEY_COLUMNS = "columns"
+KEY_ROWS = "rows"
+KEY_OMITTED_ROWS = "omitted_rows"
+KEY_TRUNCATED = "truncated"
+KEY_NEXT_CURSOR = "next_cursor"
+KEY_NEXT_OFFSET = "next_offset"
+
+# Context window budget of each model call, by provider type
+CONTEXT_TOKEN_BUDGETS = {
+    "openai": 12000,
+    "ollama": 6000,
+    "databricks": 12000,
+}
+DEFAULT_CONTEXT_TOKEN_BUDGET = 8000
+CONTEXT_RESPONSE_RESERVE = 1000  # tokens left for the model's answer
+CONTEXT_TOOL_OUTPUT_SHARE = 0.5  # share of the prompt budget one tool output may take
+CONTEXT_MESSAGE_OVERHEAD = 4  # tokens of role and separators per message
+CONTEXT_MIN_TOOL_TOKENS = 200  # tool outputs are never cut below this
+CONTEXT_TRUNCATION_NOTE = " ...[cut to fit the context window]"
+
+# Run counting
+RUN_COUNT_PAGE_SIZE = 1000
+RUN_COUNT_MAX_WORKERS = 8
+RUN_COUNT_TIME_BUDGET = 30.0  # seconds
+SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE = 100  # experiment IDs per multi-experiment search_runs call
+ACTIVE_RUNS_FILTER = "attributes.status = 'RUNNING'"
+
+# Run fetching
+RUN_FETCH_MAX_WORKERS = 8
+MODEL_DETAILS_MAX_VERSIONS = 20
+
+# Run search
+SEARCH_RUNS_TOP_K = 10
+
+# Federated queries across tracking servers
+FEDERATION_SERVER_TIMEOUT = 20.0  # seconds
+FEDERATION_ENTITIES = ("experiments", "models", "runs")
+
+# Artifacts
+ARTIFACT_LIST_MAX_DEPTH = 3
+ARTIFACT_LIST_MAX_ENTRIES = 100
+ARTIFACT_LIST_ENTRY_LIMIT = 500
+ARTIFACT_PREVIEW_BYTES = 2048
+ARTIFACT_PREVIEW_MAX_BYTES = 16 * 1024
+ARTIFACT_HEX_PREVIEW_BYTES = 256
+ARTIFACT_DOWNLOAD_MAX_BYTES = 10 * 1024 * 1024
+
+# Metric history
+METRIC_HISTORY_MAX_POINTS = 100
+METRIC_HISTORY_POINT_LIMIT = 500
+
+# Run comparison
+COMPARE_RUNS_MAX = 500
+RUN_ID_FILTER_CHUNK_SIZE = 100
+LOWER_IS_BETTER_HINTS = (
+    "loss",
+    "error",
+    "err",
+    "rmse",
+    "mse",
+    "mae",
+    "mape",
+    "perplexity",
+    "latency",
+)
+
+
+@dataclass
+class RunCount:
+    """Result of counting the runs of a single experiment."""
+
+    count: int | None
+    exact: bool = True
+    error: str | None = None
+
+    def to_value(self) -> int | str:
+        """Return a JSON-friendly representation of the count."""
+        if self.error is not None:
+            return "Error getting count"
+        if self.count is None:
+            return "Unknown (time budget exceeded)"
+        if not self.exact:
+            return f"At least {self.count} (time budget exceeded)"
+        return self.count
+
+
+@dataclass(frozen=True)
+class ToolSettings:
+    """Tool settings read once from the configuration."""
+
+    tracking_uri: str | None
+    token_budget: int  # Per tool output, derived from the provider's context budget
+    snapshot_path: Path
+    snapshot_max_age: float
@@ -0,0 +1,94 @@
+"""Downsampling of long metric histories.
+
+Runs that log a metric every step can have hundreds of thousands of points. These
+functions select a fixed number of representative points so the model sees the
+shape of a curve without receiving the full series.
+"""
+from itertools import pairwise
+
+import numpy as np
+
+
+def lttb(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are always kept. The remaining points are split
+    into equal buckets and, from each bucket, the point forming the largest
+    triangle with the previously selected point and the next bucket's average
+    is kept.
+
+    Args:
+        x: Sorted x coordinates (e.g. steps).
+        y: y coordinates (e.g. metric values).
+        max_points: Number of points to keep.
+
+    Returns:
+        Sorted indices of the selected points.
+
+    """
+    n = len(x)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1][:max(max_points, 1)])
+
+    x = x.astype(float)
+    y = np.nan_to_num(y.astype(float))
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[end:edges[i + 2]].mean()
+            next_y = y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[n - 1], y[n - 1]
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a]),
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def min_max(y: np.ndarray, max_points: int) -> np.ndarray:
+    """Select the minimum and maximum point of equal-width buckets.
+
+    This keeps every spike and dip of the curve, at the cost of a less even
+    spacing than LTTB. The first and last points are always kept.
+
+    Args:
+        y: y coordinates (e.g. metric values).
+        max_points: Number of points to keep.
+
+    Returns:
+        Sorted indices of the selected points.
+
+    """
+    n = len(y)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        return np.array([0, n - 1][:max(max_points, 1)])
+
+    values = np.nan_to_num(y.astype(float))
+    # The endpoints are reserved; the other slots hold two points per bucket of
+    # the interior, or only its minimum for the last bucket of an odd budget
+    slots = max_points - 2
+    buckets = (slots + 1) // 2
+    edges = np.linspace(1, n - 1, buckets + 1).astype(int)
+    selected = [0, n - 1]
+    for i, (start, end) in enumerate(pairwise(edges)):
+        if end > start:
+            bucket = values[start:end]
+            selected.append(start + int(np.argmin(bucket)))
+            if 2 * i + 2 <= slots:
+                selected.append(start + int(np.argmax(bucket)))
+
+    return np.unique(selected)
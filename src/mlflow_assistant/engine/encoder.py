@@ -0,0 +1,140 @@
+"""Compact, token-budgeted serialization of tool outputs.
+
+Tool results are sent back to the model on every round trip, so their size
+directly drives prompt tokens, latency and cost. This encoder drops empty fields,
+turns lists of records into a header + rows table so keys are not repeated per
+row, emits JSON without whitespace, and truncates the largest tables to fit a
+token budget.
+"""
+import json
+import logging
+from typing import Any
+
+from mlflow_assistant.engine.definitions import (
+    CHARS_PER_TOKEN,
+    KEY_COLUMNS,
+    KEY_NEXT_CURSOR,
+    KEY_NEXT_OFFSET,
+    KEY_OMITTED_ROWS,
+    KEY_ROWS,
+    KEY_TRUNCATED,
+    TOOL_TOKEN_BUDGET,
+)
+
+logger = logging.getLogger("mlflow_assistant.engine.encoder")
+
+_EMPTY = (None, "", [], {})
+# Pagination keys whose null value tells the model there is nothing more to fetch
+_KEPT_WHEN_EMPTY = frozenset({KEY_NEXT_CURSOR, KEY_NEXT_OFFSET})
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in a string."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def compact(value: Any) -> Any:
+    """Drop empty fields and convert lists of records into tables.
+
+    A list whose items are all dicts becomes ``{"columns": [...], "rows": [...]}``,
+    with columns in order of first appearance and missing values as null.
+    Pagination keys such as ``next_cursor`` are kept even when null.
+
+    Args:
+        value: A JSON-serializable value.
+
+    Returns:
+        The compacted value.
+
+    """
+    if isinstance(value, dict):
+        compacted = {key: compact(item) for key, item in value.items()}
+        return {
+            key: item for key, item in compacted.items()
+            if key in _KEPT_WHEN_EMPTY or item not in _EMPTY
+        }
+
+    if isinstance(value, list | tuple):
+        items = [compact(item) for item in value]
+        if items and all(isinstance(item, dict) for item in items):
+            columns = list(dict.fromkeys(key for item in items for key in item))
+            return {
+                KEY_COLUMNS: columns,
+                KEY_ROWS: [[item.get(column) for column in columns] for item in items],
+            }
+        return items
+
+    return value
+
+
+def _tables(value: Any) -> list[dict[str, Any]]:
+    """Collect every table produced by compact, outermost first."""
+    tables = []
+    if isinstance(value, dict):
+        if KEY_COLUMNS in value and KEY_ROWS in value:
+            tables.append(value)
+        for item in value.values():
+            tables.extend(_tables(item))
+    elif isinstance(value, list):
+        for item in value:
+            tables.extend(_tables(item))
+    return tables
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value as JSON without whitespace."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def encode_result(result: Any, token_budget: int | None = TOOL_TOKEN_BUDGET) -> str:
+    """Encode a tool result compactly, truncating it to fit a token budget.
+
+    When the encoded result exceeds the budget, rows are removed from the end of
+    the largest tables, each shortened table records how many rows were omitted,
+    and a top-level note explains the truncation.
+
+    Args:
+        result: The JSON-serializable tool result.
+        token_budget: Maximum estimated tokens of the output. None disables truncation.
+
+    Returns:
+        The encoded result.
+
+    """
+    value = compact(result)
+    text = _dumps(value)
+    if token_budget is None or estimate_tokens(text) <= token_budget:
+        return text
+
+    original_tokens = estimate_tokens(text)
+    note = (
+        f"Output reduced from ~{original_tokens} to fit {token_budget} tokens. "
+        "Request fewer results or the next page for more."
+    )
+    # Leave room for the note added once the tables have been shortened
+    target = token_budget - estimate_tokens(_dumps({KEY_TRUNCATED: note}))
+
+    tables = _tables(value)
+    while estimate_tokens(text) > target:
+        shrinkable = [table for table in tables if len(table[KEY_ROWS]) > 1]
+        if not shrinkable:
+            break
+        largest = max(shrinkable, key=lambda table: len(_dumps(table[KEY_ROWS])))
+        rows = largest[KEY_ROWS]
+        ratio = max(target, 1) / estimate_tokens(text)
+        keep = min(len(rows) - 1, max(1, int(len(rows) * ratio)))
+        largest[KEY_OMITTED_ROWS] = largest.get(KEY_OMITTED_ROWS, 0) + len(rows) - keep
+        largest[KEY_ROWS] = rows[:keep]
+        text = _dumps(value)
+
+    if isinstance(value, dict):
+        text = _dumps({KEY_TRUNCATED: note, **value})
+
+    # Fall back to a plain preview when no table can absorb the cut
+    preview_chars = len(text)
+    while estimate_tokens(text) > token_budget and preview_chars > 0:
+        preview_chars = int(preview_chars * 0.8)
+        text = _dumps({KEY_TRUNCATED: note, "preview": _dumps(value)[:preview_chars]})
+
+    logger.debug(f"Tool output truncated from ~{original_tokens} tokens")
+    return text
@@ -0,0 +1,454 @@
+"""Conversation memory of chat sessions.
+
+The workflow is compiled with a LangGraph checkpointer, so every query of a
+session continues the same message history and follow-up questions can reuse
+earlier tool results instead of calling MLflow again. The history is compacted
+before each query to keep prompts bounded: tool outputs of older turns are
+elided, and turns beyond a window are folded into a running summary.
+"""
+import asyncio
+import logging
+import sqlite3
+import threading
+import uuid
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from mlflow_assistant.engine.definitions import (
+    MEMORY_CHECKPOINTS_KEPT,
+    MEMORY_ELIDED_PREFIX,
+    MEMORY_ELIDED_PREVIEW_CHARS,
+    MEMORY_MAX_TURNS,
+    MEMORY_SUMMARY_MAX_CHARS,
+    MEMORY_SUMMARY_PROMPT,
+    MEMORY_TOOL_OUTPUT_TURNS,
+    STATE_KEY_MESSAGES,
+    STATE_KEY_SUMMARY,
+)
+from mlflow_assistant.utils.config import get_memory_backend, get_memory_path
+from mlflow_assistant.utils.constants import MEMORY_BACKEND_OFF, MEMORY_BACKEND_SQLITE
+
+logger = logging.getLogger("mlflow_assistant.engine.memory")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT,
+    checkpoint_ns TEXT,
+    checkpoint_id TEXT,
+    parent_checkpoint_id TEXT,
+    checkpoint_type TEXT,
+    checkpoint BLOB,
+    metadata_type TEXT,
+    metadata BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT,
+    checkpoint_ns TEXT,
+    checkpoint_id TEXT,
+    task_id TEXT,
+    idx INTEGER,
+    channel TEXT,
+    value_type TEXT,
+    value BLOB,
+    task_path TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+def _checkpoint_config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    """Build the config pointing at a checkpoint."""
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        },
+    }
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """LangGraph checkpointer storing conversations in a local SQLite file.
+
+    Each checkpoint is stored whole, and only the latest checkpoints of each
+    conversation are kept, since chat sessions only ever resume from the last
+    one. Async methods run the queries in a worker thread.
+    """
+
+    def __init__(self, path: str | Path, checkpoints_kept: int = MEMORY_CHECKPOINTS_KEPT):
+        """Initialize the checkpointer.
+
+        Args:
+            path: Path of the SQLite file holding the conversations.
+            checkpoints_kept: Number of checkpoints kept per conversation.
+
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.checkpoints_kept = max(checkpoints_kept, 2)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _to_tuple(self, row: tuple) -> CheckpointTuple:
+        """Build a checkpoint tuple from a checkpoints row and its pending writes."""
+        (thread_id, checkpoint_ns, checkpoint_id, parent_id,
+         checkpoint_type, checkpoint, metadata_type, metadata) = row
+        writes = self._connection.execute(
+            "SELECT task_id, channel, value_type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return CheckpointTuple(
+            config=_checkpoint_config(thread_id, checkpoint_ns, checkpoint_id),
+            checkpoint=self.serde.loads_typed((checkpoint_type, checkpoint)),
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=(
+                _checkpoint_config(thread_id, checkpoint_ns, parent_id) if parent_id else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((value_type, value)))
+                for task_id, channel, value_type, value in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get the requested checkpoint, or the latest one of the conversation."""
+        configurable = config["configurable"]
+        query = "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        params = [configurable["thread_id"], configurable.get("checkpoint_ns", "")]
+        if checkpoint_id := get_checkpoint_id(config):
+            query += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        with self._lock:
+            row = self._connection.execute(
+                f"{query} ORDER BY checkpoint_id DESC LIMIT 1", params,
+            ).fetchone()
+            return self._to_tuple(row) if row else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints, newest first."""
+        query = "SELECT * FROM checkpoints WHERE 1 = 1"
+        params = []
+        if config:
+            configurable = config["configurable"]
+            query += " AND thread_id = ?"
+            params.append(configurable["thread_id"])
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                query += " AND checkpoint_ns = ?"
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                query += " AND checkpoint_id = ?"
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            query += " AND checkpoint_id < ?"
+            params.append(before_id)
+
+        with self._lock:
+            rows = self._connection.execute(
+                f"{query} ORDER BY checkpoint_id DESC", params,
+            ).fetchall()
+            tuples = []
+            for row in rows:
+                if limit is not None and len(tuples) >= limit:
+                    break
+                checkpoint_tuple = self._to_tuple(row)
+                if filter and any(
+                    checkpoint_tuple.metadata.get(key) != value for key, value in filter.items()
+                ):
+                    continue
+                tuples.append(checkpoint_tuple)
+        yield from tuples
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,  # noqa: ARG002 checkpoints are stored whole
+    ) -> RunnableConfig:
+        """Save a checkpoint and drop the oldest ones of the conversation."""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_data = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_data = self.serde.dumps_typed(
+            {**configurable.get("metadata", {}), **metadata},
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id, checkpoint_ns, checkpoint["id"], configurable.get("checkpoint_id"),
+                    checkpoint_type, checkpoint_data, metadata_type, metadata_data,
+                ),
+            )
+            stale = self._connection.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT -1 OFFSET ?",
+                (thread_id, checkpoint_ns, self.checkpoints_kept),
+            ).fetchall()
+            for table in ("checkpoints", "writes"):
+                self._connection.executemany(
+                    f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? "  # noqa: S608
+                    "AND checkpoint_id = ?",
+                    [(thread_id, checkpoint_ns, checkpoint_id) for (checkpoint_id,) in stale],
+                )
+        return _checkpoint_config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save the pending writes of a task."""
+        configurable = config["configurable"]
+        key = (
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_data = self.serde.dumps_typed(value)
+            rows.append(
+                (*key, task_id, WRITES_IDX_MAP.get(channel, idx), channel, value_type, value_data, task_path),
+            )
+        # Special writes (errors, interrupts) overwrite, regular writes are kept once
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                if all(channel in WRITES_IDX_MAP for channel, _ in writes)
+                else "INSERT OR IGNORE INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Async version of get_tuple."""
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """Async version of list."""
+        tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit)),
+        )
+        for checkpoint_tuple in tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Async version of put."""
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Async version of put_writes."""
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+
+@dataclass
+class ConversationMemory:
+    """Checkpointer and conversation id shared by the queries of a chat session."""
+
+    checkpointer: BaseCheckpointSaver
+    thread_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @property
+    def config(self) -> RunnableConfig:
+        """Workflow config selecting the conversation."""
+        return {"configurable": {"thread_id": self.thread_id}}
+
+    @classmethod
+    def from_config(cls, session: str | None = None) -> "ConversationMemory | None":
+        """Create the memory configured for chat sessions.
+
+        Args:
+            session: Name of the conversation to continue. A new one is started
+                when omitted.
+
+        Returns:
+            ConversationMemory: The session memory, or None when memory is off.
+
+        """
+        backend = get_memory_backend()
+        if backend == MEMORY_BACKEND_OFF:
+            return None
+        if backend == MEMORY_BACKEND_SQLITE:
+            checkpointer = SQLiteCheckpointSaver(get_memory_path())
+        else:
+            checkpointer = MemorySaver()
+        if session:
+            return cls(checkpointer, session)
+        return cls(checkpointer)
+
+
+def _message_text(message: BaseMessage) -> str:
+    """Get the text of a message as a single line."""
+    content = message.content
+    if not isinstance(content, str):
+        content = " ".join(
+            block.get("text", "") if isinstance(block, dict) else str(block) for block in content
+        )
+    return " ".join(content.split())
+
+
+def transcript(messages: Sequence[BaseMessage]) -> str:
+    """Render the user questions and assistant answers of messages as text.
+
+    Tool calls and their outputs are left out, answers already restate them.
+    """
+    lines = []
+    for message in messages:
+        text = _message_text(message)
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {text}")
+        elif isinstance(message, AIMessage) and text:
+            lines.append(f"Assistant: {text}")
+    return "\n".join(lines)
+
+
+def extractive_summary(summary: str, messages: Sequence[BaseMessage]) -> str:
+    """Append the transcript of messages to a summary, keeping its most recent part."""
+    text = "\n".join(part for part in (summary, transcript(messages)) if part)
+    return text[-MEMORY_SUMMARY_MAX_CHARS:]
+
+
+def summarize_with_model(
+    model: BaseChatModel, summary: str, messages: Sequence[BaseMessage],
+) -> str:
+    """Extend a summary with messages, using the chat model.
+
+    Args:
+        model: The chat model writing the summary.
+        summary: The current summary.
+        messages: The messages to fold into it.
+
+    Returns:
+        str: The new summary.
+
+    """
+    response = model.invoke([
+        SystemMessage(content=MEMORY_SUMMARY_PROMPT),
+        HumanMessage(
+            content=f"Current summary:\n{summary or '(none)'}\n\nConversation:\n{transcript(messages)}",
+        ),
+    ])
+    text = response.content if isinstance(response.content, str) else ""
+    if not text.strip():
+        msg = "The model returned an empty summary"
+        raise ValueError(msg)
+    return text.strip()[:MEMORY_SUMMARY_MAX_CHARS]
+
+
+def compact_history(
+    messages: Sequence[BaseMessage],
+    summary: str = "",
+    summarize: Callable[[str, Sequence[BaseMessage]], str] = extractive_summary,
+    max_turns: int = MEMORY_MAX_TURNS,
+    tool_output_turns: int = MEMORY_TOOL_OUTPUT_TURNS,
+) -> dict[str, Any]:
+    """Compute the state updates that keep a conversation history bounded.
+
+    A turn starts at each user message. Once there are more than ``max_turns``
+    turns, the history is cut back to half of them and the removed turns are
+    folded into the summary, so summaries are written every few queries rather
+    than on each one. Within the kept turns, the tool outputs
+    of all but the last ``tool_output_turns`` turns are replaced by a short
+    preview; the model's answers in those turns already carry the results.
+
+    Args:
+        messages: The conversation history, the current query last.
+        summary: The summary of earlier, already removed turns.
+        summarize: Function building the new summary from the previous one and
+            the removed messages.
+        max_turns: Maximum number of turns kept verbatim.
+        tool_output_turns: Number of most recent turns whose tool outputs are kept.
+
+    Returns:
+        Dict[str, Any]: Workflow state updates, empty when nothing changes.
+
+    """
+    turns: list[list[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, HumanMessage) or not turns:
+            turns.append([])
+        turns[-1].append(message)
+
+    updates: list[BaseMessage] = []
+    result: dict[str, Any] = {}
+
+    dropped: list[BaseMessage] = []
+    if len(turns) > max_turns:
+        kept = max(max_turns // 2, 1)
+        dropped = [message for turn in turns[:-kept] for message in turn]
+        updates.extend(RemoveMessage(id=message.id) for message in dropped)
+        result[STATE_KEY_SUMMARY] = summarize(summary, dropped)
+        turns = turns[-kept:]
+
+    for turn in turns[:-tool_output_turns] if tool_output_turns else turns:
+        for message in turn:
+            if isinstance(message, ToolMessage) and not _message_text(message).startswith(MEMORY_ELIDED_PREFIX):
+                preview = _message_text(message)[:MEMORY_ELIDED_PREVIEW_CHARS]
+                updates.append(message.model_copy(update={"content": f"{MEMORY_ELIDED_PREFIX} {preview}"}))
+
+    if updates:
+        result[STATE_KEY_MESSAGES] = updates
+        logger.debug(f"Compacted history: {len(dropped)} messages summarized, {len(updates) - len(dropped)} tool outputs elided")
+    return result
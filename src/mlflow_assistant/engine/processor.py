@@ -1,19 +1,63 @@
 """Query processor that leverages the workflow engine for processing user queries and generating responses using an AI provider."""
 import logging
-from typing import Any
+import time
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage
 from mlflow_assistant.engine.definitions import (
+    EVENT_KEY_TYPE,
+    EVENT_RESULT,
+    EVENT_TOKEN,
+    EVENT_TOOL_END,
+    EVENT_TOOL_START,
+    KEY_CACHE_HIT,
+    STATE_KEY_CONTEXT_BUDGET,
     STATE_KEY_MESSAGES,
     STATE_KEY_PROVIDER_CONFIG,
 )
 from mlflow_assistant.utils.constants import CONFIG_KEY_MODEL, CONFIG_KEY_TYPE
 
+if TYPE_CHECKING:
+    from .memory import ConversationMemory
+    from .tool_cache import ToolCallCache
+
 logger = logging.getLogger("mlflow_assistant.engine.processor")
 
 
+def _initial_state(
+    query: str, provider_config: dict[str, Any], verbose: bool,
+) -> dict[str, Any]:
+    """Build the workflow input for a query, logging it when verbose."""
+    if verbose:
+        logger.info(f"Running workflow with query: {query}")
+        logger.info(f"Using provider: {provider_config.get(CONFIG_KEY_TYPE)}")
+        logger.info(
+            f"Using model: {provider_config.get(CONFIG_KEY_MODEL, 'default')}",
+        )
+
+    return {
+        STATE_KEY_MESSAGES: [HumanMessage(content=query)],
+        STATE_KEY_PROVIDER_CONFIG: provider_config,
+    }
+
+
+def _chunk_text(chunk: BaseMessage) -> str:
+    """Extract the text of a streamed message chunk."""
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in chunk.content
+    )
+
+
 async def process_query(
-    query: str, provider_config: dict[str, Any], verbose: bool = False,
+    query: str,
+    provider_config: dict[str, Any],
+    verbose: bool = False,
+    tool_cache: "ToolCallCache | None" = None,
+    memory: "ConversationMemory | None" = None,
 ) -> dict[str, Any]:
     """Process a query through the MLflow Assistant workflow.
 
@@ -21,44 +65,38 @@ async def process_query(
         query: The query to process
         provider_config: AI provider configuration
         verbose: Whether to show verbose output
+        tool_cache: Optional cache shared by the queries of a session, so repeated
+            tool calls are answered from memory
+        memory: Optional conversation memory the query continues
 
     Returns:
         Dict containing the response
 
     """
-    import time
-
-    from .workflow import create_workflow
+    from .workflow import get_workflow
 
     # Track start time for duration calculation
     start_time = time.time()
 
     try:
-        # Create workflow
-        workflow = create_workflow()
+        # Reuse the workflow compiled by earlier queries
+        workflow = get_workflow(tool_cache, memory and memory.checkpointer)
 
         # Run workflow with provider config
-        initial_state = {
-            STATE_KEY_MESSAGES: [HumanMessage(content=query)],
-            STATE_KEY_PROVIDER_CONFIG: provider_config,
-        }
-
-        if verbose:
-            logger.info(f"Running workflow with query: {query}")
-            logger.info(f"Using provider: {provider_config.get(CONFIG_KEY_TYPE)}")
-            logger.info(
-                f"Using model: {provider_config.get(CONFIG_KEY_MODEL, 'default')}",
-            )
-
-        result = await workflow.ainvoke(initial_state)
+        initial_state = _initial_state(query, provider_config, verbose)
+        result = await workflow.ainvoke(initial_state, memory and memory.config)
 
         # Calculate duration
         duration = time.time() - start_time
 
+        if verbose and tool_cache is not None:
+            logger.info(f"Tool cache: {tool_cache.cache_info()}")
+
         return {
             "original_query": query,
             "response": result.get(STATE_KEY_MESSAGES)[-1],
             "duration": duration,  # Add duration to response
+            "context_budget": result.get(STATE_KEY_CONTEXT_BUDGET),
         }
 
     except Exception as e:
@@ -72,3 +110,113 @@ async def process_query(
             "original_query": query,
             "response": f"Error processing query: {e!s}",
         }
+
+
+async def stream_query(
+    query: str,
+    provider_config: dict[str, Any],
+    verbose: bool = False,
+    tool_cache: "ToolCallCache | None" = None,
+    memory: "ConversationMemory | None" = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Process a query, yielding progress events while the workflow runs.
+
+    Every event is a dict whose ``type`` is one of:
+
+    - ``token``: a piece of the answer, in ``content``, as the model generates it
+    - ``tool_start``: a tool call began, with its ``name`` and ``args``
+    - ``tool_end``: a tool call finished, with its ``name``, ``duration``,
+      ``cache_hit`` and ``error`` flags
+    - ``result``: always last, the result of process_query plus
+      ``time_to_first_token`` (None when nothing was streamed) and
+      ``context_budget``, how the last prompt was fitted to its budget
+
+    Args:
+        query: The query to process
+        provider_config: AI provider configuration
+        verbose: Whether to show verbose output
+        tool_cache: Optional cache shared by the queries of a session
+        memory: Optional conversation memory the query continues
+
+    Yields:
+        Dict describing each event
+
+    """
+    from .workflow import get_workflow
+
+    start_time = time.time()
+    time_to_first_token = None
+    final_state = None
+    # Start times of the tool calls made by the workflow, by run id
+    tool_runs: dict[str, float] = {}
+
+    try:
+        workflow = get_workflow(tool_cache, memory and memory.checkpointer)
+        initial_state = _initial_state(query, provider_config, verbose)
+
+        async for event in workflow.astream_events(
+            initial_state, memory and memory.config, version="v2",
+        ):
+            kind = event["event"]
+            if kind == "on_chat_model_stream":
+                # Only the answer is streamed, not e.g. history summaries
+                if event["metadata"].get("langgraph_node") != "model":
+                    continue
+                text = _chunk_text(event["data"]["chunk"])
+                if not text:
+                    continue
+                if time_to_first_token is None:
+                    time_to_first_token = time.time() - start_time
+                yield {EVENT_KEY_TYPE: EVENT_TOKEN, "content": text}
+
+            elif kind == "on_tool_start":
+                # Skip tools invoked by other tools, e.g. behind the tool cache
+                if tool_runs.keys() & set(event["parent_ids"]):
+                    continue
+                tool_runs[event["run_id"]] = time.time()
+                yield {
+                    EVENT_KEY_TYPE: EVENT_TOOL_START,
+                    "name": event["name"],
+                    "args": event["data"].get("input", {}),
+                }
+
+            elif kind in ("on_tool_end", "on_tool_error") and event["run_id"] in tool_runs:
+                output = event["data"].get("output")
+                artifact = getattr(output, "artifact", None) or {}
+                yield {
+                    EVENT_KEY_TYPE: EVENT_TOOL_END,
+                    "name": event["name"],
+                    "duration": time.time() - tool_runs.pop(event["run_id"]),
+                    "cache_hit": bool(artifact.get(KEY_CACHE_HIT)),
+                    "error": kind == "on_tool_error" or getattr(output, "status", None) == "error",
+                }
+
+            elif kind == "on_chain_end" and not event["parent_ids"]:
+                final_state = event["data"]["output"]
+
+        if not final_state:
+            msg = "Workflow finished without a response"
+            raise RuntimeError(msg)
+
+        if verbose and tool_cache is not None:
+            logger.info(f"Tool cache: {tool_cache.cache_info()}")
+
+        result = {
+            "original_query": query,
+            "response": final_state[STATE_KEY_MESSAGES][-1],
+            "duration": time.time() - start_time,
+            "time_to_first_token": time_to_first_token,
+            "context_budget": final_state.get(STATE_KEY_CONTEXT_BUDGET),
+        }
+
+    except Exception as e:
+        logger.error(f"Error processing query: {e}")
+        result = {
+            "error": str(e),
+            "original_query": query,
+            "response": f"Error processing query: {e!s}",
+            "duration": time.time() - start_time,
+            "time_to_first_token": time_to_first_token,
+        }
+
+    yield {EVENT_KEY_TYPE: EVENT_RESULT, **result}
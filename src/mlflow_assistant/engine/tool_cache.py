@@ -0,0 +1,152 @@
+"""Per-session memoization of tool calls in the agent loop.
+
+Models often repeat a tool call with the same arguments within a conversation,
+e.g. listing models again after a follow-up question. Wrapping the workflow's
+tools with a ToolCallCache answers such repeats from memory for a short TTL and
+marks the resulting tool messages as cache hits.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from langchain_core.tools import BaseTool, StructuredTool
+from pydantic import BaseModel
+
+from mlflow_assistant.engine.definitions import (
+    KEY_CACHE_HIT,
+    TOOL_CALL_CACHE_MAX_SIZE,
+    TOOL_CALL_CACHE_TTL,
+)
+
+logger = logging.getLogger("mlflow_assistant.engine.tool_cache")
+
+
+class ToolCallCache:
+    """Session-scoped cache of tool results, keyed by tool name and arguments.
+
+    Arguments are normalized through the tool's schema, so calls that differ
+    only by omitted defaults share an entry. Error results are not cached.
+    """
+
+    def __init__(
+        self, ttl: float = TOOL_CALL_CACHE_TTL, max_size: int = TOOL_CALL_CACHE_MAX_SIZE,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Time in seconds a tool result is reused.
+            max_size: Maximum number of cached results before the least recently
+                used ones are evicted.
+
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tool: BaseTool, args: dict[str, Any]) -> str:
+        """Build the cache key of a tool call.
+
+        Args:
+            tool: The called tool.
+            args: The call arguments.
+
+        Returns:
+            The tool name followed by the normalized arguments as sorted JSON.
+
+        """
+        normalized = args
+        schema = tool.args_schema
+        if isinstance(schema, type) and issubclass(schema, BaseModel):
+            try:
+                normalized = schema(**args).model_dump()
+            except ValueError:
+                normalized = args
+        return f"{tool.name}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up a cached result.
+
+        Returns:
+            Whether the key was found and not expired, and the cached result.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: str, result: Any) -> None:
+        """Cache a result for the TTL."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def wrap(self, tool: BaseTool) -> BaseTool:
+        """Wrap a tool so its calls go through the cache.
+
+        The wrapper keeps the tool's name, description and schema. Its messages
+        carry a ``{"cache_hit": bool}`` artifact, so traces show which calls were
+        answered from the cache.
+
+        Args:
+            tool: The tool to wrap.
+
+        Returns:
+            The memoizing tool.
+
+        """
+
+        def call(**kwargs: Any) -> tuple[Any, dict[str, bool]]:
+            key = self.key(tool, kwargs)
+            hit, result = self.get(key)
+            if hit:
+                logger.debug(f"Tool cache hit: {key}")
+                return result, {KEY_CACHE_HIT: True}
+
+            result = tool.invoke(kwargs)
+            # Tools report failures as {"error": ...}; retry those next time
+            if not (isinstance(result, str) and result.startswith('{"error"')):
+                self.put(key, result)
+            return result, {KEY_CACHE_HIT: False}
+
+        return StructuredTool.from_function(
+            func=call,
+            name=tool.name,
+            description=tool.description,
+            args_schema=tool.args_schema,
+            response_format="content_and_artifact",
+        )
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def cache_info(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit and miss counters and current cache size.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
@@ -0,0 +1,106 @@
+"""Concurrent execution of the tool calls of one model turn.
+
+When the model asks for several tools at once, e.g. the details of three
+models, the calls run concurrently so the turn takes as long as its slowest
+call rather than the sum of all of them. A concurrency limit protects the
+tracking server, and a per-call timeout turns a stuck call into an error
+message instead of stalling the answer.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any
+
+from langchain_core.messages import ToolCall, ToolMessage
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ContextThreadPoolExecutor, get_config_list
+from langgraph.prebuilt import ToolNode
+
+from mlflow_assistant.engine.definitions import TOOL_CALL_TIMEOUT, TOOL_MAX_CONCURRENCY
+from mlflow_assistant.engine.encoder import encode_result
+
+logger = logging.getLogger("mlflow_assistant.engine.tool_node")
+
+
+class ParallelToolNode(ToolNode):
+    """ToolNode running tool calls concurrently, with a concurrency limit and timeout.
+
+    Whether the node is invoked synchronously or asynchronously, the timeout of
+    each call counts from the start of the turn, so it includes the time the
+    call spends queued behind the concurrency limit. A turn therefore never
+    takes much longer than the timeout, however many calls it has.
+    """
+
+    def __init__(
+        self,
+        tools: list[Any],
+        max_concurrency: int = TOOL_MAX_CONCURRENCY,
+        timeout: float | None = TOOL_CALL_TIMEOUT,
+        **kwargs: Any,
+    ):
+        """Initialize the node.
+
+        Args:
+            tools: The tools the model can call.
+            max_concurrency: Maximum number of tool calls running at once.
+            timeout: Time limit of each call in seconds, queueing included.
+                None disables it.
+            **kwargs: Additional arguments for ToolNode.
+
+        """
+        super().__init__(tools, **kwargs)
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+
+    def _timeout_message(self, call: ToolCall) -> ToolMessage:
+        """Build the error message returned for a call that timed out."""
+        logger.warning(f"Tool call {call['name']} timed out after {self.timeout:g}s")
+        content = encode_result(
+            {"error": f"{call['name']} did not finish within {self.timeout:g}s"},
+        )
+        return ToolMessage(
+            content=content, name=call["name"], tool_call_id=call["id"], status="error",
+        )
+
+    def _func(self, input: Any, config: RunnableConfig, *, store: Any) -> Any:
+        """Run the tool calls in a bounded thread pool."""
+        tool_calls, output_type = self._parse_input(input, store)
+        config_list = get_config_list(config, len(tool_calls))
+
+        executor = ContextThreadPoolExecutor(max_workers=self.max_concurrency)
+        start = time.monotonic()
+        futures = [
+            executor.submit(self._run_one, call, call_config)
+            for call, call_config in zip(tool_calls, config_list, strict=True)
+        ]
+        outputs = []
+        for call, future in zip(tool_calls, futures, strict=True):
+            remaining = None if self.timeout is None else start + self.timeout - time.monotonic()
+            try:
+                outputs.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                future.cancel()
+                outputs.append(self._timeout_message(call))
+        # Do not wait for calls that timed out
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        return outputs if output_type == "list" else {self.messages_key: outputs}
+
+    async def _afunc(self, input: Any, config: RunnableConfig, *, store: Any) -> Any:
+        """Run the tool calls concurrently, at most max_concurrency at a time."""
+        tool_calls, output_type = self._parse_input(input, store)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(call: ToolCall) -> ToolMessage:
+            async with semaphore:
+                return await self._arun_one(call, config)
+
+        async def run_with_timeout(call: ToolCall) -> ToolMessage:
+            try:
+                return await asyncio.wait_for(run(call), self.timeout)
+            except TimeoutError:
+                return self._timeout_message(call)
+
+        outputs = await asyncio.gather(*(run_with_timeout(call) for call in tool_calls))
+        return outputs if output_type == "list" else {self.messages_key: outputs}
@@ -1,14 +1,79 @@
 """LangGraph tools for MLflow interactions."""
+import base64
 import json
 import logging
+import posixpath
 import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
 
 import mlflow
+import numpy as np
 from langchain_core.tools import tool
+from mlflow.entities import FileInfo, Run
+from mlflow.tracking import MlflowClient
+from mlflow_assistant.core.artifacts import (
+    is_proxied_artifact,
+    read_local_range,
+    resolve_local_artifact,
+    stream_proxied_range,
+)
+from mlflow_assistant.core.cache import CachedMlflowClient
 from mlflow_assistant.core.connection import MLflowConnection
-from mlflow_assistant.engine.definitions import MLFLOW_MAX_RESULTS, NA, TIME_FORMAT
-from mlflow_assistant.utils.config import get_mlflow_uri
+from mlflow_assistant.core.local_store import LocalFileStore
+from mlflow_assistant.core.snapshot import MetadataSnapshot
+from mlflow_assistant.engine.comparison import compare_metrics, differing_params
+from mlflow_assistant.engine.context_budget import tool_output_budget
+from mlflow_assistant.engine.definitions import (
+    ACTIVE_RUNS_FILTER,
+    ARTIFACT_DOWNLOAD_MAX_BYTES,
+    ARTIFACT_HEX_PREVIEW_BYTES,
+    ARTIFACT_LIST_ENTRY_LIMIT,
+    ARTIFACT_LIST_MAX_DEPTH,
+    ARTIFACT_LIST_MAX_ENTRIES,
+    ARTIFACT_PREVIEW_BYTES,
+    ARTIFACT_PREVIEW_MAX_BYTES,
+    COMPARE_RUNS_MAX,
+    FEDERATION_ENTITIES,
+    FEDERATION_SERVER_TIMEOUT,
+    METRIC_HISTORY_MAX_POINTS,
+    METRIC_HISTORY_POINT_LIMIT,
+    MLFLOW_SEARCH_PAGE_SIZE,
+    MODEL_DETAILS_MAX_VERSIONS,
+    NA,
+    SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE,
+    RUN_COUNT_MAX_WORKERS,
+    RUN_COUNT_PAGE_SIZE,
+    RUN_COUNT_TIME_BUDGET,
+    RUN_FETCH_MAX_WORKERS,
+    RUN_ID_FILTER_CHUNK_SIZE,
+    SEARCH_RUNS_TOP_K,
+    TIME_FORMAT,
+    TOOL_MAX_PAGE_SIZE,
+    TOOL_PAGE_SIZE,
+    RunCount,
+    ToolSettings,
+)
+from mlflow_assistant.engine.downsampling import lttb, min_max
+from mlflow_assistant.engine.encoder import encode_result
+from mlflow_assistant.utils.config import (
+    get_mlflow_servers,
+    get_mlflow_uri,
+    get_provider_config,
+    get_snapshot_max_age,
+    get_snapshot_path,
+    get_tool_token_budget,
+)
+from mlflow_assistant.utils.exceptions import MLflowConnectionError
 
 logger = logging.getLogger("mlflow_assistant.enngine.tools")
 
@@ -24,23 +89,731 @@ class MLflowTools:
         dt = datetime.fromtimestamp(timestamp_ms / 1000.0)
         return dt.strftime(TIME_FORMAT)
 
+    @staticmethod
+    def encode(result: dict[str, Any]) -> str:
+        """Encode a tool result compactly within the configured token budget."""
+        return encode_result(result, get_tool_settings().token_budget)
+
+    @staticmethod
+    def page_size(requested: int) -> int:
+        """Clamp a requested page size so tool output stays bounded."""
+        return max(1, min(requested, TOOL_MAX_PAGE_SIZE))
+
+    @staticmethod
+    def encode_cursor(**position: Any) -> str:
+        """Encode a result position as an opaque cursor string."""
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> dict[str, Any]:
+        """Decode a cursor produced by encode_cursor.
+
+        Args:
+            cursor: The cursor string, or an empty string for the first page.
+
+        Returns:
+            The encoded position, or an empty dict for the first page.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+
+        """
+        if not cursor:
+            return {}
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except Exception as e:
+            msg = f"Invalid cursor: {cursor}"
+            raise ValueError(msg) from e
+        if not isinstance(position, dict):
+            msg = f"Invalid cursor: {cursor}"
+            raise ValueError(msg)
+        return position
+
+    @staticmethod
+    def search_page(
+        search: Callable[..., Any],
+        page_size: int,
+        page_token: str | None = None,
+        keep: Callable[[Any], bool] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[Any], str | None]:
+        """Fetch a single page of a paginated MLflow search.
+
+        Args:
+            search: A paginated client search method, e.g. ``client.search_experiments``
+            page_size: Number of items to return
+            page_token: MLflow page token to resume from, or None for the first page
+            keep: Optional predicate; items it rejects are left out of the page
+            **kwargs: Additional arguments passed to every search call
+
+        Returns:
+            The items of the page and a cursor for the following page, or None
+            if there are no more results.
+
+        """
+        items = []
+        while len(items) < page_size:
+            page = search(
+                max_results=page_size - len(items), page_token=page_token, **kwargs,
+            )
+            items.extend(page if keep is None else filter(keep, page))
+            page_token = page.token
+            if not page_token:
+                break
+        if isinstance(page_token, bytes):
+            # Database-backed stores return the page token as bytes
+            page_token = page_token.decode()
+        next_cursor = MLflowTools.encode_cursor(page_token=page_token) if page_token else None
+        return items, next_cursor
+
+    @staticmethod
+    def search_runs_by_id(
+        client: MlflowClient, run_ids: list[str],
+    ) -> dict[str, Run]:
+        """Fetch many runs with a few batched ``run_id IN (...)`` searches.
+
+        Experiment IDs are sent SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE at a time, like
+        in count_runs_across. Runs that the batched searches do not return, e.g.
+        runs of deleted experiments, are fetched individually as a fallback.
+
+        Args:
+            client: MLflow client used to query runs
+            run_ids: IDs of the runs to fetch
+
+        Returns:
+            Dict mapping each found run ID to its Run. Runs that do not exist are omitted.
+
+        """
+        unique_ids = list(dict.fromkeys(run_id for run_id in run_ids if run_id))
+        if not unique_ids:
+            return {}
+
+        experiment_ids = [
+            exp.experiment_id for exp in MLflowTools.iter_search(client.search_experiments)
+        ]
+        runs = {}
+        for start in range(0, len(unique_ids), RUN_ID_FILTER_CHUNK_SIZE):
+            chunk = unique_ids[start:start + RUN_ID_FILTER_CHUNK_SIZE]
+            quoted = ", ".join(f"'{run_id}'" for run_id in chunk)
+            # Bound the request size on servers with many experiments, and stop
+            # once every run of the chunk has been found
+            for exp_start in range(0, len(experiment_ids), SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE):
+                for run in MLflowTools.iter_search(
+                    client.search_runs,
+                    experiment_ids=experiment_ids[exp_start:exp_start + SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE],
+                    filter_string=f"attributes.run_id IN ({quoted})",
+                ):
+                    runs[run.info.run_id] = run
+                if all(run_id in runs for run_id in chunk):
+                    break
+
+        missing = [run_id for run_id in unique_ids if run_id not in runs]
+        for run_id, run in MLflowTools.fetch_runs(client, missing).items():
+            if not isinstance(run, Exception):
+                runs[run_id] = run
+        return runs
+
+    @staticmethod
+    def run_column(run: Run, column: str) -> Any:
+        """Read a column such as ``metrics.f1`` or ``params.lr`` from a run.
+
+        Args:
+            run: The MLflow run
+            column: ``metrics.<key>``, ``params.<key>``, ``tags.<key>``, or a run
+                attribute, optionally prefixed with ``attributes.``
+
+        Returns:
+            The column value, or None if the run does not have it.
+
+        """
+        prefix, _, key = column.partition(".")
+        if key and prefix in {"metrics", "metric"}:
+            return run.data.metrics.get(key)
+        if key and prefix in {"params", "param"}:
+            return run.data.params.get(key)
+        if key and prefix in {"tags", "tag"}:
+            return run.data.tags.get(key)
+        attribute = key if key and prefix in {"attributes", "attribute"} else column
+        value = getattr(run.info, attribute, None)
+        if attribute in {"start_time", "end_time"}:
+            return MLflowTools.format_timestamp(value)
+        return value
+
+    @staticmethod
+    def name_filter(name_contains: str) -> str:
+        """Build a case-insensitive MLflow filter string matching names containing a substring.
+
+        MLflow filter strings cannot escape wildcards or quotes in a way every
+        store understands, so characters other than letters, digits, spaces and
+        hyphens are matched by the single-character wildcard ``_``. The filter
+        may match more names than asked, so results are narrowed down with
+        name_matcher.
+        """
+        pattern = "".join(char if char.isalnum() or char in " -" else "_" for char in name_contains)
+        return f"name ILIKE '%{pattern}%'"
+
+    @staticmethod
+    def name_matcher(name_contains: str) -> Callable[[Any], bool]:
+        """Build a predicate keeping entities whose name contains a substring, ignoring case."""
+        needle = name_contains.lower()
+        return lambda entity: needle in entity.name.lower()
+
+    @staticmethod
+    def iter_search(
+        search: Callable[..., Any],
+        max_results: int | None = None,
+        page_size: int = MLFLOW_SEARCH_PAGE_SIZE,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Lazily iterate over the results of a paginated MLflow search.
+
+        Pages are requested only as they are consumed, and no further pages are
+        requested once ``max_results`` items have been yielded.
+
+        Args:
+            search: A paginated client search method, e.g. ``client.search_experiments``
+            max_results: Maximum number of items to yield. None yields everything.
+            page_size: Maximum number of items requested per page
+            **kwargs: Additional arguments passed to every search call
+
+        Yields:
+            The search results, in server order.
+
+        """
+        yielded = 0
+        page_token = None
+        while max_results is None or yielded < max_results:
+            size = page_size if max_results is None else min(page_size, max_results - yielded)
+            page = search(max_results=size, page_token=page_token, **kwargs)
+            for item in page:
+                yield item
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+            page_token = page.token
+            if not page_token:
+                return
+
+    @staticmethod
+    def count_runs(
+        client: MlflowClient,
+        experiment_ids: list[str],
+        filter_string: str = "",
+        time_budget: float | None = RUN_COUNT_TIME_BUDGET,
+    ) -> dict[str, RunCount]:
+        """Count the runs of several experiments concurrently.
+
+        Each experiment is counted by following ``search_runs`` pagination to the
+        end, so counts are exact rather than capped at a single page. Experiments
+        are counted in parallel by a bounded thread pool.
+
+        Args:
+            client: MLflow client used to query runs
+            experiment_ids: IDs of the experiments to count
+            filter_string: Optional MLflow filter restricting the counted runs
+            time_budget: Seconds after which counting stops and the partial
+                counts are reported as approximate. None disables the budget.
+
+        Returns:
+            Dict mapping each experiment ID to its RunCount.
+
+        """
+        groups = {experiment_id: [experiment_id] for experiment_id in experiment_ids}
+        return MLflowTools._count_run_groups(client, groups, filter_string, time_budget)
+
+    @staticmethod
+    def count_runs_async(
+        connection: MLflowConnection,
+        experiment_ids: list[str],
+        filter_string: str = "",
+        time_budget: float | None = RUN_COUNT_TIME_BUDGET,
+    ) -> dict[str, RunCount]:
+        """Count the runs of several experiments with the async REST client.
+
+        Like count_runs, but the experiments are paged through concurrently on
+        the connection's pooled async client rather than by a thread pool.
+
+        Args:
+            connection: Connection to an HTTP(S) tracking server
+            experiment_ids: IDs of the experiments to count
+            filter_string: Optional MLflow filter restricting the counted runs
+            time_budget: Seconds after which counting stops and the partial
+                counts are reported as approximate. None disables the budget.
+
+        Returns:
+            Dict mapping each experiment ID to its RunCount.
+
+        """
+        counts = connection.run_async(
+            lambda client: client.count_runs(experiment_ids, filter_string, time_budget),
+        )
+        run_counts = {}
+        for experiment_id, count in counts.items():
+            if isinstance(count, Exception):
+                logger.warning(
+                    f"Error getting run count for experiment {experiment_id}: {count!s}",
+                )
+                run_counts[experiment_id] = RunCount(count=None, exact=False, error=str(count))
+            else:
+                run_counts[experiment_id] = RunCount(count=count[0], exact=count[1])
+        return run_counts
+
+    @staticmethod
+    def count_runs_across(
+        client: MlflowClient,
+        experiment_ids: list[str],
+        filter_string: str = "",
+        time_budget: float | None = RUN_COUNT_TIME_BUDGET,
+    ) -> RunCount:
+        """Count the runs matching a filter across many experiments at once.
+
+        Experiment IDs are sent in chunks to multi-experiment ``search_runs``
+        calls, which run concurrently, so the number of requests grows with the
+        number of matching runs rather than with the number of experiments.
+
+        Args:
+            client: MLflow client used to query runs
+            experiment_ids: IDs of the experiments to search
+            filter_string: Optional MLflow filter restricting the counted runs
+            time_budget: Seconds after which counting stops and the partial
+                count is reported as approximate. None disables the budget.
+
+        Returns:
+            RunCount: The total count over all experiments.
+
+        """
+        groups = {
+            str(start): experiment_ids[start:start + SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE]
+            for start in range(0, len(experiment_ids), SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE)
+        }
+        counts = MLflowTools._count_run_groups(client, groups, filter_string, time_budget)
+
+        errors = [count.error for count in counts.values() if count.error is not None]
+        if errors:
+            return RunCount(count=None, exact=False, error=errors[0])
+        total = sum(count.count or 0 for count in counts.values())
+        if any(count.count is None for count in counts.values()) and not total:
+            return RunCount(count=None, exact=False)
+        return RunCount(count=total, exact=all(count.exact for count in counts.values()))
+
+    @staticmethod
+    def _count_run_groups(
+        client: MlflowClient,
+        groups: dict[str, list[str]],
+        filter_string: str,
+        time_budget: float | None,
+    ) -> dict[str, RunCount]:
+        """Count the runs of each group of experiments concurrently."""
+        if not groups:
+            return {}
+
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+
+        def _count(key: str) -> RunCount:
+            count = 0
+            page_token = None
+            fetched = False
+            try:
+                while True:
+                    if deadline is not None and time.monotonic() > deadline:
+                        return RunCount(count=count if fetched else None, exact=False)
+                    page = client.search_runs(
+                        experiment_ids=groups[key],
+                        filter_string=filter_string,
+                        max_results=RUN_COUNT_PAGE_SIZE,
+                        page_token=page_token,
+                    )
+                    fetched = True
+                    count += len(page)
+                    page_token = page.token
+                    if not page_token:
+                        return RunCount(count=count)
+            except Exception as e:
+                logger.warning(
+                    f"Error getting run count for experiments {groups[key]}: {e!s}",
+                )
+                return RunCount(count=None, exact=False, error=str(e))
+
+        keys = list(groups)
+        max_workers = min(RUN_COUNT_MAX_WORKERS, len(keys))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = executor.map(_count, keys)
+            return dict(zip(keys, counts, strict=True))
+
+    @staticmethod
+    def across_servers(
+        servers: list[str],
+        query: Callable[[CachedMlflowClient], Any],
+        timeout: float = FEDERATION_SERVER_TIMEOUT,
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Run a query against several tracking servers concurrently.
+
+        Every server gets its own worker, so the timeout applies to each server
+        independently. Servers that have not answered in time are reported as
+        errors and their late results are discarded.
+
+        Args:
+            servers: Names of the configured servers to query
+            query: Function receiving a server's client and returning its result
+            timeout: Maximum time to wait for the servers, in seconds
+
+        Returns:
+            The results by server name, and the error messages by server name.
+
+        """
+        if not servers:
+            return {}, {}
+
+        executor = ThreadPoolExecutor(max_workers=len(servers))
+        futures = {
+            executor.submit(lambda name=name: query(get_server_client(name))): name
+            for name in servers
+        }
+        _, pending = wait(futures, timeout=timeout)
+        # Do not wait for slow servers; their threads finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        results, errors = {}, {}
+        for future, name in futures.items():
+            if future in pending:
+                errors[name] = f"No answer within {timeout:g}s"
+            elif (error := future.exception()) is not None:
+                errors[name] = str(error)
+            else:
+                results[name] = future.result()
+        return results, errors
+
+    @staticmethod
+    def sort_rows(rows: list[dict[str, Any]], order_by: str) -> list[dict[str, Any]]:
+        """Sort result rows by an MLflow ordering clause such as ``metrics.f1 DESC``.
+
+        Rows missing the column are placed last, whatever the direction.
+
+        Args:
+            rows: The rows to sort
+            order_by: A column name, optionally followed by ASC or DESC
+
+        Returns:
+            The sorted rows.
+
+        """
+        column, _, direction = order_by.strip().partition(" ")
+        present = [row for row in rows if row.get(column) is not None]
+        missing = [row for row in rows if row.get(column) is None]
+        present.sort(key=itemgetter(column), reverse=direction.strip().upper() == "DESC")
+        return present + missing
+
+    @staticmethod
+    def walk_artifacts(
+        client: MlflowClient,
+        run_id: str,
+        path: str = "",
+        max_depth: int = ARTIFACT_LIST_MAX_DEPTH,
+    ) -> Iterator[tuple[FileInfo, int]]:
+        """Lazily walk the artifact tree of a run, breadth-first.
+
+        A directory is only listed when the walk reaches it, so consumers that
+        stop early never list deeper directories, and no artifact is downloaded.
 
-# Get MLflow client
-mlflow_connection = MLflowConnection(tracking_uri=get_mlflow_uri())
-mlflow_connection.connect()
-client = mlflow_connection.get_client()
+        Args:
+            client: The MLflow client
+            run_id: The ID of the run
+            path: The directory to start from, relative to the artifact root
+            max_depth: Depth of the deepest directories whose content is listed
+
+        Yields:
+            Each artifact with its depth, starting at 1 for the entries of ``path``.
+
+        """
+        queue = deque([(path or None, 1)])
+        while queue:
+            directory, depth = queue.popleft()
+            for info in client.list_artifacts(run_id, directory):
+                yield info, depth
+                if info.is_dir and depth < max_depth:
+                    queue.append((info.path, depth + 1))
+
+    @staticmethod
+    def decode_text(data: bytes) -> str | None:
+        """Decode a byte range as UTF-8 text, or return None if it looks binary.
+
+        A multi-byte character cut at the end of the range is dropped rather
+        than treated as binary content.
+        """
+        if b"\x00" in data:
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError as e:
+            if e.start < len(data) - 3:
+                return None
+            return data[:e.start].decode("utf-8")
+
+    @staticmethod
+    def run_summary(
+        status: str,
+        start_time: int | None,
+        end_time: int | None,
+        metrics: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Summarize a run with only essential, serializable information."""
+        run_metrics = {}
+        for key, value in metrics.items():
+            try:
+                run_metrics[key] = float(value)
+            except ValueError:
+                run_metrics[key] = str(value)
+
+        return {
+            "status": status,
+            "start_time": MLflowTools.format_timestamp(start_time),
+            "end_time": MLflowTools.format_timestamp(end_time) if end_time else None,
+            "metrics": run_metrics,
+        }
+
+    @staticmethod
+    def rest_run_summary(run: dict[str, Any]) -> dict[str, Any]:
+        """Summarize a run returned by the MLflow REST API, like run_summary."""
+        info = run.get("info", {})
+        metrics = {
+            metric["key"]: metric["value"] for metric in run.get("data", {}).get("metrics", [])
+        }
+        start_time, end_time = info.get("start_time"), info.get("end_time")
+        return MLflowTools.run_summary(
+            info.get("status"),
+            int(start_time) if start_time else None,
+            int(end_time) if end_time else None,
+            metrics,
+        )
+
+    @staticmethod
+    def fetch_runs(
+        client: MlflowClient, run_ids: list[str],
+    ) -> dict[str, Run | Exception]:
+        """Fetch several runs concurrently, requesting each distinct run only once.
+
+        Args:
+            client: MLflow client used to fetch runs
+            run_ids: IDs of the runs to fetch; duplicates and empty IDs are ignored
+
+        Returns:
+            Dict mapping each run ID to its Run, or to the exception raised
+            while fetching it.
+
+        """
+        unique_ids = list(dict.fromkeys(run_id for run_id in run_ids if run_id))
+        if not unique_ids:
+            return {}
+
+        def _fetch(run_id: str) -> Run | Exception:
+            try:
+                return client.get_run(run_id)
+            except Exception as e:
+                logger.warning(f"Error getting run details for {run_id}: {e!s}")
+                return e
+
+        max_workers = min(RUN_FETCH_MAX_WORKERS, len(unique_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            runs = executor.map(_fetch, unique_ids)
+            return dict(zip(unique_ids, runs, strict=True))
+
+
+# Shared MLflow connection, created lazily on the first tool call
+_mlflow_connection: MLflowConnection | None = None
+_server_connections: dict[str, MLflowConnection] = {}
+_mlflow_connection_lock = threading.Lock()
+_server_connections_lock = threading.Lock()
+_server_locks: dict[str, threading.Lock] = {}
+
+# Tool settings, read from the configuration file on the first tool call
+_tool_settings: ToolSettings | None = None
+
+
+def get_tool_settings() -> ToolSettings:
+    """Return the tool settings, reading the configuration file on first use.
+
+    The settings are kept until reset_mlflow_connection is called, so tool
+    calls do not re-read the configuration file. Unless configured, the token
+    budget of tool outputs is derived from the context budget of the
+    configured provider, so outputs fit in its prompts.
+
+    Returns:
+        ToolSettings: The tracking URI, token budget and snapshot settings.
+
+    """
+    global _tool_settings
+
+    if _tool_settings is None:
+        budget = get_tool_token_budget()
+        if budget is None:
+            # The workflow binds these tools, so it is imported lazily
+            from mlflow_assistant.engine.workflow import tool_schema_tokens
+
+            budget = tool_output_budget(get_provider_config(), tool_schema_tokens())
+        _tool_settings = ToolSettings(
+            tracking_uri=get_mlflow_uri(),
+            token_budget=budget,
+            snapshot_path=get_snapshot_path(),
+            snapshot_max_age=get_snapshot_max_age(),
+        )
+    return _tool_settings
+
+
+def get_mlflow_connection() -> MLflowConnection:
+    """Return the shared MLflow connection, connecting on first use.
+
+    The connection is created once per process and reused by every tool, so
+    importing this module never touches the tracking server or the config file.
+    When its health check fails, or a tool call failed to reach the server, it
+    is reconnected with backoff. The backoff runs outside the module lock, so
+    it never delays the connections to other servers.
+
+    Returns:
+        MLflowConnection: The connected, shared MLflow connection.
+
+    Raises:
+        MLflowConnectionError: If the tracking server cannot be reached.
+
+    """
+    global _mlflow_connection
+
+    connection = _mlflow_connection
+    if connection is None:
+        with _mlflow_connection_lock:
+            if _mlflow_connection is None:
+                connection = MLflowConnection(
+                    tracking_uri=get_tool_settings().tracking_uri,
+                )
+                success, message = connection.connect()
+                if not success:
+                    raise MLflowConnectionError(message)
+                _mlflow_connection = connection
+            return _mlflow_connection
+
+    success, message = connection.ensure_connected()
+    if not success:
+        raise MLflowConnectionError(message)
+    return connection
+
+
+def get_client() -> CachedMlflowClient:
+    """Return the shared, caching MLflow client used by all tools."""
+    return get_mlflow_connection().get_cached_client()
+
+
+def get_server_client(server: str) -> CachedMlflowClient:
+    """Return the caching MLflow client of a named tracking server.
+
+    Each configured server gets its own connection, created on first use and
+    reconnected with backoff when it stops answering. Connecting to one
+    server never waits on another.
+
+    Args:
+        server: The server name, as configured under ``mlflow_servers``.
+
+    Returns:
+        CachedMlflowClient: The shared, caching client of that server.
+
+    Raises:
+        ValueError: If the server is not configured.
+        MLflowConnectionError: If the server cannot be reached.
+
+    """
+    servers = get_mlflow_servers()
+    if server not in servers:
+        msg = f"Unknown MLflow server: {server}"
+        raise ValueError(msg)
+
+    tracking_uri = servers[server]
+    connection = _server_connections.get(server)
+    if connection is None or connection.config.tracking_uri != tracking_uri:
+        with _server_connections_lock:
+            server_lock = _server_locks.setdefault(server, threading.Lock())
+        # Only callers of the same server wait for its connection to be created
+        with server_lock:
+            connection = _server_connections.get(server)
+            if connection is None or connection.config.tracking_uri != tracking_uri:
+                replaced = connection
+                connection = MLflowConnection(tracking_uri=tracking_uri, make_default=False)
+                success, message = connection.connect()
+                if not success:
+                    connection.close()
+                    raise MLflowConnectionError(message)
+                with _server_connections_lock:
+                    _server_connections[server] = connection
+                if replaced is not None:
+                    # The server was configured with another URI
+                    replaced.close()
+            return connection.get_cached_client()
+
+    success, message = connection.ensure_connected()
+    if not success:
+        raise MLflowConnectionError(message)
+
+    return connection.get_cached_client()
+
+
+def get_snapshot() -> MetadataSnapshot | None:
+    """Return the local metadata snapshot if it is fresh enough to answer from.
+
+    Returns:
+        The snapshot for the configured tracking URI, or None if it has not been
+        built or is older than the configured maximum age.
+
+    """
+    settings = get_tool_settings()
+    snapshot = MetadataSnapshot(settings.snapshot_path)
+    try:
+        if snapshot.is_fresh(settings.tracking_uri, settings.snapshot_max_age):
+            return snapshot
+    except Exception as e:
+        logger.warning(f"Error reading metadata snapshot: {e!s}")
+    return None
+
+
+def get_local_store() -> LocalFileStore | None:
+    """Return a fast reader for the tracking store when it is a local mlruns directory.
+
+    Returns:
+        The reader if the configured tracking URI is a local file store, None
+        for database and remote tracking servers.
+
+    """
+    tracking_uri = get_tool_settings().tracking_uri
+    return LocalFileStore.from_tracking_uri(tracking_uri) if tracking_uri else None
+
+
+def reset_mlflow_connection() -> None:
+    """Close and drop the shared MLflow connections and settings, so the next tool call reloads them."""
+    global _mlflow_connection, _tool_settings
+
+    with _mlflow_connection_lock, _server_connections_lock:
+        connections = [_mlflow_connection, *_server_connections.values()]
+        _mlflow_connection = None
+        _tool_settings = None
+        _server_connections.clear()
+        _server_locks.clear()
+
+    for connection in connections:
+        if connection is not None:
+            connection.close()
 
 
 @tool
-def list_models(name_contains: str = "", max_results: int = MLFLOW_MAX_RESULTS) -> str:
-    """List all registered models in the MLflow model registry, with optional filtering.
+def list_models(
+    name_contains: str = "", max_results: int = TOOL_PAGE_SIZE, cursor: str = "",
+) -> str:
+    """List registered models in the MLflow model registry, one page at a time.
 
     Args:
         name_contains: Optional filter to only include models whose names contain this string
-        max_results: Maximum number of results to return (default: 100)
+        max_results: Maximum number of models per page (default: 50, at most 100)
+        cursor: The next_cursor returned by a previous call, to fetch the following page with the same filter
 
     Returns:
-        A JSON string containing all registered models matching the criteria.
+        A JSON string containing one page of models matching the criteria, and a
+        next_cursor that is null when there are no more results.
 
     """
     logger.debug(
@@ -48,16 +821,60 @@ def list_models(name_contains: str = "", max_results: int = MLFLOW_MAX_RESULTS)
     )
 
     try:
-        # Get all registered models
-        registered_models = client.search_registered_models(max_results=max_results)
-
-        # Filter by name if specified
-        if name_contains:
-            registered_models = [
-                model
-                for model in registered_models
-                if name_contains.lower() in model.name.lower()
+        page_size = MLflowTools.page_size(max_results)
+        position = MLflowTools.decode_cursor(cursor)
+
+        # Answer from the local snapshot when it is fresh enough
+        if (snapshot := get_snapshot()) is not None and "page_token" not in position:
+            offset = position.get("offset", 0)
+            rows = snapshot.list_models(name_contains, page_size + 1, offset)
+            next_cursor = (
+                MLflowTools.encode_cursor(offset=offset + page_size)
+                if len(rows) > page_size
+                else None
+            )
+            models_info = [
+                {
+                    **model,
+                    "creation_timestamp": MLflowTools.format_timestamp(
+                        model["creation_timestamp"],
+                    ),
+                    "last_updated_timestamp": MLflowTools.format_timestamp(
+                        model["last_updated_timestamp"],
+                    ),
+                    "latest_versions": [
+                        {
+                            **version,
+                            "creation_timestamp": MLflowTools.format_timestamp(
+                                version["creation_timestamp"],
+                            ),
+                        }
+                        for version in model["latest_versions"]
+                    ],
+                }
+                for model in rows[:page_size]
             ]
+            result = {
+                "total_models": len(models_info),
+                "models": models_info,
+                "next_cursor": next_cursor,
+            }
+            return MLflowTools.encode(result)
+
+        if "offset" in position:
+            msg = "Cursor has expired. Repeat the request without a cursor."
+            raise ValueError(msg)
+
+        client = get_client()
+
+        # Get one page of registered models, filtering by name on the server
+        registered_models, next_cursor = MLflowTools.search_page(
+            client.search_registered_models,
+            page_size,
+            position.get("page_token"),
+            filter_string=MLflowTools.name_filter(name_contains) if name_contains else None,
+            keep=MLflowTools.name_matcher(name_contains) if name_contains else None,
+        )
 
         # Create a list to hold model information
         models_info = []
@@ -95,44 +912,94 @@ def list_models(name_contains: str = "", max_results: int = MLFLOW_MAX_RESULTS)
 
             models_info.append(model_info)
 
-        result = {"total_models": len(models_info), "models": models_info}
+        result = {
+            "total_models": len(models_info),
+            "models": models_info,
+            "next_cursor": next_cursor,
+        }
 
-        return json.dumps(result, indent=2)
+        return MLflowTools.encode(result)
 
     except Exception as e:
         error_msg = f"Error listing models: {e!s}"
         logger.error(error_msg, exc_info=True)
-        return json.dumps({"error": error_msg})
+        return MLflowTools.encode({"error": error_msg})
 
 
 @tool
 def list_experiments(
-    name_contains: str = "", max_results: int = MLFLOW_MAX_RESULTS,
+    name_contains: str = "", max_results: int = TOOL_PAGE_SIZE, cursor: str = "",
 ) -> str:
-    """List all experiments in the MLflow tracking server, with optional filtering.
+    """List experiments in the MLflow tracking server, one page at a time.
 
     Args:
         name_contains: Optional filter to only include experiments whose names contain this string
-        max_results: Maximum number of results to return (default: 100)
+        max_results: Maximum number of experiments per page (default: 50, at most 100)
+        cursor: The next_cursor returned by a previous call, to fetch the following page with the same filter
 
     Returns:
-        A JSON string containing all experiments matching the criteria.
+        A JSON string containing one page of experiments matching the criteria,
+        and a next_cursor that is null when there are no more results.
 
     """
     logger.debug(f"Fetching experiments (filter: '{name_contains}', max: {max_results})")
 
     try:
-        # Get all experiments
-        experiments = client.search_experiments()
+        page_size = MLflowTools.page_size(max_results)
+        position = MLflowTools.decode_cursor(cursor)
 
-        # Filter by name if specified
-        if name_contains:
-            experiments = [
-                exp for exp in experiments if name_contains.lower() in exp.name.lower()
+        # Answer from the local snapshot when it is fresh enough, or read a
+        # local file store directly
+        reader = get_snapshot() or get_local_store()
+        if reader is not None and "page_token" not in position:
+            offset = position.get("offset", 0)
+            rows = reader.list_experiments(name_contains, page_size + 1, offset)
+            next_cursor = (
+                MLflowTools.encode_cursor(offset=offset + page_size)
+                if len(rows) > page_size
+                else None
+            )
+            experiments_info = [
+                {
+                    "experiment_id": exp["experiment_id"],
+                    "name": exp["name"],
+                    "artifact_location": exp["artifact_location"],
+                    "lifecycle_stage": exp["lifecycle_stage"],
+                    "creation_time": MLflowTools.format_timestamp(exp["creation_time"]),
+                    "tags": exp["tags"],
+                    "run_count": exp["run_count"],
+                }
+                for exp in rows[:page_size]
             ]
+            result = {
+                "total_experiments": len(experiments_info),
+                "experiments": experiments_info,
+                "next_cursor": next_cursor,
+            }
+            return MLflowTools.encode(result)
+
+        if "offset" in position:
+            msg = "Cursor has expired. Repeat the request without a cursor."
+            raise ValueError(msg)
+
+        connection = get_mlflow_connection()
+        client = connection.get_cached_client()
 
-        # Limit to max_results
-        experiments = experiments[:max_results]
+        # Get one page of experiments, filtering by name on the server
+        experiments, next_cursor = MLflowTools.search_page(
+            client.search_experiments,
+            page_size,
+            position.get("page_token"),
+            filter_string=MLflowTools.name_filter(name_contains) if name_contains else None,
+            keep=MLflowTools.name_matcher(name_contains) if name_contains else None,
+        )
+
+        # Count runs for all experiments concurrently
+        experiment_ids = [exp.experiment_id for exp in experiments]
+        if connection.supports_async():
+            run_counts = MLflowTools.count_runs_async(connection, experiment_ids)
+        else:
+            run_counts = MLflowTools.count_runs(client, experiment_ids)
 
         # Create a list to hold experiment information
         experiments_info = []
@@ -150,56 +1017,50 @@ def list_experiments(
                 "tags": {tag.key: tag.value for tag in exp.tags}
                 if hasattr(exp, "tags")
                 else {},
+                "run_count": run_counts[exp.experiment_id].to_value(),
             }
 
-            # Get the run count for this experiment
-            try:
-                runs = client.search_runs(
-                    experiment_ids=[exp.experiment_id], max_results=1,
-                )
-                if runs:
-                    # Just get the count of runs, not the actual runs
-                    run_count = client.search_runs(
-                        experiment_ids=[exp.experiment_id], max_results=1000,
-                    )
-                    exp_info["run_count"] = len(run_count)
-                else:
-                    exp_info["run_count"] = 0
-            except Exception as e:
-                logger.warning(
-                    f"Error getting run count for experiment {exp.experiment_id}: {e!s}",
-                )
-                exp_info["run_count"] = "Error getting count"
-
             experiments_info.append(exp_info)
 
         result = {
             "total_experiments": len(experiments_info),
             "experiments": experiments_info,
+            "next_cursor": next_cursor,
         }
 
-        return json.dumps(result, indent=2)
+        return MLflowTools.encode(result)
 
     except Exception as e:
         error_msg = f"Error listing experiments: {e!s}"
         logger.error(error_msg, exc_info=True)
-        return json.dumps({"error": error_msg})
+        return MLflowTools.encode({"error": error_msg})
 
 
 @tool
-def get_model_details(model_name: str) -> str:
-    """Get detailed information about a specific registered model.
+def get_model_details(
+    model_name: str, max_versions: int = MODEL_DETAILS_MAX_VERSIONS, cursor: str = "",
+) -> str:
+    """Get detailed information about a specific registered model, one page of versions at a time.
 
     Args:
         model_name: The name of the registered model
+        max_versions: Maximum number of versions per page, most recent first (default: 20, at most 100)
+        cursor: The next_cursor returned by a previous call for the same model, to fetch older versions
 
     Returns:
-        A JSON string containing detailed information about the model.
+        A JSON string containing detailed information about the model and one page
+        of its versions, and a next_cursor that is null when there are no more versions.
 
     """
     logger.debug(f"Fetching details for model: {model_name}")
 
     try:
+        page_size = MLflowTools.page_size(max_versions)
+        offset = MLflowTools.decode_cursor(cursor).get("offset", 0)
+
+        connection = get_mlflow_connection()
+        client = connection.get_cached_client()
+
         # Get the registered model
         model = client.get_registered_model(model_name)
 
@@ -218,10 +1079,39 @@ def get_model_details(model_name: str) -> str:
             "versions": [],
         }
 
-        # Get all versions for this model
-        versions = client.search_model_versions(f"name='{model_name}'")
+        # Get all versions for this model, most recent first
+        versions = sorted(
+            client.search_model_versions(f"name='{model_name}'"),
+            key=lambda version: int(version.version),
+            reverse=True,
+        )
 
-        for version in versions:
+        # Fetch the runs of the versions on this page concurrently
+        page_versions = versions[offset:offset + page_size]
+        run_ids = [version.run_id for version in page_versions if version.run_id]
+        if (local_store := get_local_store()) is not None:
+            runs = {
+                run_id: MLflowTools.run_summary(
+                    run["status"], run.get("start_time"), run.get("end_time"), run["metrics"],
+                )
+                for run_id, run in local_store.get_runs(run_ids).items()
+            }
+        elif connection.supports_async():
+            runs = {
+                run_id: run if isinstance(run, Exception) else MLflowTools.rest_run_summary(run)
+                for run_id, run in connection.run_async(
+                    lambda async_client: async_client.get_runs(run_ids),
+                ).items()
+            }
+        else:
+            runs = {
+                run_id: run if isinstance(run, Exception) else MLflowTools.run_summary(
+                    run.info.status, run.info.start_time, run.info.end_time, run.data.metrics,
+                )
+                for run_id, run in MLflowTools.fetch_runs(client, run_ids).items()
+            }
+
+        for version in page_versions:
             version_info = {
                 "version": version.version,
                 "status": version.status,
@@ -235,40 +1125,558 @@ def get_model_details(model_name: str) -> str:
 
             # Get additional information about the run if available
             if version.run_id:
-                try:
-                    run = client.get_run(version.run_id)
-                    # Extract only essential run information to avoid serialization issues
-                    run_metrics = {}
-                    for k, v in run.data.metrics.items():
-                        try:
-                            run_metrics[k] = float(v)
-                        except ValueError:
-                            run_metrics[k] = str(v)
-
-                    version_info["run"] = {
-                        "status": run.info.status,
-                        "start_time": MLflowTools.format_timestamp(
-                            run.info.start_time,
-                        ),
-                        "end_time": MLflowTools.format_timestamp(run.info.end_time)
-                        if run.info.end_time
-                        else None,
-                        "metrics": run_metrics,
-                    }
-                except Exception as e:
-                    logger.warning(
-                        f"Error getting run details for {version.run_id}: {e!s}",
-                    )
+                run = runs.get(version.run_id)
+                if run is None or isinstance(run, Exception):
                     version_info["run"] = "Error retrieving run details"
+                else:
+                    version_info["run"] = run
 
             model_info["versions"].append(version_info)
 
-        return json.dumps(model_info, indent=2)
+        model_info["total_versions"] = len(versions)
+        model_info["next_cursor"] = (
+            MLflowTools.encode_cursor(offset=offset + page_size)
+            if offset + page_size < len(versions)
+            else None
+        )
+
+        return MLflowTools.encode(model_info)
 
     except Exception as e:
         error_msg = f"Error getting model details: {e!s}"
         logger.error(error_msg, exc_info=True)
-        return json.dumps({"error": error_msg})
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def search_runs(
+    experiment_names: list[str] | None = None,
+    experiment_ids: list[str] | None = None,
+    filter_string: str = "",
+    order_by: list[str] | None = None,
+    columns: list[str] | None = None,
+    max_results: int = SEARCH_RUNS_TOP_K,
+    cursor: str = "",
+) -> str:
+    """Search runs with server-side filtering and ordering, e.g. to find the best runs.
+
+    Args:
+        experiment_names: Names of the experiments to search. If neither names nor IDs are given, all experiments are searched
+        experiment_ids: IDs of the experiments to search
+        filter_string: MLflow search filter, e.g. "metrics.f1 > 0.8 and params.model = 'xgboost'"
+        order_by: Ordering clauses, e.g. ["metrics.f1 DESC"]
+        columns: Columns to return, e.g. ["metrics.f1", "params.max_depth", "tags.mlflow.runName"]. Defaults to all metrics
+        max_results: Number of top runs to return (default: 10, at most 100)
+        cursor: The next_cursor returned by a previous call, to fetch the following runs with the same arguments
+
+    Returns:
+        A JSON string containing the matching runs, in order, and a next_cursor
+        that is null when there are no more results.
+
+    """
+    logger.debug(
+        f"Searching runs (experiments: {experiment_names or experiment_ids}, "
+        f"filter: '{filter_string}', order_by: {order_by}, max: {max_results})",
+    )
+
+    try:
+        page_size = MLflowTools.page_size(max_results)
+        position = MLflowTools.decode_cursor(cursor)
+
+        client = get_client()
+
+        # Resolve the experiments to search
+        ids = list(experiment_ids or [])
+        for name in experiment_names or []:
+            experiment = client.get_experiment_by_name(name)
+            if experiment is None:
+                return MLflowTools.encode({"error": f"Experiment not found: {name}"})
+            ids.append(experiment.experiment_id)
+        if not ids:
+            ids = [exp.experiment_id for exp in MLflowTools.iter_search(client.search_experiments)]
+
+        # Let the server filter, order and limit the runs
+        runs, next_cursor = MLflowTools.search_page(
+            client.search_runs,
+            page_size,
+            position.get("page_token"),
+            experiment_ids=ids,
+            filter_string=filter_string,
+            order_by=order_by or None,
+        )
+
+        runs_info = []
+        for run in runs:
+            run_info = {
+                "run_id": run.info.run_id,
+                "run_name": run.info.run_name,
+                "experiment_id": run.info.experiment_id,
+                "status": run.info.status,
+                "start_time": MLflowTools.format_timestamp(run.info.start_time),
+            }
+            if columns:
+                for column in columns:
+                    run_info[column] = MLflowTools.run_column(run, column)
+            else:
+                for key, value in run.data.metrics.items():
+                    run_info[f"metrics.{key}"] = value
+            runs_info.append(run_info)
+
+        result = {
+            "total_runs": len(runs_info),
+            "runs": runs_info,
+            "next_cursor": next_cursor,
+        }
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error searching runs: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def compare_runs(
+    run_ids: list[str], lower_is_better: list[str] | None = None,
+) -> str:
+    """Compare the metrics and params of two or more runs.
+
+    Args:
+        run_ids: IDs of the runs to compare. The first run is the baseline for deltas
+        lower_is_better: Metric names where lower is better. Names containing loss, error, rmse, mse, mae, etc. are detected automatically
+
+    Returns:
+        A JSON string with a per-metric summary (winner, best and worst values) and,
+        for each run ordered by mean rank, its metrics, ranks, deltas from the
+        baseline and the params that differ between runs.
+
+    """
+    logger.debug(f"Comparing runs: {run_ids}")
+
+    try:
+        run_ids = list(dict.fromkeys(run_ids))
+        if len(run_ids) < 2:
+            return MLflowTools.encode({"error": "At least two distinct run IDs are required"})
+        if len(run_ids) > COMPARE_RUNS_MAX:
+            return MLflowTools.encode(
+                {"error": f"At most {COMPARE_RUNS_MAX} runs can be compared at once"},
+            )
+
+        client = get_client()
+
+        # Fetch all runs in batched queries
+        found = MLflowTools.search_runs_by_id(client, run_ids)
+        missing = [run_id for run_id in run_ids if run_id not in found]
+        runs = [found[run_id] for run_id in run_ids if run_id in found]
+        if len(runs) < 2:
+            return MLflowTools.encode({"error": f"Runs not found: {missing}"})
+
+        comparison = compare_metrics(
+            [run.data.metrics for run in runs], lower_is_better or (),
+        )
+        params = differing_params([run.data.params for run in runs])
+
+        def _value(value: float) -> float | None:
+            return None if np.isnan(value) else float(value)
+
+        metric_summary = []
+        for j, name in enumerate(comparison.metric_names):
+            column = comparison.values[:, j]
+            winner = comparison.winners[j]
+            reported = column[~np.isnan(column)]
+            metric_summary.append({
+                "metric": name,
+                "goal": "min" if comparison.lower_is_better[j] else "max",
+                "winner": runs[winner].info.run_id if winner is not None else None,
+                "best": _value(column[winner]) if winner is not None else None,
+                "worst": _value(
+                    reported.max() if comparison.lower_is_better[j] else reported.min(),
+                ) if reported.size else None,
+                "runs_reporting": int(reported.size),
+            })
+
+        runs_info = []
+        for i in np.argsort(comparison.mean_ranks, kind="stable"):
+            run = runs[i]
+            runs_info.append({
+                "run_id": run.info.run_id,
+                "run_name": run.info.run_name,
+                "mean_rank": _value(comparison.mean_ranks[i]),
+                "metrics": {
+                    name: _value(comparison.values[i, j])
+                    for j, name in enumerate(comparison.metric_names)
+                },
+                "ranks": {
+                    name: _value(comparison.ranks[i, j])
+                    for j, name in enumerate(comparison.metric_names)
+                },
+                "deltas": {
+                    name: _value(comparison.deltas[i, j])
+                    for j, name in enumerate(comparison.metric_names)
+                } if i else {},
+                "params": {name: run.data.params.get(name) for name in params},
+            })
+
+        result = {
+            "baseline_run_id": runs[0].info.run_id,
+            "total_runs": len(runs),
+            "missing_run_ids": missing,
+            "metrics": metric_summary,
+            "runs": runs_info,
+        }
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error comparing runs: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def get_metric_history(
+    run_id: str,
+    metric_key: str,
+    max_points: int = METRIC_HISTORY_MAX_POINTS,
+    method: str = "lttb",
+) -> str:
+    """Get the history of a metric over training steps, downsampled to a fixed number of points.
+
+    Args:
+        run_id: The ID of the run
+        metric_key: The name of the metric, e.g. "val_loss"
+        max_points: Maximum number of points to return (default: 100, at most 500)
+        method: "lttb" to preserve the overall curve shape, or "minmax" to keep every spike and dip
+
+    Returns:
+        A JSON string with summary statistics of the full history and the
+        downsampled (step, value) points.
+
+    """
+    logger.debug(f"Fetching history of metric '{metric_key}' for run {run_id}")
+
+    try:
+        if method not in {"lttb", "minmax"}:
+            return MLflowTools.encode({"error": f"Unknown downsampling method: {method}"})
+        max_points = max(3, min(max_points, METRIC_HISTORY_POINT_LIMIT))
+
+        client = get_client()
+
+        history = client.get_metric_history(run_id, metric_key)
+        if not history:
+            return MLflowTools.encode(
+                {"error": f"No history for metric '{metric_key}' in run {run_id}"},
+            )
+
+        # Order the points by step, then by logging time within a step
+        step_array = np.fromiter((m.step for m in history), dtype=np.int64, count=len(history))
+        value_array = np.fromiter(
+            (m.value for m in history), dtype=np.float64, count=len(history),
+        )
+        timestamps = np.fromiter(
+            (m.timestamp for m in history), dtype=np.int64, count=len(history),
+        )
+        order = np.lexsort((timestamps, step_array))
+        step_array = step_array[order]
+        value_array = value_array[order]
+
+        if method == "lttb":
+            selected = lttb(step_array, value_array, max_points)
+        else:
+            selected = min_max(value_array, max_points)
+
+        finite = np.isfinite(value_array)
+        lowest = int(np.argmin(np.where(finite, value_array, np.inf)))
+        highest = int(np.argmax(np.where(finite, value_array, -np.inf)))
+
+        result = {
+            "run_id": run_id,
+            "metric": metric_key,
+            "total_points": len(value_array),
+            "returned_points": len(selected),
+            "method": method,
+            "first": {"step": int(step_array[0]), "value": float(value_array[0])},
+            "last": {"step": int(step_array[-1]), "value": float(value_array[-1])},
+            "min": {"step": int(step_array[lowest]), "value": float(value_array[lowest])},
+            "max": {"step": int(step_array[highest]), "value": float(value_array[highest])},
+            "points": {
+                "columns": ["step", "value"],
+                "rows": [
+                    [int(step_array[i]), float(value_array[i])] for i in selected
+                ],
+            },
+        }
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error getting metric history: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def search_all_servers(
+    entity: str = "experiments",
+    name_contains: str = "",
+    filter_string: str = "",
+    order_by: list[str] | None = None,
+    max_results: int = SEARCH_RUNS_TOP_K,
+) -> str:
+    """Search experiments, registered models or runs across all configured MLflow servers at once.
+
+    Args:
+        entity: What to search: "experiments", "models" or "runs"
+        name_contains: For experiments and models, only include names containing this string
+        filter_string: For runs, an MLflow search filter, e.g. "metrics.f1 > 0.8"
+        order_by: For runs, ordering clauses, e.g. ["metrics.f1 DESC"]. Results are merged across servers in this order
+        max_results: Maximum number of results per server and in the merged output (default: 10, at most 100)
+
+    Returns:
+        A JSON string with the merged results, each tagged with its server, and
+        the servers that failed or did not answer in time.
+
+    """
+    logger.debug(
+        f"Searching {entity} across servers (name: '{name_contains}', "
+        f"filter: '{filter_string}', order_by: {order_by}, max: {max_results})",
+    )
+
+    try:
+        if entity not in FEDERATION_ENTITIES:
+            return MLflowTools.encode({
+                "error": f"Unknown entity: {entity}. Use one of {', '.join(FEDERATION_ENTITIES)}",
+            })
+
+        servers = list(get_mlflow_servers())
+        if not servers:
+            return MLflowTools.encode({
+                "error": "No MLflow servers configured. Add them under mlflow_servers in the config file.",
+            })
+
+        page_size = MLflowTools.page_size(max_results)
+        name_filter = MLflowTools.name_filter(name_contains) if name_contains else None
+        name_matcher = MLflowTools.name_matcher(name_contains) if name_contains else None
+
+        def query(client: CachedMlflowClient) -> list[dict[str, Any]]:
+            if entity == "experiments":
+                experiments, _ = MLflowTools.search_page(
+                    client.search_experiments, page_size,
+                    filter_string=name_filter, keep=name_matcher,
+                )
+                return [
+                    {
+                        "experiment_id": exp.experiment_id,
+                        "name": exp.name,
+                        "lifecycle_stage": exp.lifecycle_stage,
+                        "creation_time": MLflowTools.format_timestamp(exp.creation_time),
+                    }
+                    for exp in experiments
+                ]
+
+            if entity == "models":
+                models, _ = MLflowTools.search_page(
+                    client.search_registered_models, page_size,
+                    filter_string=name_filter, keep=name_matcher,
+                )
+                return [
+                    {
+                        "name": model.name,
+                        "description": model.description,
+                        "last_updated": MLflowTools.format_timestamp(
+                            model.last_updated_timestamp,
+                        ),
+                    }
+                    for model in models
+                ]
+
+            experiment_ids = [
+                exp.experiment_id for exp in MLflowTools.iter_search(client.search_experiments)
+            ]
+            runs, _ = MLflowTools.search_page(
+                client.search_runs,
+                page_size,
+                experiment_ids=experiment_ids,
+                filter_string=filter_string,
+                order_by=order_by or None,
+            )
+            rows = []
+            for run in runs:
+                row = {
+                    "run_id": run.info.run_id,
+                    "run_name": run.info.run_name,
+                    "experiment_id": run.info.experiment_id,
+                    "status": run.info.status,
+                    "start_time": MLflowTools.format_timestamp(run.info.start_time),
+                }
+                for key, value in run.data.metrics.items():
+                    row[f"metrics.{key}"] = value
+                rows.append(row)
+            return rows
+
+        results, errors = MLflowTools.across_servers(servers, query)
+
+        # Merge the per-server results, keeping the configured server order
+        merged = [
+            {"server": server, **row}
+            for server in servers
+            for row in results.get(server, [])
+        ]
+        if entity == "runs" and order_by:
+            merged = MLflowTools.sort_rows(merged, order_by[0])
+
+        result = {
+            "total": len(merged[:page_size]),
+            entity: merged[:page_size],
+            "servers_queried": len(servers),
+            "server_errors": errors,
+        }
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error searching across servers: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def list_artifacts(
+    run_id: str,
+    path: str = "",
+    max_depth: int = ARTIFACT_LIST_MAX_DEPTH,
+    max_entries: int = ARTIFACT_LIST_MAX_ENTRIES,
+) -> str:
+    """List the artifact files and directories of a run without downloading them.
+
+    Args:
+        run_id: The ID of the run
+        path: Directory to list, relative to the run's artifact root (default: the root)
+        max_depth: How many directory levels to descend (default: 3)
+        max_entries: Maximum number of entries to return (default: 100, at most 500)
+
+    Returns:
+        A JSON string with the artifacts, breadth-first, and whether more
+        entries exist beyond max_entries.
+
+    """
+    logger.debug(f"Listing artifacts of run {run_id} (path: '{path}', depth: {max_depth})")
+
+    try:
+        max_entries = max(1, min(max_entries, ARTIFACT_LIST_ENTRY_LIMIT))
+        client = get_client()
+
+        walk = MLflowTools.walk_artifacts(client, run_id, path, max(1, max_depth))
+        entries = list(islice(walk, max_entries + 1))
+
+        artifacts_info = [
+            {
+                "path": info.path,
+                "is_dir": info.is_dir,
+                "file_size": info.file_size,
+                "depth": depth,
+            }
+            for info, depth in entries[:max_entries]
+        ]
+
+        result = {
+            "run_id": run_id,
+            "total_listed": len(artifacts_info),
+            "has_more": len(entries) > max_entries,
+            "artifacts": artifacts_info,
+        }
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error listing artifacts: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
+
+
+@tool
+def preview_artifact(
+    run_id: str, path: str, max_bytes: int = ARTIFACT_PREVIEW_BYTES, offset: int = 0,
+) -> str:
+    """Read the beginning, or a byte range, of a run artifact file.
+
+    Args:
+        run_id: The ID of the run
+        path: Path of the file, relative to the run's artifact root, e.g. "model/MLmodel"
+        max_bytes: Maximum number of bytes to read (default: 2048, at most 16384)
+        offset: Index of the first byte to read, e.g. the next_offset of a previous call
+
+    Returns:
+        A JSON string with the text content (or a hex preview for binary files),
+        the file size when known, and the next_offset to continue reading.
+
+    """
+    logger.debug(f"Previewing artifact '{path}' of run {run_id} (offset: {offset})")
+
+    try:
+        max_bytes = max(1, min(max_bytes, ARTIFACT_PREVIEW_MAX_BYTES))
+        offset = max(0, offset)
+
+        client = get_client()
+        artifact_uri = client.get_run(run_id).info.artifact_uri
+
+        if (local_path := resolve_local_artifact(artifact_uri, path)) is not None:
+            # Local artifact store: memory-map the file in place
+            if local_path.is_dir():
+                return MLflowTools.encode(
+                    {"error": f"{path} is a directory. Use list_artifacts instead."},
+                )
+            chunk = read_local_range(local_path, offset, max_bytes)
+        elif is_proxied_artifact(artifact_uri):
+            # Served by the tracking server: stream only the requested range
+            tracking_uri = get_mlflow_connection().config.tracking_uri
+            chunk = stream_proxied_range(tracking_uri, artifact_uri, path, offset, max_bytes)
+        else:
+            # Other stores only support whole-file downloads, so bound their size
+            parent = posixpath.dirname(path) or None
+            info = next(
+                (info for info in client.list_artifacts(run_id, parent) if info.path == path),
+                None,
+            )
+            if info is None:
+                return MLflowTools.encode({"error": f"Artifact not found: {path}"})
+            if info.is_dir:
+                return MLflowTools.encode(
+                    {"error": f"{path} is a directory. Use list_artifacts instead."},
+                )
+            if (info.file_size or 0) > ARTIFACT_DOWNLOAD_MAX_BYTES:
+                return MLflowTools.encode({
+                    "error": f"{path} is too large to preview from this artifact store "
+                    f"({info.file_size} bytes)",
+                })
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                local_file = client.download_artifacts(run_id, path, tmp_dir)
+                chunk = read_local_range(Path(local_file), offset, max_bytes)
+
+        end = offset + len(chunk.data)
+        has_more = len(chunk.data) == max_bytes and (chunk.size is None or end < chunk.size)
+
+        result = {
+            "run_id": run_id,
+            "path": path,
+            "size": chunk.size,
+            "offset": offset,
+            "bytes_read": len(chunk.data),
+            "next_offset": end if has_more else None,
+        }
+        if (text := MLflowTools.decode_text(chunk.data)) is not None:
+            result["content"] = text
+        else:
+            result["binary"] = True
+            result["hex_preview"] = chunk.data[:ARTIFACT_HEX_PREVIEW_BYTES].hex()
+
+        return MLflowTools.encode(result)
+
+    except Exception as e:
+        error_msg = f"Error previewing artifact: {e!s}"
+        logger.error(error_msg, exc_info=True)
+        return MLflowTools.encode({"error": error_msg})
 
 
 @tool
@@ -282,50 +1690,57 @@ def get_system_info() -> str:
     logger.debug("Getting MLflow system information")
 
     try:
+        # Connect first, so the URIs are those of the configured store rather
+        # than MLflow's defaults
+        connection = get_mlflow_connection()
         info = {
             "mlflow_version": mlflow.__version__,
-            "tracking_uri": mlflow.get_tracking_uri(),
+            "tracking_uri": connection.config.tracking_uri,
             "registry_uri": mlflow.get_registry_uri(),
-            "artifact_uri": mlflow.get_artifact_uri(),
             "python_version": sys.version,
             "server_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
+        # Answer counts from the local snapshot when it is fresh enough, or read
+        # a local file store directly
+        if (reader := get_snapshot() or get_local_store()) is not None:
+            info.update(reader.get_counts())
+            return MLflowTools.encode(info)
+
+        client = connection.get_cached_client()
+
         # Get experiment count
         try:
-            experiments = client.search_experiments()
-            info["experiment_count"] = len(experiments)
+            experiment_ids = [
+                exp.experiment_id
+                for exp in MLflowTools.iter_search(client.search_experiments)
+            ]
+            info["experiment_count"] = len(experiment_ids)
         except Exception as e:
             logger.warning(f"Error getting experiment count: {e!s}")
             info["experiment_count"] = "Error retrieving count"
+            experiment_ids = None
 
         # Get model count
         try:
-            models = client.search_registered_models()
-            info["model_count"] = len(models)
+            models = MLflowTools.iter_search(client.search_registered_models)
+            info["model_count"] = sum(1 for _ in models)
         except Exception as e:
             logger.warning(f"Error getting model count: {e!s}")
             info["model_count"] = "Error retrieving count"
 
-        # Get active run count
-        try:
-            active_runs = 0
-            for exp in experiments:
-                runs = client.search_runs(
-                    experiment_ids=[exp.experiment_id],
-                    filter_string="attributes.status = 'RUNNING'",
-                    max_results=1000,
-                )
-                active_runs += len(runs)
-
-            info["active_runs"] = active_runs
-        except Exception as e:
-            logger.warning(f"Error getting active run count: {e!s}")
+        # Get active run count with chunked multi-experiment queries
+        if experiment_ids is None:
             info["active_runs"] = "Error retrieving count"
+        else:
+            active_runs = MLflowTools.count_runs_across(
+                client, experiment_ids, filter_string=ACTIVE_RUNS_FILTER,
+            )
+            info["active_runs"] = active_runs.to_value()
 
-        return json.dumps(info, indent=2)
+        return MLflowTools.encode(info)
 
     except Exception as e:
         error_msg = f"Error getting system info: {e!s}"
         logger.error(error_msg, exc_info=True)
-        return json.dumps({"error": error_msg})
+        return MLflowTools.encode({"error": error_msg})
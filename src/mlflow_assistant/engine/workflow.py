@@ -3,26 +3,54 @@
 This workflow supports tool-augmented generation: tool calls are detected and executed in a loop
 until a final AI response is produced.
 """
+import json
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from functools import cache
 from typing import Annotated, Any
 
-from langchain_core.messages import BaseMessage
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
-from langgraph.prebuilt import ToolNode, tools_condition
+from langgraph.prebuilt import tools_condition
 from mlflow_assistant.engine.definitions import (
+    STATE_KEY_CONTEXT_BUDGET,
     STATE_KEY_MESSAGES,
     STATE_KEY_PROVIDER_CONFIG,
+    STATE_KEY_SUMMARY,
+    TOOL_CALL_TIMEOUT,
+    TOOL_MAX_CONCURRENCY,
+    WORKFLOW_CACHE_MAX_SIZE,
 )
 from mlflow_assistant.providers import AIProvider
-from mlflow_assistant.engine.tools import get_model_details, get_system_info, list_experiments, list_models
+from mlflow_assistant.engine.context_budget import fit_to_budget, prompt_budget
+from mlflow_assistant.engine.encoder import estimate_tokens
+from mlflow_assistant.engine.memory import compact_history, extractive_summary, summarize_with_model
+from mlflow_assistant.engine.tool_cache import ToolCallCache
+from mlflow_assistant.engine.tool_node import ParallelToolNode
+from mlflow_assistant.utils.config import get_tool_max_concurrency, get_tool_timeout
+from mlflow_assistant.engine.tools import compare_runs, get_metric_history, get_model_details, get_system_info, list_artifacts, list_experiments, list_models, preview_artifact, search_all_servers, search_runs
 from typing_extensions import TypedDict
 
 # Configure logging to ensure output appears in console
 logger = logging.getLogger("mlflow_assistant.engine.workflow")
 
 # Define available tools
-tools = [list_models, list_experiments, get_model_details, get_system_info]
+tools = [list_models, list_experiments, get_model_details, get_system_info, search_runs, compare_runs, get_metric_history, search_all_servers, list_artifacts, preview_artifact]
+
+# Compiled workflows shared by every query of the process
+_workflow_cache: OrderedDict[tuple, Any] = OrderedDict()
+_workflow_cache_lock = threading.Lock()
+
+
+@cache
+def tool_schema_tokens() -> int:
+    """Estimate the tokens of the tool schemas bound to every model call."""
+    return estimate_tokens(json.dumps([convert_to_openai_tool(tool) for tool in tools]))
 
 
 # Define the state schema
@@ -32,33 +60,120 @@ class State(TypedDict):
     messages: Annotated[list[BaseMessage], add_messages]
     provider_config: dict[str, Any]  # Model/provider configuration
     mlflow_uri: str  # MLflow URI
+    summary: str  # Summary of earlier turns removed from the history
+    context_budget: dict[str, Any]  # How the last prompt was fitted to its budget
 
 
 # Workflow creation function
-def create_workflow():
-    """Create and return a compiled LangGraph workflow."""
+def create_workflow(
+    tool_cache: ToolCallCache | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+):
+    """Create and return a compiled LangGraph workflow.
+
+    Args:
+        tool_cache: Optional session cache through which tool calls are memoized.
+        checkpointer: Optional checkpointer keeping the conversation history
+            between queries.
+
+    """
     graph_builder = StateGraph(State)
 
+    def compact(state: State) -> dict[str, Any] | None:
+        """Keep the conversation history bounded before the model is called."""
+        provider_config = state.get(STATE_KEY_PROVIDER_CONFIG, {})
+
+        def summarize(summary: str, messages: list[BaseMessage]) -> str:
+            try:
+                model = AIProvider.get(provider_config).langchain_model()
+                return summarize_with_model(model, summary, messages)
+            except Exception as e:
+                logger.warning(f"Falling back to an extractive summary: {e}")
+                return extractive_summary(summary, messages)
+
+        # Nodes must return None rather than an empty update
+        return compact_history(
+            state[STATE_KEY_MESSAGES], state.get(STATE_KEY_SUMMARY, ""), summarize,
+        ) or None
+
     def call_model(state: State) -> State:
         """Call the AI model and return updated state with response."""
         messages = state[STATE_KEY_MESSAGES]
         provider_config = state.get(STATE_KEY_PROVIDER_CONFIG, {})
+        prompt = messages
+        if summary := state.get(STATE_KEY_SUMMARY):
+            prompt = [SystemMessage(content=f"Summary of the earlier conversation:\n{summary}"), *messages]
+        budget = prompt_budget(provider_config, tool_schema_tokens())
+        prompt, report = fit_to_budget(prompt, budget)
         try:
-            provider = AIProvider.create(provider_config)
-            model = provider.langchain_model().bind_tools(tools)
-            response = model.invoke(messages)
-            return {**state, STATE_KEY_MESSAGES: [response]}
+            model = AIProvider.get(provider_config).bound_model(tools)
+            response = model.invoke(prompt)
+            return {**state, STATE_KEY_MESSAGES: [response], STATE_KEY_CONTEXT_BUDGET: asdict(report)}
         except Exception as e:
             logger.error(f"Error generating response: {e}", exc_info=True)
             return {**state, STATE_KEY_MESSAGES: messages}
 
     # Add nodes
-    graph_builder.add_node("tools", ToolNode(tools))
+    node_tools = [tool_cache.wrap(tool) for tool in tools] if tool_cache else tools
+    max_concurrency = get_tool_max_concurrency()
+    timeout = get_tool_timeout()
+    graph_builder.add_node("tools", ParallelToolNode(
+        node_tools,
+        max_concurrency=TOOL_MAX_CONCURRENCY if max_concurrency is None else max_concurrency,
+        timeout=TOOL_CALL_TIMEOUT if timeout is None else timeout,
+    ))
     graph_builder.add_node("model", call_model)
+    graph_builder.add_node("compact", compact)
 
     # Define graph transitions
+    graph_builder.add_edge("compact", "model")
     graph_builder.add_edge("tools", "model")
     graph_builder.add_conditional_edges("model", tools_condition)
-    graph_builder.set_entry_point("model")
+    graph_builder.set_entry_point("compact")
+
+    return graph_builder.compile(checkpointer=checkpointer)
+
+
+def get_workflow(
+    tool_cache: ToolCallCache | None = None,
+    checkpointer: BaseCheckpointSaver | None = None,
+):
+    """Return a compiled workflow, compiling it only once per process.
+
+    Compiled graphs hold no per-query state, so they are reused by every query
+    and by concurrent callers. The provider configuration is read from the
+    state of each query, so graphs are only keyed by the tool set, the session
+    tool cache and the checkpointer. The least recently used graph is dropped
+    once more than WORKFLOW_CACHE_MAX_SIZE are cached.
+
+    Args:
+        tool_cache: Optional session cache through which tool calls are memoized.
+        checkpointer: Optional checkpointer keeping the conversation history.
+
+    Returns:
+        The compiled workflow.
+
+    """
+    key = (
+        tuple(tool.name for tool in tools),
+        tool_cache,
+        checkpointer,
+    )
+    # Compile under the lock so concurrent callers never build the same graph twice
+    with _workflow_cache_lock:
+        workflow = _workflow_cache.get(key)
+        if workflow is None:
+            logger.debug("Compiling workflow")
+            workflow = create_workflow(tool_cache, checkpointer)
+            _workflow_cache[key] = workflow
+            if len(_workflow_cache) > WORKFLOW_CACHE_MAX_SIZE:
+                _workflow_cache.popitem(last=False)
+        else:
+            _workflow_cache.move_to_end(key)
+        return workflow
+
 
-    return graph_builder.compile()
+def clear_workflow_cache() -> None:
+    """Drop every cached workflow, e.g. after the tool settings changed."""
+    with _workflow_cache_lock:
+        _workflow_cache.clear()
@@ -1,6 +1,11 @@
 """Base class for AI providers."""
+import hashlib
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import Any
 from typing import ClassVar
 
@@ -13,7 +18,7 @@ from mlflow_assistant.utils.config import (
     Provider,
 )
 
-from .definitions import ParameterKeys
+from .definitions import PROVIDER_CACHE_MAX_SIZE, ParameterKeys
 
 logger = logging.getLogger("mlflow_assistant.engine.base")
 
@@ -24,6 +29,10 @@ class AIProvider(ABC):
     # Registry for provider classes
     _providers: ClassVar[dict[str, type["AIProvider"]]] = {}
 
+    # Provider instances shared across graph steps, queries and threads
+    _instances: ClassVar[OrderedDict[str, "AIProvider"]] = OrderedDict()
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init_subclass__(cls, **kwargs):
         """Auto-register provider subclasses."""
         super().__init_subclass__(**kwargs)
@@ -37,6 +46,72 @@ class AIProvider(ABC):
     def langchain_model(self):
         """Get the underlying LangChain model."""
 
+    @staticmethod
+    def config_key(config: dict[str, Any]) -> str:
+        """Hash a provider configuration, so API keys are not kept as cache keys."""
+        serialized = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    @classmethod
+    def get(cls, config: dict[str, Any]) -> "AIProvider":
+        """Get the provider for a configuration, creating it on first use.
+
+        Reusing the provider keeps its LangChain model, and the HTTP connections
+        it holds to the LLM backend, warm between model calls. The least recently
+        used provider is dropped once more than PROVIDER_CACHE_MAX_SIZE are kept.
+
+        Args:
+            config: Provider configuration.
+
+        Returns:
+            AIProvider: The shared provider instance.
+
+        """
+        key = cls.config_key(config)
+        with cls._instances_lock:
+            provider = cls._instances.get(key)
+            if provider is not None:
+                cls._instances.move_to_end(key)
+                return provider
+
+        # Create outside the lock, clients may be slow to construct
+        provider = cls.create(config)
+        with cls._instances_lock:
+            # Keep the instance of a concurrent caller that got there first
+            provider = cls._instances.setdefault(key, provider)
+            if len(cls._instances) > PROVIDER_CACHE_MAX_SIZE:
+                cls._instances.popitem(last=False)
+        return provider
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached provider instance."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    def bound_model(self, tools: Sequence[Any]):
+        """Get the LangChain model bound to a set of tools.
+
+        Binding converts every tool schema, so the result is kept per tool set.
+        Bound models are immutable and safe to invoke from several threads.
+
+        Args:
+            tools: The tools the model can call.
+
+        Returns:
+            The model with the tools bound.
+
+        """
+        key = tuple(tool.name for tool in tools)
+        with AIProvider._instances_lock:
+            bound_models = self.__dict__.setdefault("_bound_models", {})
+            model = bound_models.get(key)
+        if model is None:
+            model = self.langchain_model().bind_tools(list(tools))
+            with AIProvider._instances_lock:
+                model = bound_models.setdefault(key, model)
+        return model
+
     @classmethod
     def create(cls, config: dict[str, Any]) -> "AIProvider":
         """Create an AI provider based on configuration."""
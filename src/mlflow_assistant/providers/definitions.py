@@ -4,6 +4,9 @@ from typing import ClassVar
 # Defaults Ollama
 FALLBACK_MODELS = ["llama2", "mistral", "gemma", "phi"]
 
+# Maximum number of provider instances kept for reuse
+PROVIDER_CACHE_MAX_SIZE = 8
+
 # Databricks cerdentials
 DATABRICKS_CREDENTIALS = ["DATABRICKS_TOKEN", "DATABRICKS_HOST"]
 
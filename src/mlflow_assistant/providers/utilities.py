@@ -3,7 +3,7 @@ import logging
 import subprocess  # noqa: S404
 
 import shutil
-import requests
+from mlflow_assistant.core.http import get_probe_session
 from mlflow_assistant.utils.constants import DEFAULT_OLLAMA_URI
 
 from .definitions import FALLBACK_MODELS
@@ -14,7 +14,7 @@ logger = logging.getLogger("mlflow_assistant.engine.utilities")
 def verify_ollama_running(uri: str = DEFAULT_OLLAMA_URI) -> bool:
     """Verify if Ollama is running at the given URI."""
     try:
-        response = requests.get(f"{uri}/api/tags", timeout=2)
+        response = get_probe_session().get(f"{uri}/api/tags", timeout=2)
         return response.status_code == 200
     except Exception:
         return False
@@ -24,7 +24,7 @@ def get_ollama_models(uri: str = DEFAULT_OLLAMA_URI) -> list:
     """Fetch the list of available Ollama models."""
     # Try using direct API call first
     try:
-        response = requests.get(f"{uri}/api/tags", timeout=10)
+        response = get_probe_session().get(f"{uri}/api/tags", timeout=10)
         if response.status_code == 200:
             data = response.json()
             models = [m.get("name") for m in data.get("models", [])]
@@ -10,9 +10,11 @@ from pathlib import Path
 from typing import Any
 import logging
 import configparser
+from dataclasses import fields
 
 from .constants import (
     CONFIG_KEY_MLFLOW_URI,
+    CONFIG_KEY_MLFLOW_SERVERS,
     CONFIG_KEY_PROVIDER,
     CONFIG_KEY_TYPE,
     CONFIG_KEY_MODEL,
@@ -25,9 +27,22 @@ from .constants import (
     CONFIG_DIRNAME,
     CONFIG_FILENAME,
     CONFIG_KEY_PROFILE,
+    CONFIG_KEY_SNAPSHOT_MAX_AGE,
+    CONFIG_KEY_TOOL_TOKEN_BUDGET,
+    CONFIG_KEY_CONTEXT_TOKEN_BUDGET,
+    CONFIG_KEY_HTTP_POOL,
+    CONFIG_KEY_TOOL_MAX_CONCURRENCY,
+    CONFIG_KEY_TOOL_TIMEOUT,
+    CONFIG_KEY_MEMORY,
     DEFAULT_DATABRICKS_CONFIG_FILE,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    MEMORY_BACKEND_MEMORY,
+    MEMORY_BACKENDS,
+    MEMORY_FILENAME,
     ENVIRONMENT_VARIABLES,
+    SNAPSHOT_FILENAME,
 )
+from .definitions import HttpPoolConfig
 
 logger = logging.getLogger("mlflow_assistant.utils.config")
 
@@ -101,6 +116,115 @@ def get_mlflow_uri() -> str | None:
     return config.get(CONFIG_KEY_MLFLOW_URI)
 
 
+def get_mlflow_servers() -> dict[str, str]:
+    """Get the named MLflow tracking servers used by federated queries.
+
+    Returns:
+        Dict[str, str]: Tracking URI by server name, empty if none are configured
+
+    """
+    config = load_config()
+    servers = config.get(CONFIG_KEY_MLFLOW_SERVERS) or {}
+    return {str(name): str(uri) for name, uri in servers.items()}
+
+
+def get_snapshot_path() -> Path:
+    """Get the path of the local metadata snapshot.
+
+    Returns:
+        Path: The SQLite snapshot file inside the configuration directory
+
+    """
+    return CONFIG_DIR / SNAPSHOT_FILENAME
+
+
+def get_memory_backend() -> str:
+    """Get the backend storing the conversation memory of chat sessions.
+
+    Returns:
+        str: One of 'memory' (the session only), 'sqlite' (kept across
+        sessions) or 'off'
+
+    """
+    config = load_config()
+    backend = str(config.get(CONFIG_KEY_MEMORY, MEMORY_BACKEND_MEMORY)).lower()
+    if backend not in MEMORY_BACKENDS:
+        logger.warning(f"Unknown memory backend '{backend}', using '{MEMORY_BACKEND_MEMORY}'")
+        return MEMORY_BACKEND_MEMORY
+    return backend
+
+
+def get_memory_path() -> Path:
+    """Get the path of the SQLite conversation memory.
+
+    Returns:
+        Path: The SQLite memory file inside the configuration directory
+
+    """
+    return CONFIG_DIR / MEMORY_FILENAME
+
+
+def get_snapshot_max_age() -> float:
+    """Get the maximum age at which the metadata snapshot is used by tools.
+
+    Returns:
+        float: Maximum snapshot age in seconds
+
+    """
+    config = load_config()
+    return float(config.get(CONFIG_KEY_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE))
+
+
+def get_tool_token_budget() -> int | None:
+    """Get the token budget applied to each tool output.
+
+    Returns:
+        Optional[int]: The configured budget, or None to use the engine default
+
+    """
+    config = load_config()
+    budget = config.get(CONFIG_KEY_TOOL_TOKEN_BUDGET)
+    return int(budget) if budget is not None else None
+
+
+def get_tool_max_concurrency() -> int | None:
+    """Get the maximum number of tool calls of one model turn run at once.
+
+    Returns:
+        Optional[int]: The configured limit, or None to use the engine default
+
+    """
+    config = load_config()
+    limit = config.get(CONFIG_KEY_TOOL_MAX_CONCURRENCY)
+    return int(limit) if limit is not None else None
+
+
+def get_tool_timeout() -> float | None:
+    """Get the time limit of each tool call.
+
+    Returns:
+        Optional[float]: The configured timeout in seconds, or None to use the engine default
+
+    """
+    config = load_config()
+    timeout = config.get(CONFIG_KEY_TOOL_TIMEOUT)
+    return float(timeout) if timeout is not None else None
+
+
+def get_http_pool_config() -> HttpPoolConfig:
+    """Get the settings of the pooled HTTP sessions.
+
+    Returns:
+        HttpPoolConfig: Pool size, keep-alive and retry settings, with defaults
+        for any value missing from the configuration
+
+    """
+    config = load_config()
+    settings = config.get(CONFIG_KEY_HTTP_POOL) or {}
+    known = {field.name for field in fields(HttpPoolConfig)}
+    return HttpPoolConfig(**{key: value for key, value in settings.items() if key in known})
+
+
 def get_provider_config() -> dict[str, Any]:
     """Get the AI provider configuration.
 
@@ -110,7 +234,15 @@ def get_provider_config() -> dict[str, Any]:
     """
     config = load_config()
     provider = config.get(CONFIG_KEY_PROVIDER, {})
+    provider_config = _provider_settings(provider)
+    # Applies to every provider type
+    if provider.get(CONFIG_KEY_CONTEXT_TOKEN_BUDGET) is not None:
+        provider_config[CONFIG_KEY_CONTEXT_TOKEN_BUDGET] = provider[CONFIG_KEY_CONTEXT_TOKEN_BUDGET]
+    return provider_config
+
 
+def _provider_settings(provider: dict[str, Any]) -> dict[str, Any]:
+    """Get the settings of the configured provider type, with their defaults."""
     provider_type = provider.get(CONFIG_KEY_TYPE)
 
     if provider_type == Provider.OPENAI.value:
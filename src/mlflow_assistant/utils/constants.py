@@ -8,12 +8,20 @@ from enum import Enum
 
 # Configuration keys
 CONFIG_KEY_MLFLOW_URI = "mlflow_uri"
+CONFIG_KEY_MLFLOW_SERVERS = "mlflow_servers"
 CONFIG_KEY_PROVIDER = "provider"
 CONFIG_KEY_TYPE = "type"
 CONFIG_KEY_MODEL = "model"
 CONFIG_KEY_URI = "uri"
 CONFIG_KEY_API_KEY = "api_key"
 CONFIG_KEY_PROFILE = "profile"
+CONFIG_KEY_SNAPSHOT_MAX_AGE = "snapshot_max_age"
+CONFIG_KEY_TOOL_TOKEN_BUDGET = "tool_token_budget"  # noqa: S105
+CONFIG_KEY_HTTP_POOL = "http_pool"
+CONFIG_KEY_TOOL_MAX_CONCURRENCY = "tool_max_concurrency"
+CONFIG_KEY_TOOL_TIMEOUT = "tool_timeout"
+CONFIG_KEY_MEMORY = "memory"
+CONFIG_KEY_CONTEXT_TOKEN_BUDGET = "context_token_budget"  # noqa: S105
 
 # Environment variables
 MLFLOW_URI_ENV = "MLFLOW_TRACKING_URI"
@@ -30,6 +38,17 @@ ENVIRONMENT_VARIABLES = {
     "DATABRICKS_TOKEN": "token",
 }
 
+# Metadata snapshot
+SNAPSHOT_FILENAME = "snapshot.db"
+DEFAULT_SNAPSHOT_MAX_AGE = 300  # seconds
+
+# Conversation memory backends
+MEMORY_BACKEND_MEMORY = "memory"
+MEMORY_BACKEND_SQLITE = "sqlite"
+MEMORY_BACKEND_OFF = "off"
+MEMORY_BACKENDS = [MEMORY_BACKEND_MEMORY, MEMORY_BACKEND_SQLITE, MEMORY_BACKEND_OFF]
+MEMORY_FILENAME = "memory.db"
+
 # Connection timeouts
 MLFLOW_CONNECTION_TIMEOUT = 5  # seconds
 OLLAMA_CONNECTION_TIMEOUT = 2  # seconds
@@ -3,10 +3,56 @@ from dataclasses import dataclass
 
 # Environment variable names for MLflow connection
 MLFLOW_TRACKING_URI_ENV = "MLFLOW_TRACKING_URI"
+MLFLOW_TRACKING_TOKEN_ENV = "MLFLOW_TRACKING_TOKEN"  # noqa: S105
+MLFLOW_TRACKING_USERNAME_ENV = "MLFLOW_TRACKING_USERNAME"
+MLFLOW_TRACKING_PASSWORD_ENV = "MLFLOW_TRACKING_PASSWORD"  # noqa: S105
+MLFLOW_TRACKING_INSECURE_TLS_ENV = "MLFLOW_TRACKING_INSECURE_TLS"
 
 # Default values
 DEFAULT_MLFLOW_TRACKING_URI = "http://localhost:5000"
 
+# Client cache
+DEFAULT_CACHE_MAX_SIZE = 1024
+DEFAULT_CACHE_TTLS = {  # seconds
+    "search_experiments": 60.0,
+    "get_registered_model": 60.0,
+    "search_model_versions": 60.0,
+    "get_run": 30.0,
+}
+
+# Metadata snapshot
+SNAPSHOT_PAGE_SIZE = 1000
+SNAPSHOT_EXPERIMENT_CHUNK_SIZE = 100
+SNAPSHOT_RUN_ID_CHUNK_SIZE = 100
+
+# Async REST client
+MLFLOW_REST_API_PREFIX = "/api/2.0/mlflow"
+ASYNC_CLIENT_MAX_CONNECTIONS = 20
+ASYNC_CLIENT_TIMEOUT = 30.0  # seconds
+ASYNC_CLIENT_PAGE_SIZE = 1000
+
+# Pooled HTTP sessions
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MLFLOW_HTTP_POOL_CONNECTIONS_ENV = "MLFLOW_HTTP_POOL_CONNECTIONS"
+MLFLOW_HTTP_POOL_MAXSIZE_ENV = "MLFLOW_HTTP_POOL_MAXSIZE"
+MLFLOW_HTTP_REQUEST_MAX_RETRIES_ENV = "MLFLOW_HTTP_REQUEST_MAX_RETRIES"
+MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR_ENV = "MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"
+
+# Local file store reader
+LOCAL_STORE_MAX_WORKERS = 16
+
+# Artifact reads
+MLFLOW_ARTIFACTS_API_PREFIX = "/api/2.0/mlflow-artifacts/artifacts"
+ARTIFACT_STREAM_CHUNK_SIZE = 64 * 1024  # bytes
+ARTIFACT_REQUEST_TIMEOUT = 30.0  # seconds
+
+# Connection health
+HEALTH_CHECK_TTL = 15.0  # seconds
+HEALTH_PROBE_TIMEOUT = 2.0  # seconds, per probe request
+RECONNECT_MAX_ATTEMPTS = 3
+RECONNECT_BASE_DELAY = 0.5  # seconds
+RECONNECT_MAX_DELAY = 8.0  # seconds
+
 # Connection types
 LOCAL_CONNECTION = "local"
 REMOTE_CONNECTION = "remote"
@@ -24,3 +70,13 @@ class MLflowConnectionConfig:
         if self.tracking_uri.startswith(("http://", "https://")):
             return REMOTE_CONNECTION
         return LOCAL_CONNECTION
+
+
+@dataclass
+class HttpPoolConfig:
+    """Configuration for pooled HTTP sessions."""
+
+    pool_connections: int = 10
+    pool_maxsize: int = 20
+    max_retries: int = 3
+    backoff_factor: float = 0.5
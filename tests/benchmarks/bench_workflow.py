@@ -0,0 +1,42 @@
+"""Benchmark the per-query cost of building the workflow.
+
+Compares compiling the LangGraph workflow for every query with reusing the
+process-level compiled graph. Run with:
+
+    PYTHONPATH=src python tests/benchmarks/bench_workflow.py
+"""
+import statistics
+import time
+
+import click
+
+from mlflow_assistant.engine.workflow import clear_workflow_cache, create_workflow, get_workflow
+
+QUERIES = 200
+
+
+def _measure(build) -> list[float]:
+    """Time the workflow setup of each simulated query, in milliseconds."""
+    timings = []
+    for _ in range(QUERIES):
+        start = time.perf_counter()
+        build()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    """Print the setup time per query with and without the workflow cache."""
+    clear_workflow_cache()
+    rebuilt = _measure(create_workflow)
+    cached = _measure(get_workflow)
+
+    click.echo(f"{'':<20}{'mean ms':>10}{'p95 ms':>10}")
+    for label, timings in (("compile per query", rebuilt), ("cached workflow", cached)):
+        p95 = statistics.quantiles(timings, n=20)[-1]
+        click.echo(f"{label:<20}{statistics.mean(timings):>10.3f}{p95:>10.3f}")
+    click.echo(f"speedup: {statistics.mean(rebuilt) / statistics.mean(cached):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
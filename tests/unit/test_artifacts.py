@@ -0,0 +1,113 @@
+"""Unit tests for partial artifact reads.
+
+This module contains unit tests for the `mlflow_assistant.core.artifacts`
+module, covering memory-mapped reads of local artifacts, path resolution and
+ranged streaming of artifacts proxied by the tracking server.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mlflow_assistant.core import artifacts
+from mlflow_assistant.core.http import reset_http_session
+
+CONTENT = bytes(range(256)) * 4
+
+
+class _ArtifactHandler(BaseHTTPRequestHandler):
+    """Serve CONTENT, honouring Range headers unless the path says otherwise."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.server.paths.append(self.path)
+        start, _, end = self.headers["Range"].removeprefix("bytes=").partition("-")
+        if "ignore-range" in self.path:
+            self.send_response(200)
+            body = CONTENT
+        else:
+            self.send_response(206)
+            body = CONTENT[int(start):int(end) + 1]
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(CONTENT)}")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Serve artifacts on a free local port for the duration of a test."""
+    reset_http_session()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ArtifactHandler)
+    httpd.paths = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    reset_http_session()
+
+
+class TestLocalArtifacts:
+    """Tests for local artifact stores."""
+
+    def test_read_local_range(self, tmp_path):
+        """Test that only the requested range is returned, with the file size."""
+        path = tmp_path / "weights.bin"
+        path.write_bytes(CONTENT)
+
+        chunk = artifacts.read_local_range(path, 10, 5)
+
+        assert chunk.data == CONTENT[10:15]
+        assert chunk.size == len(CONTENT)
+
+    def test_read_past_end_and_empty_file(self, tmp_path):
+        """Test reads beyond the end of a file and of an empty file."""
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+
+        assert artifacts.read_local_range(path, 0, 10).data == b""
+
+        path.write_bytes(b"abc")
+        assert artifacts.read_local_range(path, 2, 10).data == b"c"
+        assert artifacts.read_local_range(path, 5, 10).data == b""
+
+    def test_resolve_local_artifact(self, tmp_path):
+        """Test resolving local artifacts, and rejecting paths outside the root."""
+        root = tmp_path.as_uri()
+
+        assert artifacts.resolve_local_artifact(root, "model/MLmodel") == tmp_path / "model" / "MLmodel"
+        assert artifacts.resolve_local_artifact("s3://bucket/1/abc/artifacts", "x") is None
+        with pytest.raises(ValueError, match="outside"):
+            artifacts.resolve_local_artifact(root, "../secret")
+
+
+class TestProxiedArtifacts:
+    """Tests for artifacts served by the tracking server."""
+
+    def test_stream_range(self, server):
+        """Test that a ranged request returns the range and the total size."""
+        tracking_uri = f"http://127.0.0.1:{server.server_port}"
+
+        chunk = artifacts.stream_proxied_range(
+            tracking_uri, "mlflow-artifacts:/1/abc/artifacts", "model/w.bin", 100, 20,
+        )
+
+        assert chunk.data == CONTENT[100:120]
+        assert chunk.size == len(CONTENT)
+        assert server.paths == ["/api/2.0/mlflow-artifacts/artifacts/1/abc/artifacts/model/w.bin"]
+
+    def test_server_ignoring_range(self, server):
+        """Test that the range is cut from a full response."""
+        tracking_uri = f"http://127.0.0.1:{server.server_port}"
+
+        chunk = artifacts.stream_proxied_range(
+            tracking_uri, "mlflow-artifacts:/1/abc/artifacts", "ignore-range.bin", 100, 20,
+        )
+
+        assert chunk.data == CONTENT[100:120]
+        assert chunk.size == len(CONTENT)
@@ -0,0 +1,105 @@
+"""Unit tests for the MLflow client cache.
+
+This module contains unit tests for the `CachedMlflowClient` wrapper, covering
+memoization of read calls, TTL expiry, LRU eviction, invalidation and
+delegation of uncached methods.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from mlflow_assistant.core.cache import CachedMlflowClient
+
+
+class TestCachedMlflowClient:
+    """Tests for the CachedMlflowClient class."""
+
+    def test_read_calls_are_memoized(self):
+        """Test that repeated calls with the same arguments hit the cache."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client)
+
+        first = cached.get_run("abc")
+        second = cached.get_run("abc")
+
+        assert first is second
+        client.get_run.assert_called_once_with("abc")
+        assert cached.cache_info()["hits"] == 1
+        assert cached.cache_info()["misses"] == 1
+
+    def test_list_arguments_are_hashable(self):
+        """Test that list arguments can be part of the cache key."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client, ttls={"search_runs": 60})
+
+        cached.search_runs(experiment_ids=["1", "2"])
+        cached.search_runs(experiment_ids=["1", "2"])
+
+        client.search_runs.assert_called_once()
+
+    def test_entries_expire(self):
+        """Test that entries are refetched once their TTL has elapsed."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client, ttls={"get_run": 10})
+
+        with patch("mlflow_assistant.core.cache.time.monotonic", side_effect=[0, 5, 20]):
+            cached.get_run("abc")
+            cached.get_run("abc")
+            cached.get_run("abc")
+
+        assert client.get_run.call_count == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client, max_size=2)
+
+        cached.get_run("a")
+        cached.get_run("b")
+        cached.get_run("a")
+        cached.get_run("c")
+        cached.get_run("a")
+        cached.get_run("b")
+
+        assert [c.args[0] for c in client.get_run.call_args_list] == ["a", "b", "c", "b"]
+
+    def test_invalidate(self):
+        """Test that invalidation forces the next call to hit the client."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client)
+
+        cached.get_run("abc")
+        cached.search_experiments()
+        cached.invalidate("get_run")
+        cached.get_run("abc")
+        cached.search_experiments()
+
+        assert client.get_run.call_count == 2
+        client.search_experiments.assert_called_once()
+
+        cached.invalidate()
+        assert cached.cache_info()["size"] == 0
+
+    def test_uncached_methods_are_delegated(self):
+        """Test that methods without a TTL are passed straight to the client."""
+        client = MagicMock()
+        cached = CachedMlflowClient(client)
+
+        cached.search_registered_models()
+        cached.search_registered_models()
+
+        assert client.search_registered_models.call_count == 2
+
+    def test_errors_are_reported(self):
+        """Test that errors from cached and uncached calls reach on_error."""
+        client = MagicMock()
+        error = RuntimeError("down")
+        client.get_run.side_effect = error
+        client.delete_run.side_effect = error
+        on_error = MagicMock()
+        cached = CachedMlflowClient(client, on_error=on_error)
+
+        for method in (cached.get_run, cached.delete_run):
+            with pytest.raises(RuntimeError, match="down"):
+                method("abc")
+
+        assert on_error.call_args_list == [((error,),), ((error,),)]
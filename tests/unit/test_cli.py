@@ -4,6 +4,7 @@ This module contains unit tests for the command-line interface functionality,
 including testing version command, setup wizard, start command, and mock
 query processing.
 """
+import asyncio
 from unittest.mock import patch
 from click.testing import CliRunner
 
@@ -90,12 +91,25 @@ class TestCliCommands:
             def __init__(self, content):
                 self.content = content
 
-        # Mock response that matches what the test expects
-        def mock_process_query(query, provider_config, verbose=False):
-            return {
+        # Mock stream whose tokens match what the test expects
+        async def mock_stream_query(
+            query, provider_config, verbose=False, tool_cache=None, memory=None,
+        ):
+            response = f"This is a mock response to: '{query}'"
+            await asyncio.sleep(0)
+            yield {"type": "tool_start", "name": "list_models", "args": {}}
+            yield {
+                "type": "tool_end", "name": "list_models",
+                "duration": 0.2, "cache_hit": False, "error": False,
+            }
+            for token in response.split(" "):
+                yield {"type": "token", "content": token + " "}
+            yield {
+                "type": "result",
                 "original_query": query,
-                "response": MockContentResponse(f"This is a mock response to: '{query}'"),
+                "response": MockContentResponse(response),
                 "duration": 0.1,
+                "time_to_first_token": 0.05,
             }
 
         with patch(
@@ -108,8 +122,8 @@ class TestCliCommands:
             "mlflow_assistant.cli.commands.get_mlflow_uri",
             return_value="http://test:5000",
         ), patch(
-            "mlflow_assistant.cli.commands.process_query",
-            side_effect=mock_process_query,
+            "mlflow_assistant.cli.commands.stream_query",
+            side_effect=mock_stream_query,
         ):
             # Simulate user entering a question and then /bye
             result = runner.invoke(
@@ -124,6 +138,8 @@ class TestCliCommands:
                 "This is a mock response to: 'What is MLflow?'"
                 in result.stdout
             )
+            assert "✅ list_models (0.2s)" in result.stdout
+            assert "First token: 0.05s | Total: 0.10s" in result.stdout
             assert (
                 "Thank you for using MLflow Assistant"
                 in result.stdout
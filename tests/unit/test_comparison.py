@@ -0,0 +1,71 @@
+"""Unit tests for the vectorized run comparison.
+
+This module contains unit tests for the `mlflow_assistant.engine.comparison`
+module, covering metric alignment, ranking, deltas, winners and param diffs.
+"""
+import numpy as np
+
+from mlflow_assistant.engine.comparison import (
+    compare_metrics,
+    differing_params,
+    is_lower_better,
+)
+
+
+class TestCompareMetrics:
+    """Tests for the compare_metrics function."""
+
+    def test_ranks_winners_and_deltas(self):
+        """Test ranking in both directions and deltas against the first run."""
+        comparison = compare_metrics([
+            {"accuracy": 0.8, "loss": 0.5},
+            {"accuracy": 0.9, "loss": 0.7},
+            {"accuracy": 0.7, "loss": 0.2},
+        ])
+
+        assert comparison.metric_names == ["accuracy", "loss"]
+        assert comparison.lower_is_better.tolist() == [False, True]
+        assert comparison.ranks[:, 0].tolist() == [2, 1, 3]
+        assert comparison.ranks[:, 1].tolist() == [2, 3, 1]
+        assert comparison.winners == [1, 2]
+        np.testing.assert_allclose(comparison.deltas[:, 0], [0.0, 0.1, -0.1])
+        assert comparison.mean_ranks.tolist() == [2.0, 2.0, 2.0]
+
+    def test_missing_metrics(self):
+        """Test that missing metrics are NaN and ranked after reported ones."""
+        comparison = compare_metrics([{"f1": 0.5}, {"f1": 0.9, "auc": 0.7}])
+
+        auc = comparison.metric_names.index("auc")
+        assert np.isnan(comparison.values[0, auc])
+        assert np.isnan(comparison.ranks[0, auc])
+        assert comparison.winners[auc] == 1
+        assert comparison.mean_ranks.tolist() == [2.0, 1.0]
+
+    def test_explicit_lower_is_better(self):
+        """Test that metrics can be declared as minimized."""
+        assert is_lower_better("val_rmse")
+        assert not is_lower_better("duration")
+        assert is_lower_better("duration", ["duration"])
+
+    def test_many_runs(self):
+        """Test that hundreds of runs are compared at once."""
+        rng = np.random.default_rng(0)
+        metrics = [{"f1": float(v)} for v in rng.random(500)]
+
+        comparison = compare_metrics(metrics)
+
+        assert comparison.winners == [int(np.argmax([m["f1"] for m in metrics]))]
+        assert sorted(comparison.ranks[:, 0].tolist()) == list(range(1, 501))
+
+
+class TestDifferingParams:
+    """Tests for the differing_params function."""
+
+    def test_only_changed_params(self):
+        """Test that identical params are dropped and partial ones kept."""
+        params = [
+            {"lr": "0.1", "seed": "1", "depth": "3"},
+            {"lr": "0.2", "seed": "1"},
+        ]
+
+        assert differing_params(params) == ["depth", "lr"]
@@ -79,6 +79,16 @@ class TestConfig:
             provider = get_provider_config()
             assert provider["type"] == "openai"
             assert provider["model"] == "test-model"
+            assert "context_token_budget" not in provider
+
+    def test_get_provider_config_context_budget(self, mock_config):
+        """Test that the context token budget is kept for any provider type."""
+        mock_config["provider"]["context_token_budget"] = 3000
+        with patch(
+            "mlflow_assistant.utils.config.load_config",
+            return_value=mock_config,
+        ):
+            assert get_provider_config()["context_token_budget"] == 3000
 
     def test_get_provider_config_with_env_key(self, mock_config):
         """Test that OpenAI key from environment takes precedence."""
@@ -13,13 +13,22 @@ The tests cover various scenarios, including:
 
 These tests ensure the robustness and correctness of the MLflow connection logic.
 """
+import asyncio
+import json
+import threading
+import time
+
+import httpx
 import pytest
-from unittest.mock import patch
+import requests
+from unittest.mock import MagicMock, patch
+from mlflow.exceptions import MlflowException, RestException
 
-from mlflow_assistant.core.connection import MLflowConnection
+from mlflow_assistant.core.connection import AsyncMLflowClient, MLflowConnection
 from mlflow_assistant.utils.definitions import (
     MLflowConnectionConfig,
     DEFAULT_MLFLOW_TRACKING_URI,
+    HEALTH_PROBE_TIMEOUT,
     LOCAL_CONNECTION,
     REMOTE_CONNECTION,
 )
@@ -125,13 +134,14 @@ class TestMLflowConnection:
             tracking_uri="http://localhost:5000",
             client_factory=lambda tracking_uri: mock_client_instance,
         )
-        success, message = conn.connect()
+        with patch("mlflow_assistant.core.connection.get_probe_session") as mock_probe_session:
+            success, message = conn.connect()
 
         assert success is True
         assert "Successfully connected" in message
         assert conn.is_connected() is True
         mock_set_tracking_uri.assert_called_once_with("http://localhost:5000")
-        mock_client_instance.search_experiments.assert_called_once()
+        mock_probe_session.return_value.get.assert_called_once()
 
     @patch("mlflow.set_tracking_uri")
     @patch("mlflow.tracking.MlflowClient")
@@ -201,6 +211,278 @@ class TestMLflowConnection:
             mock_client_instance = mock_client_class.return_value
             mock_client_instance.search_experiments.return_value = []
             conn.client_factory = lambda tracking_uri: mock_client_instance
-            conn.connect()
+            with patch("mlflow_assistant.core.connection.get_probe_session"):
+                conn.connect()
             info = conn.get_connection_info()
             assert info["is_connected"] is True
+
+
+class TestConnectionHealth:
+    """Tests for the health check and reconnection of MLflowConnection."""
+
+    def _connected(self, client):
+        conn = MLflowConnection(
+            tracking_uri="file:///tmp/mlruns",
+            client_factory=lambda tracking_uri: client,
+        )
+        with patch("mlflow.set_tracking_uri"):
+            conn.connect()
+        return conn
+
+    def test_connect_uses_bounded_probe(self):
+        """Test that connecting only asks the server for a single experiment."""
+        client = MagicMock()
+
+        self._connected(client)
+
+        client.search_experiments.assert_called_once_with(max_results=1)
+
+    def test_remote_probe_fails_fast(self):
+        """Test that tracking servers are probed without retries and with a short timeout."""
+        client = MagicMock()
+        conn = MLflowConnection(
+            tracking_uri="http://localhost:5000",
+            client_factory=lambda tracking_uri: client,
+        )
+        with patch(
+            "mlflow_assistant.core.connection.get_probe_session",
+        ) as mock_probe_session, patch("mlflow.set_tracking_uri"):
+            mock_probe_session.return_value.get.side_effect = requests.ConnectionError("refused")
+            success, _ = conn.connect()
+
+        assert success is False
+        client.search_experiments.assert_not_called()
+        (url,), kwargs = mock_probe_session.return_value.get.call_args
+        assert url == "http://localhost:5000/api/2.0/mlflow/experiments/search"
+        assert kwargs["timeout"] == HEALTH_PROBE_TIMEOUT
+
+    def test_health_is_cached_until_ttl(self):
+        """Test that the health check only probes once per TTL."""
+        client = MagicMock()
+        conn = self._connected(client)
+
+        assert conn.is_connected() is True
+        assert client.search_experiments.call_count == 1
+
+        conn.last_health_check -= conn.health_check_ttl
+        client.search_experiments.side_effect = Exception("Server down")
+
+        assert conn.is_connected() is False
+        assert client.search_experiments.call_count == 2
+
+    def test_reconnect_backs_off_until_success(self):
+        """Test that reconnect retries with exponential backoff."""
+        client = MagicMock()
+        conn = self._connected(client)
+        client.search_experiments.side_effect = [Exception("down"), Exception("down"), []]
+
+        with patch("mlflow.set_tracking_uri"), patch(
+            "mlflow_assistant.core.connection.time.sleep",
+        ) as mock_sleep:
+            success, _ = conn.reconnect(max_attempts=5, base_delay=1.0)
+
+        assert success is True
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1.0, 2.0]
+        assert conn.is_connected() is True
+
+    def test_reconnect_gives_up(self):
+        """Test that reconnect reports failure after the last attempt."""
+        client = MagicMock()
+        conn = self._connected(client)
+        client.search_experiments.side_effect = Exception("down")
+
+        with patch("mlflow.set_tracking_uri"), patch(
+            "mlflow_assistant.core.connection.time.sleep",
+        ):
+            success, message = conn.reconnect(max_attempts=2)
+
+        assert success is False
+        assert "down" in message
+
+    def test_network_error_marks_connection_unhealthy(self):
+        """Test that a failed call reaching no server forces a reconnection."""
+        client = MagicMock()
+        conn = self._connected(client)
+        client.get_run.side_effect = MlflowException("API request failed")
+        client.get_run.side_effect.__context__ = requests.ConnectionError("refused")
+
+        with pytest.raises(MlflowException):
+            conn.get_cached_client().get_run("abc")
+
+        assert conn.is_connected() is False
+        assert client.search_experiments.call_count == 1
+
+    def test_other_errors_expire_health_check(self):
+        """Test that other failed calls make the next check probe the server."""
+        client = MagicMock()
+        conn = self._connected(client)
+        client.get_run.side_effect = MlflowException("Run not found")
+
+        with pytest.raises(MlflowException):
+            conn.get_cached_client().get_run("abc")
+
+        assert conn.is_connected() is True
+        assert client.search_experiments.call_count == 2
+
+    def test_concurrent_callers_share_one_reconnect(self):
+        """Test that callers finding the connection down wait for one reconnection."""
+        conn = self._connected(MagicMock())
+        started = threading.Event()
+        checked = threading.Event()
+        release = threading.Event()
+
+        def is_connected():
+            if started.is_set():
+                checked.set()
+            return False
+
+        def reconnect():
+            started.set()
+            release.wait(5)
+            return True, "connected"
+
+        results = []
+        with patch.object(conn, "is_connected", side_effect=is_connected), patch.object(
+            conn, "reconnect", side_effect=reconnect,
+        ) as mock_reconnect:
+            first = threading.Thread(target=lambda: results.append(conn.ensure_connected()))
+            first.start()
+            assert started.wait(5)
+            second = threading.Thread(target=lambda: results.append(conn.ensure_connected()))
+            second.start()
+            assert checked.wait(5)
+            time.sleep(0.05)
+            release.set()
+            first.join()
+            second.join()
+
+        mock_reconnect.assert_called_once()
+        assert results == [(True, "connected"), (True, "connected")]
+
+
+def _mock_server(requests):
+    """Build a transport serving runs and run searches, recording each request."""
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path.endswith("/runs/get"):
+            run_id = request.url.params["run_id"]
+            if run_id == "missing":
+                return httpx.Response(
+                    404,
+                    json={"error_code": "RESOURCE_DOES_NOT_EXIST", "message": "Run not found"},
+                )
+            return httpx.Response(200, json={"run": {"info": {"run_id": run_id}}})
+        body = json.loads(request.content)
+        if body.get("page_token") == "page-2":
+            return httpx.Response(200, json={"runs": [{}]})
+        if body["experiment_ids"] == ["1"]:
+            return httpx.Response(200, json={"runs": [{}, {}], "next_page_token": "page-2"})
+        return httpx.Response(200, json={})
+
+    return httpx.MockTransport(handler)
+
+
+class TestAsyncMLflowClient:
+    """Tests for the AsyncMLflowClient class."""
+
+    def test_requires_http_uri(self):
+        """Test that local tracking URIs are rejected."""
+        with pytest.raises(MLflowConnectionError, match="HTTP"):
+            AsyncMLflowClient("file:///tmp/mlruns")
+
+    def test_get_runs_concurrently(self):
+        """Test fetching runs concurrently, deduplicated, with errors per run."""
+        requests = []
+
+        async def run():
+            async with AsyncMLflowClient(
+                "http://localhost:5000", transport=_mock_server(requests),
+            ) as client:
+                return await client.get_runs(["a", "b", "a", "missing"])
+
+        runs = asyncio.run(run())
+
+        assert runs["a"] == {"info": {"run_id": "a"}}
+        assert runs["b"] == {"info": {"run_id": "b"}}
+        assert isinstance(runs["missing"], RestException)
+        assert len(requests) == 3
+        assert requests[0].url.path == "/api/2.0/mlflow/runs/get"
+
+    def test_count_runs_pages_through_results(self):
+        """Test counting runs of several experiments across pages."""
+        requests = []
+
+        async def run():
+            async with AsyncMLflowClient(
+                "http://localhost:5000", transport=_mock_server(requests),
+            ) as client:
+                return await client.count_runs(["1", "2"])
+
+        assert asyncio.run(run()) == {"1": (3, True), "2": (0, True)}
+        assert len(requests) == 3
+
+    def test_count_runs_stops_at_time_budget(self):
+        """Test that counts still paging when the budget is spent are partial."""
+
+        async def handler(request):
+            body = json.loads(request.content)
+            if body.get("page_token"):
+                await asyncio.sleep(5)
+            if body["experiment_ids"] == ["1"]:
+                return httpx.Response(200, json={"runs": [{}, {}], "next_page_token": "page-2"})
+            return httpx.Response(200, json={"runs": [{}]})
+
+        async def run():
+            async with AsyncMLflowClient(
+                "http://localhost:5000", transport=httpx.MockTransport(handler),
+            ) as client:
+                return await client.count_runs(["1", "2"], time_budget=0.2)
+
+        assert asyncio.run(run()) == {"1": (2, False), "2": (1, True)}
+
+    def test_bearer_token_from_env(self, monkeypatch):
+        """Test that the MLflow tracking token is sent as a bearer token."""
+        monkeypatch.setenv("MLFLOW_TRACKING_TOKEN", "secret")
+        requests = []
+
+        async def run():
+            async with AsyncMLflowClient(
+                "http://localhost:5000", transport=_mock_server(requests),
+            ) as client:
+                await client.get_run("a")
+
+        asyncio.run(run())
+
+        assert requests[0].headers["Authorization"] == "Bearer secret"
+
+    def test_connection_runs_queries_on_one_client(self):
+        """Test that run_async reuses one async client, from any thread, until closed."""
+        conn = MLflowConnection(tracking_uri="http://localhost:5000")
+        requests = []
+
+        def client_factory(tracking_uri):
+            return AsyncMLflowClient(tracking_uri, transport=_mock_server(requests))
+
+        async def get_client(client):
+            await asyncio.sleep(0)
+            return client
+
+        with patch(
+            "mlflow_assistant.core.connection.AsyncMLflowClient", side_effect=client_factory,
+        ) as mock_client_class:
+            first = conn.run_async(get_client)
+            runs = asyncio.run(asyncio.to_thread(conn.run_async, lambda c: c.get_runs(["a"])))
+            second = conn.run_async(get_client)
+            conn.close()
+
+        assert first is second
+        assert runs == {"a": {"info": {"run_id": "a"}}}
+        mock_client_class.assert_called_once()
+        assert first.http.is_closed
+        assert conn.event_loop is None
+
+    def test_supports_async(self):
+        """Test that only HTTP(S) tracking servers use the async client."""
+        assert MLflowConnection(tracking_uri="http://localhost:5000").supports_async()
+        assert not MLflowConnection(tracking_uri="file:///tmp/mlruns").supports_async()
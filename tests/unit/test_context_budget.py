@@ -0,0 +1,118 @@
+"""Unit tests for the context-window budget.
+
+This module contains unit tests for the `mlflow_assistant.engine.context_budget`
+module, covering token estimates, shrinking tool outputs and dropping old turns.
+"""
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from mlflow_assistant.engine.context_budget import (
+    context_budget,
+    estimate_message_tokens,
+    fit_to_budget,
+    prompt_budget,
+    shrink_tool_output,
+    tool_output_budget,
+)
+from mlflow_assistant.engine.definitions import CONTEXT_TRUNCATION_NOTE, TOOL_TOKEN_BUDGET
+from mlflow_assistant.engine.encoder import encode_result, estimate_tokens
+
+
+def _versions(count):
+    """Encode a get_model_details-like output with many versions."""
+    return encode_result(
+        {"name": "model", "versions": [
+            {"version": i, "run_id": f"{i:032x}", "status": "READY"} for i in range(count)
+        ]},
+        token_budget=None,
+    )
+
+
+def _turn(i, tool_output):
+    """Build one question, tool call, tool output and answer."""
+    return [
+        HumanMessage(content=f"question {i}"),
+        AIMessage(content="", tool_calls=[{"name": "get_model_details", "args": {}, "id": f"call{i}"}]),
+        ToolMessage(content=tool_output, tool_call_id=f"call{i}"),
+        AIMessage(content=f"answer {i}"),
+    ]
+
+
+class TestContextBudget:
+    """Tests for fitting prompts to the context budget."""
+
+    def test_budget_per_provider(self):
+        """Test provider defaults and the configured override."""
+        assert context_budget({"type": "ollama"}) < context_budget({"type": "openai"})
+        assert context_budget({"type": "OpenAI", "context_token_budget": 500}) == 500
+        assert context_budget({}) > 0
+
+    def test_tool_outputs_fit_prompt_budget(self):
+        """Test that a tool output fits in the prompt of every provider."""
+        schema_tokens = 2254
+        for provider in ({"type": "ollama"}, {"type": "openai"}, {}, {"context_token_budget": 2000}):
+            budget = tool_output_budget(provider, schema_tokens)
+            assert budget <= TOOL_TOKEN_BUDGET
+            assert budget <= max(prompt_budget(provider, schema_tokens), 200)
+        assert tool_output_budget({"type": "ollama"}, schema_tokens) < TOOL_TOKEN_BUDGET
+        assert tool_output_budget({"type": "openai"}, schema_tokens) == TOOL_TOKEN_BUDGET
+
+    def test_tool_calls_counted(self):
+        """Test that tool call arguments count towards a message's size."""
+        call = AIMessage(content="", tool_calls=[
+            {"name": "search_runs", "args": {"filter_string": "x" * 400}, "id": "1"},
+        ])
+        assert estimate_message_tokens(call) > 100
+
+    def test_within_budget_unchanged(self):
+        """Test that small prompts are sent as they are."""
+        messages = _turn(0, _versions(3))
+        fitted, report = fit_to_budget(messages, 10_000)
+
+        assert fitted == messages
+        assert report.tokens_cut == 0
+
+    def test_shrinks_largest_tool_output(self):
+        """Test that the largest tool output absorbs the cut, as valid JSON."""
+        messages = _turn(0, _versions(5)) + _turn(1, _versions(400))
+        fitted, report = fit_to_budget(messages, 1500)
+
+        assert report.tokens_after <= 1500
+        assert report.trimmed_messages == 1
+        assert report.dropped_messages == 0
+        assert fitted[2].content == messages[2].content
+        shrunk = json.loads(fitted[6].content)
+        assert shrunk["versions"]["omitted_rows"] > 0
+        # The state is left untouched
+        assert len(messages[6].content) > len(fitted[6].content)
+
+    def test_drops_oldest_turns(self):
+        """Test that old turns are dropped once tool outputs are minimal."""
+        messages = [
+            SystemMessage(content="Summary of the earlier conversation"),
+            *_turn(0, "a" * 3000),
+            *_turn(1, "b" * 3000),
+            *_turn(2, "c" * 3000),
+        ]
+        fitted, report = fit_to_budget(messages, 300)
+
+        assert report.dropped_messages == 8
+        assert [type(m) for m in fitted[:2]] == [SystemMessage, HumanMessage]
+        assert fitted[1].content == "question 2"
+        assert fitted[3].content.endswith(CONTEXT_TRUNCATION_NOTE)
+        assert report.tokens_after <= 300
+
+    def test_current_turn_kept_over_budget(self):
+        """Test that the current question is never dropped."""
+        messages = [HumanMessage(content="q" * 4000)]
+        fitted, report = fit_to_budget(messages, 10)
+
+        assert fitted == messages
+        assert report.tokens_after > report.budget
+
+    def test_shrink_plain_text(self):
+        """Test that non-JSON outputs are cut with a note."""
+        text = shrink_tool_output("plain " * 500, 50)
+        assert text.endswith(CONTEXT_TRUNCATION_NOTE)
+        assert estimate_tokens(text) <= 51
@@ -0,0 +1,66 @@
+"""Unit tests for metric history downsampling.
+
+This module contains unit tests for the `mlflow_assistant.engine.downsampling`
+module, covering the LTTB and min/max bucket selection strategies.
+"""
+import numpy as np
+
+from mlflow_assistant.engine.downsampling import lttb, min_max
+
+
+class TestLttb:
+    """Tests for the lttb function."""
+
+    def test_short_series_is_unchanged(self):
+        """Test that series shorter than the budget are returned whole."""
+        x = np.arange(10)
+
+        assert lttb(x, x * 2.0, 50).tolist() == list(range(10))
+
+    def test_point_budget_and_endpoints(self):
+        """Test that exactly max_points sorted indices are kept, with both ends."""
+        x = np.arange(100_000)
+        y = np.sin(x / 1000.0)
+
+        selected = lttb(x, y, 100)
+
+        assert len(selected) == 100
+        assert selected[0] == 0
+        assert selected[-1] == len(x) - 1
+        assert np.all(np.diff(selected) > 0)
+
+    def test_spike_is_kept(self):
+        """Test that a single outlier survives downsampling."""
+        x = np.arange(10_000)
+        y = np.zeros(10_000)
+        y[5_123] = 100.0
+
+        assert 5_123 in lttb(x, y, 50)
+
+
+class TestMinMax:
+    """Tests for the min_max function."""
+
+    def test_extremes_are_kept(self):
+        """Test that the global minimum and maximum are always selected."""
+        rng = np.random.default_rng(0)
+        y = rng.random(50_000)
+
+        selected = min_max(y, 100)
+
+        assert len(selected) <= 100
+        assert int(np.argmin(y)) in selected
+        assert int(np.argmax(y)) in selected
+        assert selected[0] == 0
+        assert selected[-1] == len(y) - 1
+
+    def test_small_budgets_keep_endpoints(self):
+        """Test that odd and very small budgets keep both endpoints and are filled."""
+        y = np.array([5.0, 1.0, 9.0, 3.0, 7.0, 2.0, 8.0, 0.0, 6.0, 4.0])
+
+        for max_points in (3, 4, 5):
+            selected = min_max(y, max_points)
+
+            assert selected[0] == 0
+            assert selected[-1] == len(y) - 1
+            assert len(selected) == max_points
@@ -0,0 +1,71 @@
+"""Unit tests for the tool output encoder.
+
+This module contains unit tests for the `mlflow_assistant.engine.encoder`
+module, covering compaction of records into tables and token budget
+enforcement.
+"""
+import json
+
+from mlflow_assistant.engine.encoder import compact, encode_result, estimate_tokens
+
+
+class TestCompact:
+    """Tests for the compact function."""
+
+    def test_empty_fields_are_dropped(self):
+        """Test that empty values are removed but falsy numbers are kept."""
+        assert compact({"a": "", "b": None, "c": {}, "d": [], "e": 0, "f": False}) == {
+            "e": 0,
+            "f": False,
+        }
+
+    def test_null_pagination_keys_are_kept(self):
+        """Test that a null next_cursor or next_offset still reaches the model."""
+        assert compact({"models": [], "next_cursor": None}) == {"next_cursor": None}
+        assert json.loads(encode_result({"content": "x", "next_offset": None})) == {
+            "content": "x",
+            "next_offset": None,
+        }
+
+    def test_records_become_tables(self):
+        """Test that lists of dicts become a header and rows."""
+        result = compact({"models": [{"name": "a", "version": 1}, {"name": "b", "tags": {"x": "y"}}]})
+
+        assert result == {
+            "models": {
+                "columns": ["name", "version", "tags"],
+                "rows": [["a", 1, None], ["b", None, {"x": "y"}]],
+            },
+        }
+
+
+class TestEncodeResult:
+    """Tests for the encode_result function."""
+
+    def test_output_is_compact_json(self):
+        """Test that output has no indentation and round-trips."""
+        text = encode_result({"total": 1, "items": [{"id": "1"}]})
+
+        assert "\n" not in text
+        assert " " not in text
+        assert json.loads(text) == {"total": 1, "items": {"columns": ["id"], "rows": [["1"]]}}
+
+    def test_budget_truncates_largest_table(self):
+        """Test that rows are dropped to fit the budget and the cut is reported."""
+        result = {"models": [{"name": f"model-{i}", "stage": "Production"} for i in range(500)]}
+
+        text = encode_result(result, token_budget=200)
+        decoded = json.loads(text)
+
+        assert estimate_tokens(text) <= 200
+        assert "truncated" in decoded
+        kept = len(decoded["models"]["rows"])
+        assert kept + decoded["models"]["omitted_rows"] == 500
+
+    def test_no_budget(self):
+        """Test that a None budget never truncates."""
+        result = {"models": [{"name": f"model-{i}"} for i in range(500)]}
+
+        decoded = json.loads(encode_result(result, token_budget=None))
+
+        assert len(decoded["models"]["rows"]) == 500
@@ -0,0 +1,129 @@
+"""Unit tests for the pooled HTTP sessions.
+
+This module contains unit tests for the `mlflow_assistant.core.http` module,
+covering session creation from pool settings, the shared session, MLflow
+environment configuration and pool statistics.
+"""
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from mlflow_assistant.cli.validation import validate_mlflow_uri
+from mlflow_assistant.core import http
+from mlflow_assistant.providers.utilities import verify_ollama_running
+from mlflow_assistant.utils.definitions import HttpPoolConfig
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive handler answering every GET with an empty JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Serve HTTP on a free local port for the duration of a test."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def refused_uri():
+    """Return the URI of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture(autouse=True)
+def reset_session():
+    """Drop the shared session between tests."""
+    http.reset_http_session()
+    yield
+    http.reset_http_session()
+
+
+class TestHttpSession:
+    """Tests for the pooled HTTP session helpers."""
+
+    def test_adapters_use_pool_settings(self):
+        """Test that both schemes are mounted with the configured pool and retries."""
+        config = HttpPoolConfig(pool_connections=3, pool_maxsize=7, max_retries=2)
+
+        session = http.create_http_session(config)
+
+        for scheme in ("http://", "https://"):
+            adapter = session.get_adapter(scheme)
+            assert adapter._pool_maxsize == 7  # noqa: SLF001
+            assert adapter.max_retries.total == 2
+
+    def test_shared_session_is_reused(self):
+        """Test that the shared session is created once."""
+        assert http.get_http_session() is http.get_http_session()
+
+    def test_connections_are_kept_alive(self, server):
+        """Test that repeated requests reuse one pooled connection."""
+        session = http.get_http_session()
+
+        for _ in range(3):
+            assert session.get(f"{server}/health", timeout=5).status_code == 200
+
+        stats = http.get_pool_stats(session)
+        assert len(stats) == 1
+        assert stats[0]["requests"] == 3
+        assert stats[0]["connections_opened"] == 1
+        assert stats[0]["idle_connections"] == 1
+
+    def test_configure_mlflow_http_keeps_user_values(self, monkeypatch):
+        """Test that MLflow pool settings do not override the environment."""
+        environ = {"MLFLOW_HTTP_POOL_MAXSIZE": "50"}
+        monkeypatch.setattr(http.os, "environ", environ)
+
+        http.configure_mlflow_http(HttpPoolConfig(pool_connections=4, pool_maxsize=8))
+
+        assert environ["MLFLOW_HTTP_POOL_MAXSIZE"] == "50"
+        assert environ["MLFLOW_HTTP_POOL_CONNECTIONS"] == "4"
+        assert environ["MLFLOW_HTTP_REQUEST_MAX_RETRIES"] == "3"
+
+    def test_probe_session_shares_pools_without_retries(self, server):
+        """Test that probes reuse the pooled connections but never retry."""
+        session = http.get_http_session()
+        probe_session = http.get_probe_session()
+
+        assert probe_session.get_adapter(server).max_retries.total == 0
+        assert session.get(f"{server}/health", timeout=5).status_code == 200
+        assert probe_session.get(f"{server}/health", timeout=5).status_code == 200
+
+        stats = http.get_pool_stats(session)
+        assert stats[0]["requests"] == 2
+        assert stats[0]["connections_opened"] == 1
+
+    def test_probes_fail_fast(self, refused_uri, monkeypatch):
+        """Test that probing a refused port does not wait for retries with backoff."""
+        monkeypatch.setattr(
+            http, "get_http_pool_config", lambda: HttpPoolConfig(max_retries=3, backoff_factor=0.5),
+        )
+
+        start = time.monotonic()
+        assert validate_mlflow_uri(refused_uri) is False
+        assert verify_ollama_running(refused_uri) is False
+
+        assert time.monotonic() - start < 1
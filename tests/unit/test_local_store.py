@@ -0,0 +1,100 @@
+"""Unit tests for the local file store reader.
+
+This module contains unit tests for the `mlflow_assistant.core.local_store`
+module, checking its results against the MLflow client on a small ``mlruns``
+tree.
+"""
+import pytest
+from mlflow.tracking import MlflowClient
+
+from mlflow_assistant.core.local_store import LocalFileStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a file store with two experiments, a deleted run and a model."""
+    root = tmp_path / "mlruns"
+    client = MlflowClient(tracking_uri=root.as_uri())
+
+    experiment_id = client.create_experiment("alpha", tags={"team": "ml"})
+    other_id = client.create_experiment("beta")
+    runs = [client.create_run(experiment_id) for _ in range(3)]
+    client.create_run(other_id)
+
+    for step in range(5):
+        client.log_metric(runs[0].info.run_id, "loss", 1.0 / (step + 1), step=step)
+    client.log_metric(runs[0].info.run_id, "val/acc", 0.75)
+    for run in runs[1:]:
+        client.set_terminated(run.info.run_id)
+    client.delete_run(runs[2].info.run_id)
+    client.create_registered_model("model")
+
+    return LocalFileStore(root), client, runs
+
+
+class TestLocalFileStore:
+    """Tests for the LocalFileStore class."""
+
+    def test_from_tracking_uri(self, tmp_path):
+        """Test that only existing local directories get a reader."""
+        assert LocalFileStore.from_tracking_uri(tmp_path.as_uri()).root == tmp_path
+        assert LocalFileStore.from_tracking_uri(str(tmp_path)) is not None
+        assert LocalFileStore.from_tracking_uri(str(tmp_path / "missing")) is None
+        assert LocalFileStore.from_tracking_uri("sqlite:///mlflow.db") is None
+        assert LocalFileStore.from_tracking_uri("http://localhost:5000") is None
+
+    def test_counts_match_client(self, store):
+        """Test experiment, model and running run counts."""
+        local_store, _, _ = store
+
+        assert local_store.get_counts() == {
+            "experiment_count": 3,  # Including the Default experiment
+            "model_count": 1,
+            "active_runs": 2,
+        }
+
+    def test_list_experiments(self, store):
+        """Test name filtering, run counts excluding deleted runs, and tags."""
+        local_store, _, _ = store
+
+        rows = local_store.list_experiments("ALP")
+
+        assert [row["name"] for row in rows] == ["alpha"]
+        assert rows[0]["run_count"] == 2
+        assert rows[0]["tags"] == {"team": "ml"}
+        assert len(local_store.list_experiments(max_results=1, offset=1)) == 1
+
+    def test_get_runs_reads_latest_metrics(self, store):
+        """Test that run metadata and latest metrics match the client."""
+        local_store, client, runs = store
+        run_id = runs[0].info.run_id
+
+        local_runs = local_store.get_runs([run_id, runs[2].info.run_id, "missing", "../x"])
+
+        assert set(local_runs) == {run_id, runs[2].info.run_id}
+        assert local_runs[run_id]["status"] == "RUNNING"
+        assert local_runs[run_id]["metrics"] == client.get_run(run_id).data.metrics
+
+    def test_latest_metrics_use_highest_step(self, store):
+        """Test that steps logged out of order still give the client's latest value."""
+        local_store, client, runs = store
+        run_id = runs[1].info.run_id
+        for step, value in [(5, 0.9), (2, 0.1), (5, 0.8)]:
+            client.log_metric(run_id, "acc", value, step=step, timestamp=1000)
+
+        local_runs = local_store.get_runs([run_id])
+
+        assert local_runs[run_id]["metrics"] == {"acc": 0.9}
+        assert local_runs[run_id]["metrics"] == client.get_run(run_id).data.metrics
+
+    def test_read_latest_value(self, tmp_path):
+        """Test metric files with blank lines, missing steps and no lines."""
+        path = tmp_path / "metric"
+        path.write_bytes(b"")
+        assert LocalFileStore.read_latest_value(path) is None
+
+        path.write_bytes(b"1 0.5 3\n2 0.25 1\n\n")
+        assert LocalFileStore.read_latest_value(path) == 0.5
+
+        path.write_bytes(b"1 0.5\n2 0.25\n")
+        assert LocalFileStore.read_latest_value(path) == 0.25
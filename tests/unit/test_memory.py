@@ -0,0 +1,168 @@
+"""Unit tests for the conversation memory.
+
+This module contains unit tests for the `mlflow_assistant.engine.memory`
+module, covering history compaction, the SQLite checkpointer and follow-up
+queries continuing a conversation.
+"""
+import asyncio
+from typing import Annotated
+from unittest.mock import MagicMock, patch
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, ToolMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.graph.message import add_messages
+from typing_extensions import TypedDict
+
+from mlflow_assistant.engine.definitions import MEMORY_ELIDED_PREFIX
+from mlflow_assistant.engine.memory import (
+    ConversationMemory,
+    SQLiteCheckpointSaver,
+    compact_history,
+    extractive_summary,
+)
+from mlflow_assistant.engine.processor import process_query
+from mlflow_assistant.engine.workflow import clear_workflow_cache
+
+PROVIDER = {"type": "ollama", "model": "llama3"}
+
+
+def _turn(i, with_tool=False):
+    """Build the messages of one question and answer, with ids like the workflow's."""
+    messages = [HumanMessage(content=f"question {i}", id=f"h{i}")]
+    if with_tool:
+        messages += [
+            AIMessage(content="", id=f"c{i}", tool_calls=[
+                {"name": "list_models", "args": {}, "id": f"call{i}"},
+            ]),
+            ToolMessage(content="x" * 1000, id=f"t{i}", tool_call_id=f"call{i}", name="list_models"),
+        ]
+    messages.append(AIMessage(content=f"answer {i}", id=f"a{i}"))
+    return messages
+
+
+class TestCompactHistory:
+    """Tests for compact_history."""
+
+    def test_short_history_unchanged(self):
+        """Test that recent turns are left alone."""
+        messages = _turn(0, with_tool=True) + _turn(1, with_tool=True)
+        assert compact_history(messages, max_turns=4, tool_output_turns=2) == {}
+
+    def test_elides_old_tool_outputs(self):
+        """Test that tool outputs of older turns are replaced by a preview."""
+        messages = _turn(0, with_tool=True) + _turn(1) + _turn(2)
+        updates = compact_history(messages, max_turns=4, tool_output_turns=2)
+
+        (elided,) = updates["messages"]
+        assert elided.id == "t0"
+        assert elided.tool_call_id == "call0"
+        assert elided.content.startswith(MEMORY_ELIDED_PREFIX)
+        assert len(elided.content) < 300
+
+        # Applying the update keeps the message in place and is not repeated
+        compacted = add_messages(messages, updates["messages"])
+        assert [m.id for m in compacted] == [m.id for m in messages]
+        assert compact_history(compacted, max_turns=4, tool_output_turns=2) == {}
+
+    def test_summarizes_turns_beyond_window(self):
+        """Test that old turns are removed and folded into the summary."""
+        messages = [m for i in range(5) for m in _turn(i, with_tool=True)]
+        updates = compact_history(
+            messages, summary="earlier", max_turns=4, tool_output_turns=1,
+        )
+
+        removed = {m.id for m in updates["messages"] if isinstance(m, RemoveMessage)}
+        assert removed == {m.id for m in messages[:12]}
+        assert updates["summary"].startswith("earlier\nUser: question 0")
+        assert "answer 2" in updates["summary"]
+        assert "xxx" not in updates["summary"]
+
+        compacted = add_messages(messages, updates["messages"])
+        assert [m.id for m in compacted] == ["h3", "c3", "t3", "a3", "h4", "c4", "t4", "a4"]
+        assert compacted[2].content.startswith(MEMORY_ELIDED_PREFIX)
+
+    def test_extractive_summary_bounded(self):
+        """Test that the fallback summary keeps its most recent part."""
+        summary = extractive_summary("old " * 1000, _turn(9))
+        assert len(summary) <= 2000
+        assert summary.endswith("Assistant: answer 9")
+
+
+class Counter(TypedDict):
+    """State of the test graph."""
+
+    messages: Annotated[list, add_messages]
+
+
+def _echo_graph(checkpointer):
+    """Build a graph answering every message, with the given checkpointer."""
+    builder = StateGraph(Counter)
+    builder.add_node("echo", lambda state: {
+        "messages": [AIMessage(content=f"seen {len(state['messages'])}")],
+    })
+    builder.set_entry_point("echo")
+    builder.set_finish_point("echo")
+    return builder.compile(checkpointer=checkpointer)
+
+
+class TestSQLiteCheckpointSaver:
+    """Tests for the SQLiteCheckpointSaver class."""
+
+    def test_conversation_continues_across_instances(self, tmp_path):
+        """Test that a conversation is resumed from the SQLite file."""
+        config = {"configurable": {"thread_id": "session"}}
+        saver = SQLiteCheckpointSaver(tmp_path / "memory.db")
+        _echo_graph(saver).invoke({"messages": [HumanMessage(content="hi")]}, config)
+        saver.close()
+
+        saver = SQLiteCheckpointSaver(tmp_path / "memory.db")
+        graph = _echo_graph(saver)
+        result = asyncio.run(graph.ainvoke({"messages": [HumanMessage(content="again")]}, config))
+
+        assert result["messages"][-1].content == "seen 3"
+        assert graph.get_state({"configurable": {"thread_id": "other"}}).values == {}
+
+    def test_old_checkpoints_pruned(self, tmp_path):
+        """Test that only the latest checkpoints of a conversation are kept."""
+        config = {"configurable": {"thread_id": "session"}}
+        saver = SQLiteCheckpointSaver(tmp_path / "memory.db", checkpoints_kept=3)
+        graph = _echo_graph(saver)
+        for i in range(5):
+            graph.invoke({"messages": [HumanMessage(content=str(i))]}, config)
+
+        history = list(saver.list(config))
+        assert len(history) == 3
+        assert history[0].checkpoint["channel_values"]["messages"][-1].content == "seen 9"
+        assert len(list(saver.list(config, limit=1))) == 1
+
+
+class TestConversationMemory:
+    """Tests for follow-up queries through the workflow."""
+
+    def test_follow_up_sees_history(self):
+        """Test that a second query continues the conversation of the first."""
+        prompts = []
+        model = GenericFakeChatModel(messages=iter([AIMessage("one"), AIMessage("two")]))
+        provider = MagicMock()
+        provider.bound_model.return_value.invoke.side_effect = lambda messages: (
+            prompts.append(messages) or model.invoke(messages)
+        )
+        memory = ConversationMemory(MemorySaver())
+
+        clear_workflow_cache()
+        with patch("mlflow_assistant.engine.workflow.AIProvider.get", return_value=provider):
+            asyncio.run(process_query("first", PROVIDER, memory=memory))
+            result = asyncio.run(process_query("second", PROVIDER, memory=memory))
+
+        assert result["response"].content == "two"
+        assert [m.content for m in prompts[-1]] == ["first", "one", "second"]
+
+    def test_memory_off(self):
+        """Test that no memory is created when it is disabled."""
+        with patch("mlflow_assistant.engine.memory.get_memory_backend", return_value="off"):
+            assert ConversationMemory.from_config() is None
+        with patch("mlflow_assistant.engine.memory.get_memory_backend", return_value="memory"):
+            memory = ConversationMemory.from_config("named")
+        assert memory.config == {"configurable": {"thread_id": "named"}}
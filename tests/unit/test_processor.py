@@ -0,0 +1,99 @@
+"""Unit tests for the query processor.
+
+This module contains unit tests for the `mlflow_assistant.engine.processor`
+module, covering streamed tokens, tool progress events and timings.
+"""
+import asyncio
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from mlflow_assistant.engine.processor import stream_query
+from mlflow_assistant.engine.tool_cache import ToolCallCache
+from mlflow_assistant.engine.tools import get_system_info
+from mlflow_assistant.engine.workflow import clear_workflow_cache
+
+PROVIDER = {"type": "ollama", "model": "llama3"}
+
+
+class FakeChatModel(GenericFakeChatModel):
+    """Fake chat model that also streams tool calls."""
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        message = next(self.messages)
+        if message.tool_calls:
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+                {"name": call["name"], "args": json.dumps(call["args"]), "id": call["id"], "index": i}
+                for i, call in enumerate(message.tool_calls)
+            ]))
+            return
+        for token in re.split(r"(\s)", message.content):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+
+def _stream(messages, tool_cache=None):
+    """Run stream_query against a fake model answering with the given messages."""
+    provider = MagicMock()
+    provider.bound_model.return_value = FakeChatModel(messages=iter(messages))
+
+    async def collect():
+        return [event async for event in stream_query("query", PROVIDER, tool_cache=tool_cache)]
+
+    clear_workflow_cache()
+    with patch("mlflow_assistant.engine.workflow.AIProvider.get", return_value=provider):
+        return asyncio.run(collect())
+
+
+class TestStreamQuery:
+    """Tests for stream_query."""
+
+    def test_streams_tokens(self):
+        """Test that the answer is streamed before the final result."""
+        events = _stream([AIMessage(content="Three models are registered")])
+
+        tokens = [event["content"] for event in events if event["type"] == "token"]
+        result = events[-1]
+        assert "".join(tokens) == "Three models are registered"
+        assert len(tokens) > 1
+        assert result["type"] == "result"
+        assert result["response"].content == "Three models are registered"
+        assert 0 <= result["time_to_first_token"] <= result["duration"]
+        assert result["context_budget"]["tokens_after"] <= result["context_budget"]["budget"]
+
+    def test_reports_tool_progress(self):
+        """Test that tool calls are reported once when they start and finish."""
+        tool_cache = ToolCallCache()
+        tool_cache.put(tool_cache.key(get_system_info, {}), '{"ok":true}')
+        events = _stream(
+            [
+                AIMessage(content="", tool_calls=[
+                    {"name": "get_system_info", "args": {}, "id": "call-1"},
+                ]),
+                AIMessage(content="All good"),
+            ],
+            tool_cache=tool_cache,
+        )
+
+        tool_events = [event for event in events if event["type"].startswith("tool")]
+        assert [event["type"] for event in tool_events] == ["tool_start", "tool_end"]
+        assert tool_events[1]["name"] == "get_system_info"
+        assert tool_events[1]["cache_hit"] is True
+        assert events[-1]["response"].content == "All good"
+
+    def test_error_result(self):
+        """Test that failures still end with a result event."""
+        with patch(
+            "mlflow_assistant.engine.workflow.get_workflow", side_effect=RuntimeError("boom"),
+        ):
+            events = _stream([])
+
+        assert len(events) == 1
+        assert events[0]["type"] == "result"
+        assert events[0]["error"] == "boom"
@@ -4,3 +4,66 @@ This module contains unit tests for verifying the functionality of the
 `mlflow_assistant.core.provider` module, which integrates with various
 large language model (LLM) providers.
 """
+import threading
+
+import pytest
+from langchain_core.tools import tool
+
+from mlflow_assistant.providers import AIProvider
+
+OLLAMA = {"type": "ollama", "model": "llama3", "uri": "http://localhost:11434"}
+
+
+@tool
+def lookup(name: str) -> str:
+    """Look something up.
+
+    Args:
+        name: What to look up
+
+    """
+    return name
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with no cached providers."""
+    AIProvider.clear_cache()
+    yield
+    AIProvider.clear_cache()
+
+
+class TestProviderCache:
+    """Tests for the provider instance cache."""
+
+    def test_same_config_reuses_provider(self):
+        """Test that equal configs share one provider and model."""
+        provider = AIProvider.get(OLLAMA)
+        assert AIProvider.get(dict(reversed(OLLAMA.items()))) is provider
+        assert AIProvider.get({**OLLAMA, "model": "mistral"}) is not provider
+
+    def test_config_key_hides_secrets(self):
+        """Test that the cache key does not contain the raw configuration."""
+        key = AIProvider.config_key({"type": "openai", "api_key": "sk-secret"})
+        assert "sk-secret" not in key
+
+    def test_bound_model_reused(self):
+        """Test that tools are bound once per provider and tool set."""
+        provider = AIProvider.get(OLLAMA)
+        model = provider.bound_model([lookup])
+        assert provider.bound_model([lookup]) is model
+        assert model.kwargs["tools"][0]["function"]["name"] == "lookup"
+
+    def test_concurrent_callers_share_provider(self):
+        """Test that concurrent callers end up with the same instance."""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(AIProvider.get(OLLAMA)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(result is results[0] for result in results)
@@ -0,0 +1,158 @@
+"""Unit tests for the local metadata snapshot.
+
+This module contains unit tests for the `MetadataSnapshot` class, covering
+full builds, incremental refreshes and local queries against the SQLite file.
+"""
+from collections import UserList
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mlflow.entities import ViewType
+
+from mlflow_assistant.core.snapshot import MetadataSnapshot
+
+
+class _Page(UserList):
+    """Minimal stand-in for MLflow's PagedList."""
+
+    def __init__(self, items, token=None):
+        super().__init__(items)
+        self.token = token
+
+
+def _experiment(experiment_id, name, last_update_time=1000):
+    return SimpleNamespace(
+        experiment_id=experiment_id,
+        name=name,
+        artifact_location=f"/artifacts/{experiment_id}",
+        lifecycle_stage="active",
+        creation_time=1000,
+        last_update_time=last_update_time,
+        tags={"team": "ml"},
+    )
+
+
+def _run(run_id, experiment_id, status="FINISHED"):
+    return SimpleNamespace(
+        info=SimpleNamespace(
+            run_id=run_id,
+            experiment_id=experiment_id,
+            run_name=run_id,
+            status=status,
+            lifecycle_stage="active",
+            start_time=1000,
+            end_time=2000,
+        ),
+        data=SimpleNamespace(params={"lr": "0.1"}, metrics={"f1": 0.9}, tags={}),
+    )
+
+
+def _model(name, last_updated_timestamp=1000):
+    return SimpleNamespace(
+        name=name,
+        creation_timestamp=1000,
+        last_updated_timestamp=last_updated_timestamp,
+        description="",
+        tags={},
+        latest_versions=[],
+    )
+
+
+@pytest.fixture
+def client():
+    """Mock MLflow client with two experiments, three runs and one model."""
+    client = MagicMock()
+    client.search_experiments.return_value = _Page(
+        [_experiment("1", "churn"), _experiment("2", "fraud")],
+    )
+    client.search_runs.return_value = _Page(
+        [_run("a", "1"), _run("b", "1", status="RUNNING"), _run("c", "2")],
+    )
+    client.search_registered_models.return_value = _Page([_model("churn-model")])
+    return client
+
+
+class TestMetadataSnapshot:
+    """Tests for the MetadataSnapshot class."""
+
+    def test_build_and_query(self, tmp_path, client):
+        """Test that a built snapshot answers queries locally."""
+        snapshot = MetadataSnapshot(tmp_path / "snapshot.db")
+
+        counts = snapshot.build(client, "http://test:5000")
+
+        assert counts == {"experiments": 2, "runs": 3, "models": 1}
+        assert snapshot.is_fresh("http://test:5000", max_age=60)
+        assert not snapshot.is_fresh("http://other:5000", max_age=60)
+
+        experiments = {exp["name"]: exp for exp in snapshot.list_experiments()}
+        assert experiments["churn"]["run_count"] == 2
+        assert experiments["churn"]["tags"] == {"team": "ml"}
+        assert [exp["name"] for exp in snapshot.list_experiments("FRA")] == ["fraud"]
+        assert [model["name"] for model in snapshot.list_models("churn")] == ["churn-model"]
+        assert snapshot.list_models("churn_") == []
+        assert snapshot.list_experiments("%") == []
+        assert snapshot.get_counts() == {
+            "experiment_count": 2,
+            "model_count": 1,
+            "active_runs": 1,
+        }
+
+    def test_refresh_is_incremental(self, tmp_path, client):
+        """Test that a refresh only asks for changes since the previous one."""
+        snapshot = MetadataSnapshot(tmp_path / "snapshot.db")
+        snapshot.build(client, "http://test:5000")
+
+        client.search_experiments.reset_mock()
+        client.search_runs.reset_mock()
+        client.search_experiments.return_value = _Page([])
+        client.search_runs.return_value = _Page([])
+        client.search_registered_models.return_value = _Page([_model("churn-model")])
+
+        counts = snapshot.refresh(client, "http://test:5000")
+
+        assert counts == {"experiments": 0, "runs": 0, "models": 0}
+        assert "last_update_time > 1000" in (
+            client.search_experiments.call_args.kwargs["filter_string"]
+        )
+        filters = {
+            call.kwargs["filter_string"] for call in client.search_runs.call_args_list
+        }
+        assert "attributes.status = 'RUNNING'" in filters
+        assert len(snapshot.list_experiments()) == 2
+
+    def test_refresh_reconciles_deletions(self, tmp_path, client):
+        """Test that deleted models and runs disappear from the snapshot."""
+        snapshot = MetadataSnapshot(tmp_path / "snapshot.db")
+        snapshot.build(client, "http://test:5000")
+
+        deleted_runs = [_run("a", "1")]
+        restored_runs = []
+
+        def search_runs(run_view_type, filter_string, **kwargs):
+            if run_view_type == ViewType.DELETED_ONLY:
+                return _Page(deleted_runs)
+            if filter_string.startswith("attributes.run_id IN"):
+                return _Page(restored_runs)
+            return _Page([])
+
+        client.search_experiments.return_value = _Page([])
+        client.search_runs.side_effect = search_runs
+        client.search_registered_models.return_value = _Page([])
+
+        counts = snapshot.refresh(client, "http://test:5000")
+
+        assert counts == {"experiments": 0, "runs": 1, "models": 1}
+        assert snapshot.list_models() == []
+        experiments = {exp["name"]: exp for exp in snapshot.list_experiments()}
+        assert experiments["churn"]["run_count"] == 1
+
+        # A run no longer deleted on the server is restored if it still exists
+        deleted_runs.clear()
+        restored_runs.append(_run("a", "1"))
+        snapshot.refresh(client, "http://test:5000")
+
+        experiments = {exp["name"]: exp for exp in snapshot.list_experiments()}
+        assert experiments["churn"]["run_count"] == 2
@@ -0,0 +1,81 @@
+"""Unit tests for the per-session tool call cache.
+
+This module contains unit tests for the `mlflow_assistant.engine.tool_cache`
+module, covering argument normalization, cache hits recorded on tool
+messages, error results and expiry.
+"""
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from langgraph.prebuilt import ToolNode
+
+from mlflow_assistant.engine.tool_cache import ToolCallCache
+
+calls = []
+
+
+@tool
+def lookup(name: str, limit: int = 10) -> str:
+    """Look something up.
+
+    Args:
+        name: What to look up
+        limit: Maximum number of results
+
+    """
+    calls.append((name, limit))
+    if name == "broken":
+        return '{"error":"failed"}'
+    return f"{name}:{limit}"
+
+
+def _call(node, args, call_id):
+    """Run one tool call through a ToolNode and return the tool message."""
+    message = AIMessage(
+        content="", tool_calls=[{"name": "lookup", "args": args, "id": call_id}],
+    )
+    return node.invoke({"messages": [message]})["messages"][0]
+
+
+class TestToolCallCache:
+    """Tests for the ToolCallCache class."""
+
+    def setup_method(self):
+        """Forget the calls recorded by previous tests."""
+        calls.clear()
+
+    def test_repeated_call_is_a_cache_hit(self):
+        """Test that a repeated call is answered from the cache and marked as such."""
+        cache = ToolCallCache()
+        node = ToolNode([cache.wrap(lookup)])
+
+        first = _call(node, {"name": "models"}, "1")
+        second = _call(node, {"name": "models", "limit": 10}, "2")
+
+        assert first.content == second.content == "models:10"
+        assert first.artifact == {"cache_hit": False}
+        assert second.artifact == {"cache_hit": True}
+        assert calls == [("models", 10)]
+        assert cache.cache_info()["hits"] == 1
+
+    def test_different_arguments_are_not_shared(self):
+        """Test that calls with different arguments are cached separately."""
+        cache = ToolCallCache()
+        node = ToolNode([cache.wrap(lookup)])
+
+        _call(node, {"name": "models", "limit": 5}, "1")
+        _call(node, {"name": "models"}, "2")
+
+        assert calls == [("models", 5), ("models", 10)]
+
+    def test_errors_and_expired_entries_are_not_reused(self):
+        """Test that error results and expired entries call the tool again."""
+        cache = ToolCallCache(ttl=0)
+        node = ToolNode([cache.wrap(lookup)])
+
+        _call(node, {"name": "broken"}, "1")
+        _call(node, {"name": "broken"}, "2")
+        _call(node, {"name": "models"}, "3")
+        _call(node, {"name": "models"}, "4")
+
+        assert len(calls) == 4
+        assert cache.cache_info()["hits"] == 0
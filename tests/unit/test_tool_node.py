@@ -0,0 +1,111 @@
+"""Unit tests for concurrent tool call execution.
+
+This module contains unit tests for the `mlflow_assistant.engine.tool_node`
+module, covering concurrent execution, the concurrency limit and timeouts.
+"""
+import asyncio
+import json
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from mlflow_assistant.engine.tool_node import ParallelToolNode
+
+DELAY = 0.3
+
+
+@tool
+def slow_lookup(name: str) -> str:
+    """Look something up slowly.
+
+    Args:
+        name: What to look up
+
+    """
+    time.sleep(DELAY)
+    return name
+
+
+@tool
+async def stuck_lookup(name: str) -> str:
+    """Look something up and never finish in time.
+
+    Args:
+        name: What to look up
+
+    """
+    await asyncio.sleep(10)
+    return name
+
+
+def _turn(tool_name, count):
+    """Build a model turn asking for several tool calls at once."""
+    return {"messages": [AIMessage(content="", tool_calls=[
+        {"name": tool_name, "args": {"name": f"item-{i}"}, "id": f"call-{i}"}
+        for i in range(count)
+    ])]}
+
+
+class TestParallelToolNode:
+    """Tests for the ParallelToolNode class."""
+
+    def test_async_calls_run_concurrently(self):
+        """Test that a turn takes about as long as its slowest call."""
+        node = ParallelToolNode([slow_lookup], max_concurrency=3)
+        start = time.monotonic()
+        messages = asyncio.run(node.ainvoke(_turn("slow_lookup", 3)))["messages"]
+        elapsed = time.monotonic() - start
+
+        assert [m.content for m in messages] == ["item-0", "item-1", "item-2"]
+        assert elapsed < 2 * DELAY
+
+    def test_sync_calls_run_concurrently(self):
+        """Test concurrent execution when the node is invoked synchronously."""
+        node = ParallelToolNode([slow_lookup], max_concurrency=3)
+        start = time.monotonic()
+        messages = node.invoke(_turn("slow_lookup", 3))["messages"]
+        elapsed = time.monotonic() - start
+
+        assert [m.tool_call_id for m in messages] == ["call-0", "call-1", "call-2"]
+        assert elapsed < 2 * DELAY
+
+    def test_concurrency_limit(self):
+        """Test that no more than max_concurrency calls run at once."""
+        node = ParallelToolNode([slow_lookup], max_concurrency=1)
+        start = time.monotonic()
+        asyncio.run(node.ainvoke(_turn("slow_lookup", 2)))
+        assert time.monotonic() - start >= 2 * DELAY
+
+    def test_async_timeout(self):
+        """Test that a stuck call becomes an error message."""
+        node = ParallelToolNode([slow_lookup, stuck_lookup], timeout=DELAY * 2)
+        turn = _turn("stuck_lookup", 1)
+        turn["messages"][0].tool_calls.append(
+            {"name": "slow_lookup", "args": {"name": "fast"}, "id": "call-fast", "type": "tool_call"},
+        )
+        start = time.monotonic()
+        stuck, fast = asyncio.run(node.ainvoke(turn))["messages"]
+
+        assert time.monotonic() - start < 5
+        assert stuck.status == "error"
+        assert "error" in json.loads(stuck.content)
+        assert fast.content == "fast"
+
+    def test_sync_timeout(self):
+        """Test that the sync path does not wait for calls that timed out."""
+        node = ParallelToolNode([slow_lookup], timeout=DELAY / 3)
+        start = time.monotonic()
+        messages = node.invoke(_turn("slow_lookup", 2))["messages"]
+
+        assert time.monotonic() - start < DELAY
+        assert all(m.status == "error" for m in messages)
+
+    def test_async_timeout_includes_queueing(self):
+        """Test that calls queued behind the concurrency limit share the turn's timeout."""
+        node = ParallelToolNode([slow_lookup], max_concurrency=1, timeout=DELAY * 1.5)
+        start = time.monotonic()
+        messages = asyncio.run(node.ainvoke(_turn("slow_lookup", 3)))["messages"]
+
+        assert time.monotonic() - start < DELAY * 2.5
+        assert [m.status for m in messages] == ["success", "error", "error"]
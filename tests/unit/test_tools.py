@@ -0,0 +1,1118 @@
+"""Unit tests for the LangGraph tools in MLflow Assistant.
+
+This module contains unit tests for the `mlflow_assistant.engine.tools` module,
+which exposes MLflow queries to the agent as LangGraph tools.
+"""
+import asyncio
+import itertools
+import json
+import threading
+import time
+
+import pytest
+from collections import UserList
+from mlflow.tracking import MlflowClient
+from unittest.mock import MagicMock, patch
+
+from mlflow_assistant.engine import tools
+from mlflow_assistant.utils.exceptions import MLflowConnectionError
+
+NEXT_PAGE = "next"
+
+
+@pytest.fixture(autouse=True)
+def reset_connection():
+    """Ensure every test starts without a shared MLflow connection."""
+    tools.reset_mlflow_connection()
+    yield
+    tools.reset_mlflow_connection()
+
+
+class TestSharedConnection:
+    """Tests for the lazily created, shared MLflow connection."""
+
+    def test_import_does_not_connect(self):
+        """Test that importing the tools module does not open a connection."""
+        assert vars(tools)["_mlflow_connection"] is None
+
+    def test_connection_created_once(self):
+        """Test that the connection is created on first use and then reused."""
+        mock_connection = MagicMock()
+        mock_connection.connect.return_value = (True, "connected")
+        mock_connection.ensure_connected.return_value = (True, "connected")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection",
+            return_value=mock_connection,
+        ) as mock_connection_class, patch(
+            "mlflow_assistant.engine.tools.get_mlflow_uri",
+            return_value="http://test:5000",
+        ):
+            first = tools.get_client()
+            second = tools.get_client()
+
+        mock_connection_class.assert_called_once_with(tracking_uri="http://test:5000")
+        mock_connection.connect.assert_called_once()
+        assert first is second
+
+    def test_unhealthy_connection_reconnects(self):
+        """Test that a connection is checked, and reconnected, on later calls."""
+        mock_connection = MagicMock()
+        mock_connection.connect.return_value = (True, "connected")
+        mock_connection.ensure_connected.return_value = (False, "Failed to reconnect")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection",
+            return_value=mock_connection,
+        ) as mock_connection_class, patch(
+            "mlflow_assistant.engine.tools.get_mlflow_uri",
+            return_value="http://test:5000",
+        ):
+            tools.get_client()
+            with pytest.raises(MLflowConnectionError, match="Failed to reconnect"):
+                tools.get_client()
+
+        mock_connection_class.assert_called_once()
+        mock_connection.ensure_connected.assert_called_once()
+
+    def test_reconnect_does_not_block_other_servers(self):
+        """Test that backing off on the primary server leaves other servers usable."""
+        reconnecting = threading.Event()
+        release = threading.Event()
+
+        def slow_reconnect():
+            reconnecting.set()
+            release.wait(5)
+            return True, "connected"
+
+        primary = MagicMock()
+        primary.connect.return_value = (True, "connected")
+        primary.ensure_connected.side_effect = slow_reconnect
+        other = MagicMock()
+        other.connect.return_value = (True, "connected")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection",
+            side_effect=[primary, other],
+        ), patch(
+            "mlflow_assistant.engine.tools.get_mlflow_uri",
+            return_value="http://test:5000",
+        ), patch(
+            "mlflow_assistant.engine.tools.get_mlflow_servers",
+            return_value={"other": "http://other:5000"},
+        ):
+            tools.get_client()
+            worker = threading.Thread(target=tools.get_client)
+            worker.start()
+            try:
+                assert reconnecting.wait(5)
+                clients = []
+                federated = threading.Thread(
+                    target=lambda: clients.append(tools.get_server_client("other")),
+                )
+                federated.start()
+                federated.join(1)
+                assert clients == [other.get_cached_client()]
+            finally:
+                release.set()
+                worker.join()
+                federated.join()
+
+    def test_server_connected_once_by_concurrent_calls(self):
+        """Test that concurrent fan-out calls share one connection per server."""
+        connected = threading.Event()
+
+        def build(tracking_uri, make_default):
+            connection = MagicMock()
+            connection.config.tracking_uri = tracking_uri
+
+            def connect():
+                connected.wait(0.2)
+                return True, "connected"
+
+            connection.connect.side_effect = connect
+            return connection
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection", side_effect=build,
+        ) as mock_connection_class, patch(
+            "mlflow_assistant.engine.tools.get_mlflow_servers",
+            return_value={"other": "http://other:5000"},
+        ):
+            clients = []
+            threads = [
+                threading.Thread(target=lambda: clients.append(tools.get_server_client("other")))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            connected.set()
+            for thread in threads:
+                thread.join()
+
+        mock_connection_class.assert_called_once()
+        assert all(client is clients[0] for client in clients)
+
+    def test_replaced_server_connection_is_closed(self):
+        """Test that a server moved to another URI gets a new connection and the old one is closed."""
+        old, new = MagicMock(), MagicMock()
+        old.config.tracking_uri = "http://old:5000"
+        new.config.tracking_uri = "http://new:5000"
+        for connection in (old, new):
+            connection.connect.return_value = (True, "connected")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection", side_effect=[old, new],
+        ), patch(
+            "mlflow_assistant.engine.tools.get_mlflow_servers",
+            side_effect=[{"other": "http://old:5000"}, {"other": "http://new:5000"}],
+        ):
+            tools.get_server_client("other")
+            assert tools.get_server_client("other") is new.get_cached_client()
+
+        old.close.assert_called_once()
+        new.close.assert_not_called()
+
+    def test_failed_server_connection_is_closed(self):
+        """Test that a connection which could not connect is closed, not kept."""
+        failed = MagicMock()
+        failed.connect.return_value = (False, "Failed to connect")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection", return_value=failed,
+        ), patch(
+            "mlflow_assistant.engine.tools.get_mlflow_servers",
+            return_value={"other": "http://other:5000"},
+        ), pytest.raises(MLflowConnectionError):
+            tools.get_server_client("other")
+
+        failed.close.assert_called_once()
+        assert "other" not in vars(tools)["_server_connections"]
+
+    def test_connection_failure_raises(self):
+        """Test that a failed connection raises MLflowConnectionError."""
+        mock_connection = MagicMock()
+        mock_connection.connect.return_value = (False, "Failed to connect")
+
+        with patch(
+            "mlflow_assistant.engine.tools.MLflowConnection",
+            return_value=mock_connection,
+        ), patch(
+            "mlflow_assistant.engine.tools.get_mlflow_uri",
+            return_value="http://test:5000",
+        ), pytest.raises(MLflowConnectionError, match="Failed to connect"):
+            tools.get_client()
+
+
+class TestToolSettings:
+    """Tests for the tool settings read from the configuration."""
+
+    def test_settings_are_read_once(self):
+        """Test that tool calls do not re-read the configuration file."""
+        with patch.object(
+            tools, "get_tool_token_budget", return_value=50,
+        ) as mock_budget, patch.object(
+            tools, "get_mlflow_uri", return_value="http://test:5000",
+        ) as mock_uri:
+            tools.MLflowTools.encode({"a": 1})
+            tools.MLflowTools.encode({"a": 2})
+            tools.get_local_store()
+            settings = tools.get_tool_settings()
+
+            assert mock_budget.call_count == 1
+            assert mock_uri.call_count == 1
+            assert settings.token_budget == 50
+            assert settings.tracking_uri == "http://test:5000"
+
+            tools.reset_mlflow_connection()
+            tools.get_tool_settings()
+
+            assert mock_budget.call_count == 2
+
+    def test_token_budget_follows_provider(self):
+        """Test that the default tool budget fits the provider's prompt budget."""
+        with patch.object(tools, "get_tool_token_budget", return_value=None), patch.object(
+            tools, "get_provider_config", return_value={"type": "ollama"},
+        ):
+            ollama = tools.get_tool_settings().token_budget
+            tools.reset_mlflow_connection()
+            with patch.object(tools, "get_provider_config", return_value={"type": "openai"}):
+                openai = tools.get_tool_settings().token_budget
+
+        assert ollama < openai
+
+
+class _Page(UserList):
+    """Minimal stand-in for MLflow's PagedList."""
+
+    def __init__(self, items, token=None):
+        super().__init__(items)
+        self.token = token
+
+
+class TestCountRuns:
+    """Tests for MLflowTools.count_runs."""
+
+    def test_counts_follow_pagination(self):
+        """Test that counts are exact across several pages."""
+        client = MagicMock()
+        pages = {
+            None: _Page(range(1000), "page-2"),
+            "page-2": _Page(range(1000), "page-3"),
+            "page-3": _Page(range(7)),
+        }
+        client.search_runs.side_effect = (
+            lambda page_token, **kwargs: pages[page_token]
+        )
+
+        counts = tools.MLflowTools.count_runs(client, ["1"])
+
+        assert counts["1"].count == 2007
+        assert counts["1"].exact is True
+        assert counts["1"].to_value() == 2007
+
+    def test_time_budget_exceeded(self):
+        """Test that counting stops and reports unknown once the budget is spent."""
+        client = MagicMock()
+
+        counts = tools.MLflowTools.count_runs(client, ["1", "2"], time_budget=-1)
+
+        client.search_runs.assert_not_called()
+        assert counts["1"].exact is False
+        assert "Unknown" in counts["2"].to_value()
+
+    def test_error_is_reported_per_experiment(self):
+        """Test that a failing experiment does not affect the others."""
+        client = MagicMock()
+
+        def search_runs(experiment_ids, **kwargs):
+            if experiment_ids == ["bad"]:
+                msg = "boom"
+                raise RuntimeError(msg)
+            return _Page(range(3))
+
+        client.search_runs.side_effect = search_runs
+
+        counts = tools.MLflowTools.count_runs(client, ["good", "bad"])
+
+        assert counts["good"].to_value() == 3
+        assert counts["bad"].to_value() == "Error getting count"
+
+    def test_count_runs_across_chunks_experiments(self):
+        """Test that experiments are searched in chunks and the counts summed."""
+        client = MagicMock()
+        client.search_runs.side_effect = lambda experiment_ids, **kwargs: _Page(
+            range(len(experiment_ids)),
+        )
+        experiment_ids = [str(i) for i in range(250)]
+
+        with patch("mlflow_assistant.engine.tools.SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE", 100):
+            count = tools.MLflowTools.count_runs_across(
+                client, experiment_ids, filter_string="attributes.status = 'RUNNING'",
+            )
+
+        assert count.to_value() == 250
+        assert client.search_runs.call_count == 3
+
+
+class TestFetchRuns:
+    """Tests for MLflowTools.fetch_runs."""
+
+    def test_runs_are_deduplicated(self):
+        """Test that each distinct run ID is fetched exactly once."""
+        client = MagicMock()
+        client.get_run.side_effect = lambda run_id: f"run-{run_id}"
+
+        runs = tools.MLflowTools.fetch_runs(client, ["a", "b", "a", None, "b"])
+
+        assert runs == {"a": "run-a", "b": "run-b"}
+        assert client.get_run.call_count == 2
+
+    def test_errors_are_returned_per_run(self):
+        """Test that a failing run lookup is returned as its exception."""
+        client = MagicMock()
+        client.get_run.side_effect = RuntimeError("not found")
+
+        runs = tools.MLflowTools.fetch_runs(client, ["a"])
+
+        assert isinstance(runs["a"], RuntimeError)
+
+
+class TestSearchHelpers:
+    """Tests for the server-side filtering and pagination helpers."""
+
+    def test_name_filter(self):
+        """Test that name filters are translated into ILIKE expressions."""
+        assert tools.MLflowTools.name_filter("churn") == "name ILIKE '%churn%'"
+        assert tools.MLflowTools.name_filter("a%b") == "name ILIKE '%a_b%'"
+        assert tools.MLflowTools.name_filter("bob's \"x\"") == "name ILIKE '%bob_s _x_%'"
+
+    def test_name_filter_matches_exact_substrings(self, tmp_path):
+        """Test that wildcards and quotes in names are matched literally by a real store."""
+        client = MlflowClient(tracking_uri=(tmp_path / "mlruns").as_uri())
+        for name in ("a%b", "axb", "a_b", "bob-s"):
+            client.create_experiment(name)
+
+        def names(name_contains):
+            experiments, _ = tools.MLflowTools.search_page(
+                client.search_experiments, 10,
+                filter_string=tools.MLflowTools.name_filter(name_contains),
+                keep=tools.MLflowTools.name_matcher(name_contains),
+            )
+            return sorted(exp.name for exp in experiments)
+
+        assert names("A%b") == ["a%b"]
+        assert names("a_b") == ["a_b"]
+        # Quotes no longer break the filter; they only match themselves
+        assert names("bob's \"x") == []
+        assert names("-S") == ["bob-s"]
+
+    def test_iter_search_stops_at_max_results(self):
+        """Test that no further pages are requested once enough items are collected."""
+        search = MagicMock(
+            side_effect=[_Page(range(2), NEXT_PAGE), _Page(range(2), "more")],
+        )
+
+        results = list(
+            tools.MLflowTools.iter_search(search, max_results=3, page_size=2, filter_string="f"),
+        )
+
+        assert results == [0, 1, 0]
+        assert search.call_count == 2
+        search.assert_called_with(max_results=1, page_token=NEXT_PAGE, filter_string="f")
+
+    def test_iter_search_follows_all_pages(self):
+        """Test that all pages are followed when no limit is given."""
+        search = MagicMock(side_effect=[_Page([1], NEXT_PAGE), _Page([2])])
+
+        assert list(tools.MLflowTools.iter_search(search)) == [1, 2]
+
+
+class TestCursorPagination:
+    """Tests for the cursor-based paging helpers."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it was built from."""
+        cursor = tools.MLflowTools.encode_cursor(page_token=NEXT_PAGE, offset=3)
+
+        assert tools.MLflowTools.decode_cursor(cursor) == {"page_token": NEXT_PAGE, "offset": 3}
+        assert tools.MLflowTools.decode_cursor("") == {}
+
+    def test_invalid_cursor(self):
+        """Test that a malformed cursor raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            tools.MLflowTools.decode_cursor("not-a-cursor")
+
+    def test_page_size_is_bounded(self):
+        """Test that requested page sizes are clamped."""
+        assert tools.MLflowTools.page_size(0) == 1
+        assert tools.MLflowTools.page_size(10_000) == tools.TOOL_MAX_PAGE_SIZE
+
+    def test_search_page_returns_next_cursor(self):
+        """Test that a page ends with a cursor resuming at the server token."""
+        search = MagicMock(return_value=_Page(range(2), NEXT_PAGE))
+
+        items, next_cursor = tools.MLflowTools.search_page(search, 2, filter_string="f")
+
+        assert items == [0, 1]
+        search.assert_called_once_with(max_results=2, page_token=None, filter_string="f")
+        assert tools.MLflowTools.decode_cursor(next_cursor) == {"page_token": NEXT_PAGE}
+
+    def test_search_page_last_page(self):
+        """Test that the last page has no next cursor."""
+        search = MagicMock(return_value=_Page(range(1)))
+
+        items, next_cursor = tools.MLflowTools.search_page(search, 5, NEXT_PAGE)
+
+        assert items == [0]
+        assert next_cursor is None
+        search.assert_called_once_with(max_results=5, page_token=NEXT_PAGE)
+
+
+class TestRunColumn:
+    """Tests for MLflowTools.run_column."""
+
+    def test_columns(self):
+        """Test that metric, param, tag and attribute columns are resolved."""
+        run = MagicMock()
+        run.data.metrics = {"f1": 0.9}
+        run.data.params = {"lr": "0.1"}
+        run.data.tags = {"team": "ml"}
+        run.info.status = "FINISHED"
+
+        assert tools.MLflowTools.run_column(run, "metrics.f1") == 0.9
+        assert tools.MLflowTools.run_column(run, "params.lr") == "0.1"
+        assert tools.MLflowTools.run_column(run, "tags.team") == "ml"
+        assert tools.MLflowTools.run_column(run, "status") == "FINISHED"
+        assert tools.MLflowTools.run_column(run, "attributes.status") == "FINISHED"
+        assert tools.MLflowTools.run_column(run, "metrics.missing") is None
+
+
+class TestFederation:
+    """Tests for queries fanned out across several tracking servers."""
+
+    def test_across_servers_isolates_failures_and_timeouts(self):
+        """Test that failing and slow servers are reported without losing results."""
+        clients = {"a": "client-a", "b": "client-b", "slow": "client-slow"}
+        release = threading.Event()
+
+        def query(client):
+            if client == "client-b":
+                msg = "Server error"
+                raise RuntimeError(msg)
+            if client == "client-slow":
+                release.wait(5)
+            return [client]
+
+        with patch.object(tools, "get_server_client", side_effect=clients.get):
+            start = time.monotonic()
+            results, errors = tools.MLflowTools.across_servers(
+                ["a", "b", "slow"], query, timeout=0.2,
+            )
+            elapsed = time.monotonic() - start
+        release.set()
+
+        assert results == {"a": ["client-a"]}
+        assert errors["b"] == "Server error"
+        assert "slow" in errors
+        assert elapsed < 2
+
+    def test_sort_rows_puts_missing_values_last(self):
+        """Test merging rows by an ordering clause."""
+        rows = [{"metrics.f1": 0.5}, {}, {"metrics.f1": 0.9}]
+
+        assert tools.MLflowTools.sort_rows(rows, "metrics.f1 DESC") == [
+            {"metrics.f1": 0.9}, {"metrics.f1": 0.5}, {},
+        ]
+        assert tools.MLflowTools.sort_rows(rows, "metrics.f1")[0] == {"metrics.f1": 0.5}
+
+    def test_search_all_servers_tags_results(self):
+        """Test that merged experiments are tagged with their server."""
+        def client_for(server):
+            experiment = MagicMock(experiment_id="1", lifecycle_stage="active", creation_time=0)
+            experiment.name = f"{server}-exp"
+            client = MagicMock()
+            client.search_experiments.return_value = _Page([experiment])
+            return client
+
+        with patch.object(
+            tools, "get_mlflow_servers", return_value={"team-a": "http://a", "team-b": "http://b"},
+        ), patch.object(tools, "get_server_client", side_effect=client_for):
+            result = json.loads(tools.search_all_servers.invoke({"entity": "experiments"}))
+
+        columns = result["experiments"]["columns"]
+        rows = [dict(zip(columns, row, strict=False)) for row in result["experiments"]["rows"]]
+        assert [(row["server"], row["name"]) for row in rows] == [
+            ("team-a", "team-a-exp"), ("team-b", "team-b-exp"),
+        ]
+
+    def test_search_all_servers_requires_servers(self):
+        """Test the error returned when no servers are configured."""
+        with patch.object(tools, "get_mlflow_servers", return_value={}):
+            result = json.loads(tools.search_all_servers.invoke({}))
+
+        assert "No MLflow servers configured" in result["error"]
+
+
+class TestArtifacts:
+    """Tests for the artifact helpers."""
+
+    def test_walk_is_lazy_and_breadth_first(self):
+        """Test that directories are listed only when the walk reaches them."""
+        def file_info(path, is_dir=False):
+            return MagicMock(path=path, is_dir=is_dir)
+
+        tree = {
+            None: [file_info("model", is_dir=True), file_info("readme.txt")],
+            "model": [file_info("model/sub", is_dir=True), file_info("model/MLmodel")],
+            "model/sub": [file_info("model/sub/w.bin")],
+        }
+        client = MagicMock()
+        client.list_artifacts.side_effect = lambda run_id, path: tree[path]
+
+        walk = tools.MLflowTools.walk_artifacts(client, "run", max_depth=2)
+        first_two = [info.path for info, _ in itertools.islice(walk, 2)]
+
+        assert first_two == ["model", "readme.txt"]
+        assert client.list_artifacts.call_count == 1
+
+        remaining = [(info.path, depth) for info, depth in walk]
+        assert remaining == [("model/sub", 2), ("model/MLmodel", 2)]
+        assert client.list_artifacts.call_count == 2
+
+    def test_decode_text(self):
+        """Test text detection, tolerating a character cut at the end of the range."""
+        assert tools.MLflowTools.decode_text("héllo".encode()) == "héllo"
+        assert tools.MLflowTools.decode_text("hé".encode()[:-1]) == "h"
+        assert tools.MLflowTools.decode_text(b"a\x00b") is None
+        assert tools.MLflowTools.decode_text(bytes([0xFF, 0xFE, 0x41, 0x42, 0x43])) is None
+
+
+class TestSystemInfo:
+    """Tests for the get_system_info tool."""
+
+    def test_reports_configured_store(self):
+        """Test that the URIs are those of the connected store, without starting a run."""
+        connection = MagicMock()
+        connection.config.tracking_uri = "http://test:5000"
+        reader = MagicMock()
+        reader.get_counts.return_value = {"experiment_count": 2}
+
+        with patch.object(
+            tools, "get_mlflow_connection", return_value=connection,
+        ), patch.object(tools, "get_snapshot", return_value=reader), patch(
+            "mlflow.start_run",
+        ) as mock_start_run:
+            result = json.loads(tools.get_system_info.invoke({}))
+
+        assert result["tracking_uri"] == "http://test:5000"
+        assert result["experiment_count"] == 2
+        assert "artifact_uri" not in result
+        mock_start_run.assert_not_called()
+
+    def test_counts_from_client(self):
+        """Test that counts come from the connected client without a local reader."""
+        connection = MagicMock()
+        connection.config.tracking_uri = "http://test:5000"
+        client = connection.get_cached_client.return_value
+        client.search_experiments.return_value = _Page(
+            [MagicMock(experiment_id="1"), MagicMock(experiment_id="2")],
+        )
+        client.search_registered_models.return_value = _Page([MagicMock()])
+        client.search_runs.return_value = _Page(range(3))
+
+        with patch.object(
+            tools, "get_mlflow_connection", return_value=connection,
+        ), patch.object(tools, "get_snapshot", return_value=None), patch.object(
+            tools, "get_local_store", return_value=None,
+        ):
+            result = json.loads(tools.get_system_info.invoke({}))
+
+        assert result["tracking_uri"] == "http://test:5000"
+        assert result["experiment_count"] == 2
+        assert result["model_count"] == 1
+        assert result["active_runs"] == 3
+
+
+def _rows(table):
+    """Turn a table produced by the encoder back into a list of dicts."""
+    return [dict(zip(table["columns"], row, strict=True)) for row in table["rows"]]
+
+
+def _connection(client, remote=False):
+    """Build a mock connection serving a client, over REST if remote."""
+    connection = MagicMock()
+    connection.get_cached_client.return_value = client
+    connection.supports_async.return_value = remote
+    return connection
+
+
+class _AsyncClient:
+    """Stand-in for AsyncMLflowClient answering from canned REST payloads."""
+
+    def __init__(self, runs=None, counts=None):
+        self.runs = runs or {}
+        self.counts = counts or {}
+
+    async def get_runs(self, run_ids):
+        await asyncio.sleep(0)
+        return {run_id: self.runs[run_id] for run_id in run_ids}
+
+    async def count_runs(self, experiment_ids, filter_string="", time_budget=None):
+        await asyncio.sleep(0)
+        return {experiment_id: self.counts[experiment_id] for experiment_id in experiment_ids}
+
+
+def _remote_connection(client, async_client):
+    """Build a mock REST connection whose async queries run on async_client."""
+    connection = _connection(client, remote=True)
+    connection.run_async.side_effect = lambda query: asyncio.run(query(async_client))
+    return connection
+
+
+def _registered_model(name, latest_versions=()):
+    """Build a mock registered model."""
+    model = MagicMock(
+        creation_timestamp=0,
+        last_updated_timestamp=0,
+        description="",
+        tags=[],
+        latest_versions=list(latest_versions),
+    )
+    model.name = name
+    return model
+
+
+def _model_version(version, run_id):
+    """Build a mock model version."""
+    return MagicMock(
+        version=str(version),
+        status="READY",
+        current_stage="None",
+        creation_timestamp=0,
+        source=f"runs:/{run_id}/model",
+        run_id=run_id,
+    )
+
+
+class TestModelDetails:
+    """Tests for the get_model_details tool."""
+
+    def test_runs_are_fetched_once_per_run(self):
+        """Test that versions sharing a run fetch it once, and failures stay per version."""
+        client = MagicMock()
+        client.get_registered_model.return_value = _registered_model("churn")
+        client.search_model_versions.return_value = [
+            _model_version(1, "a"), _model_version(2, "b"), _model_version(3, "a"),
+        ]
+
+        def get_run(run_id):
+            if run_id == "b":
+                msg = "not found"
+                raise RuntimeError(msg)
+            return MagicMock(
+                info=MagicMock(status="FINISHED", start_time=0, end_time=None),
+                data=MagicMock(metrics={"f1": 0.9}),
+            )
+
+        client.get_run.side_effect = get_run
+
+        with patch.object(tools, "get_mlflow_connection", return_value=_connection(client)), patch.object(
+            tools, "get_local_store", return_value=None,
+        ):
+            result = json.loads(tools.get_model_details.invoke({"model_name": "churn"}))
+
+        versions = _rows(result["versions"])
+        assert [version["version"] for version in versions] == ["3", "2", "1"]
+        assert versions[0]["run"]["metrics"] == {"f1": 0.9}
+        assert versions[1]["run"] == "Error retrieving run details"
+        assert sorted(call.args[0] for call in client.get_run.call_args_list) == ["a", "b"]
+
+    def test_runs_are_fetched_with_async_client(self):
+        """Test that a REST server's runs are gathered with the async client."""
+        client = MagicMock()
+        client.get_registered_model.return_value = _registered_model("churn")
+        client.search_model_versions.return_value = [
+            _model_version(1, "a"), _model_version(2, "b"),
+        ]
+        async_client = _AsyncClient(runs={
+            "a": {
+                "info": {"status": "FINISHED", "start_time": "1700000000000"},
+                "data": {"metrics": [{"key": "f1", "value": 0.9, "step": 0}]},
+            },
+            "b": RuntimeError("not found"),
+        })
+
+        with patch.object(
+            tools, "get_mlflow_connection", return_value=_remote_connection(client, async_client),
+        ), patch.object(tools, "get_local_store", return_value=None):
+            result = json.loads(tools.get_model_details.invoke({"model_name": "churn"}))
+
+        versions = {version["version"]: version for version in _rows(result["versions"])}
+        assert versions["1"]["run"]["metrics"] == {"f1": 0.9}
+        assert versions["1"]["run"]["status"] == "FINISHED"
+        assert versions["2"]["run"] == "Error retrieving run details"
+        client.get_run.assert_not_called()
+
+
+class TestListingTools:
+    """Tests for the list_models and list_experiments tools."""
+
+    def test_list_models_filters_on_server(self):
+        """Test that the name filter and page size are sent to the server."""
+        client = MagicMock()
+        client.search_registered_models.return_value = _Page(
+            [_registered_model("churn-a"), _registered_model("churn-b")], NEXT_PAGE,
+        )
+
+        with patch.object(tools, "get_client", return_value=client), patch.object(
+            tools, "get_snapshot", return_value=None,
+        ):
+            result = json.loads(
+                tools.list_models.invoke({"name_contains": "churn", "max_results": 2}),
+            )
+
+        client.search_registered_models.assert_called_once_with(
+            max_results=2, page_token=None, filter_string="name ILIKE '%churn%'",
+        )
+        assert [model["name"] for model in _rows(result["models"])] == ["churn-a", "churn-b"]
+        assert result["next_cursor"] is not None
+
+    def test_list_experiments_filters_on_server(self):
+        """Test that experiments are filtered on the server and their runs counted."""
+        experiment = MagicMock(
+            experiment_id="1",
+            artifact_location="/tmp",
+            lifecycle_stage="active",
+            creation_time=0,
+            tags=[],
+        )
+        experiment.name = "churn"
+        client = MagicMock()
+        client.search_experiments.return_value = _Page([experiment])
+        client.search_runs.return_value = _Page(range(4))
+
+        with patch.object(tools, "get_mlflow_connection", return_value=_connection(client)), patch.object(
+            tools, "get_snapshot", return_value=None,
+        ), patch.object(tools, "get_local_store", return_value=None):
+            result = json.loads(tools.list_experiments.invoke({"name_contains": "churn"}))
+
+        assert client.search_experiments.call_args.kwargs["filter_string"] == (
+            "name ILIKE '%churn%'"
+        )
+        experiments = _rows(result["experiments"])
+        assert experiments[0]["name"] == "churn"
+        assert experiments[0]["run_count"] == 4
+        assert result["next_cursor"] is None
+
+    def test_list_experiments_counts_with_async_client(self):
+        """Test that a REST server's run counts are gathered with the async client."""
+        experiments = []
+        for experiment_id in ("1", "2", "3"):
+            experiment = MagicMock(experiment_id=experiment_id, creation_time=0, tags=[])
+            experiment.name = f"exp-{experiment_id}"
+            experiments.append(experiment)
+        client = MagicMock()
+        client.search_experiments.return_value = _Page(experiments)
+        async_client = _AsyncClient(counts={
+            "1": (4, True), "2": (7, False), "3": RuntimeError("boom"),
+        })
+
+        with patch.object(
+            tools, "get_mlflow_connection", return_value=_remote_connection(client, async_client),
+        ), patch.object(tools, "get_snapshot", return_value=None), patch.object(
+            tools, "get_local_store", return_value=None,
+        ):
+            result = json.loads(tools.list_experiments.invoke({}))
+
+        counts = {row["experiment_id"]: row["run_count"] for row in _rows(result["experiments"])}
+        assert counts == {
+            "1": 4,
+            "2": "At least 7 (time budget exceeded)",
+            "3": "Error getting count",
+        }
+        client.search_runs.assert_not_called()
+
+
+class TestToolCursors:
+    """Tests for cursor-based paging in the listing tools."""
+
+    def test_snapshot_pages_use_offsets(self):
+        """Test that pages read from the snapshot resume at an offset."""
+        snapshot = MagicMock()
+        snapshot.list_models.side_effect = lambda name, limit, offset: [
+            {
+                "name": f"model-{i}",
+                "creation_timestamp": 0,
+                "last_updated_timestamp": 0,
+                "latest_versions": [],
+            }
+            for i in range(offset, min(offset + limit, 3))
+        ]
+
+        with patch.object(tools, "get_snapshot", return_value=snapshot):
+            first = json.loads(tools.list_models.invoke({"max_results": 2}))
+            second = json.loads(
+                tools.list_models.invoke({"max_results": 2, "cursor": first["next_cursor"]}),
+            )
+
+        assert [model["name"] for model in _rows(first["models"])] == ["model-0", "model-1"]
+        assert tools.MLflowTools.decode_cursor(first["next_cursor"]) == {"offset": 2}
+        assert [model["name"] for model in _rows(second["models"])] == ["model-2"]
+        assert second["next_cursor"] is None
+
+    def test_offset_cursor_expires_without_snapshot(self):
+        """Test that a snapshot cursor is rejected once the snapshot is stale."""
+        cursor = tools.MLflowTools.encode_cursor(offset=50)
+
+        with patch.object(tools, "get_snapshot", return_value=None), patch.object(
+            tools, "get_local_store", return_value=None,
+        ), patch.object(tools, "get_mlflow_connection") as mock_get_connection:
+            models = json.loads(tools.list_models.invoke({"cursor": cursor}))
+            experiments = json.loads(tools.list_experiments.invoke({"cursor": cursor}))
+
+        assert "Cursor has expired" in models["error"]
+        assert "Cursor has expired" in experiments["error"]
+        mock_get_connection.assert_not_called()
+
+    def test_server_page_token_is_resumed(self):
+        """Test that a bytes page token is decoded and sent back on the next page."""
+        client = MagicMock()
+        client.search_registered_models.side_effect = [
+            _Page([_registered_model("a")], NEXT_PAGE.encode()),
+            _Page([_registered_model("b")]),
+        ]
+
+        with patch.object(tools, "get_client", return_value=client), patch.object(
+            tools, "get_snapshot", return_value=None,
+        ):
+            first = json.loads(tools.list_models.invoke({"max_results": 1}))
+            second = json.loads(
+                tools.list_models.invoke({"max_results": 1, "cursor": first["next_cursor"]}),
+            )
+
+        assert tools.MLflowTools.decode_cursor(first["next_cursor"]) == {"page_token": NEXT_PAGE}
+        assert client.search_registered_models.call_args.kwargs["page_token"] == NEXT_PAGE
+        assert [model["name"] for model in _rows(second["models"])] == ["b"]
+
+    def test_model_versions_are_paged(self):
+        """Test that model versions are returned newest first, one page at a time."""
+        client = MagicMock()
+        client.get_registered_model.return_value = _registered_model("churn")
+        client.search_model_versions.return_value = [
+            _model_version(version, run_id=None) for version in range(1, 6)
+        ]
+
+        with patch.object(tools, "get_mlflow_connection", return_value=_connection(client)), patch.object(
+            tools, "get_local_store", return_value=None,
+        ):
+            first = json.loads(
+                tools.get_model_details.invoke({"model_name": "churn", "max_versions": 3}),
+            )
+            second = json.loads(tools.get_model_details.invoke({
+                "model_name": "churn", "max_versions": 3, "cursor": first["next_cursor"],
+            }))
+
+        assert [version["version"] for version in _rows(first["versions"])] == ["5", "4", "3"]
+        assert [version["version"] for version in _rows(second["versions"])] == ["2", "1"]
+        assert first["total_versions"] == 5
+        assert second["next_cursor"] is None
+
+
+def _search_run(run_id, experiment_id="1", metrics=None, params=None):
+    """Build a mock run as returned by search_runs."""
+    run = MagicMock()
+    run.info.run_id = run_id
+    run.info.run_name = run_id
+    run.info.experiment_id = experiment_id
+    run.info.status = "FINISHED"
+    run.info.start_time = 0
+    run.data.metrics = metrics or {}
+    run.data.params = params or {}
+    run.data.tags = {}
+    return run
+
+
+class TestSearchRuns:
+    """Tests for the search_runs tool."""
+
+    def test_arguments_reach_the_server(self):
+        """Test that names are resolved to IDs and the search runs on the server."""
+        client = MagicMock()
+        client.get_experiment_by_name.side_effect = lambda name: MagicMock(
+            experiment_id={"churn": "1", "fraud": "2"}[name],
+        )
+        client.search_runs.return_value = _Page(
+            [_search_run("a", metrics={"f1": 0.9}, params={"lr": "0.1"})],
+        )
+
+        with patch.object(tools, "get_client", return_value=client):
+            result = json.loads(tools.search_runs.invoke({
+                "experiment_names": ["churn", "fraud"],
+                "experiment_ids": ["3"],
+                "filter_string": "metrics.f1 > 0.8",
+                "order_by": ["metrics.f1 DESC"],
+                "columns": ["metrics.f1", "params.lr"],
+                "max_results": 5,
+            }))
+
+        client.search_runs.assert_called_once_with(
+            max_results=5,
+            page_token=None,
+            experiment_ids=["3", "1", "2"],
+            filter_string="metrics.f1 > 0.8",
+            order_by=["metrics.f1 DESC"],
+        )
+        runs = _rows(result["runs"])
+        assert runs[0]["run_id"] == "a"
+        assert runs[0]["metrics.f1"] == 0.9
+        assert runs[0]["params.lr"] == "0.1"
+
+    def test_all_experiments_by_default(self):
+        """Test that every experiment is searched when none is given."""
+        client = MagicMock()
+        client.search_experiments.return_value = _Page(
+            [MagicMock(experiment_id="1"), MagicMock(experiment_id="2")],
+        )
+        client.search_runs.return_value = _Page([_search_run("a", metrics={"f1": 0.9})])
+
+        with patch.object(tools, "get_client", return_value=client):
+            result = json.loads(tools.search_runs.invoke({}))
+
+        assert client.search_runs.call_args.kwargs["experiment_ids"] == ["1", "2"]
+        assert _rows(result["runs"])[0]["metrics.f1"] == 0.9
+
+    def test_unknown_experiment(self):
+        """Test the error returned for an experiment name that does not exist."""
+        client = MagicMock()
+        client.get_experiment_by_name.return_value = None
+
+        with patch.object(tools, "get_client", return_value=client):
+            result = json.loads(tools.search_runs.invoke({"experiment_names": ["missing"]}))
+
+        assert result == {"error": "Experiment not found: missing"}
+        client.search_runs.assert_not_called()
+
+
+def _reject_constant(name):
+    """Fail on NaN and Infinity, which are not valid JSON."""
+    msg = f"Invalid JSON constant: {name}"
+    raise ValueError(msg)
+
+
+class TestCompareRuns:
+    """Tests for the compare_runs tool and its batched run lookup."""
+
+    def test_search_runs_by_id_batches_and_falls_back(self):
+        """Test chunked run_id IN queries, with a per-run fallback for the rest."""
+        client = MagicMock()
+        client.search_experiments.return_value = _Page([MagicMock(experiment_id="1")])
+        client.search_runs.side_effect = lambda filter_string, **kwargs: _Page([
+            _search_run(run_id)
+            for run_id in ("a", "b", "c")
+            if f"'{run_id}'" in filter_string
+        ])
+
+        def get_run(run_id):
+            if run_id == "gone":
+                msg = "not found"
+                raise RuntimeError(msg)
+            return _search_run(run_id)
+
+        client.get_run.side_effect = get_run
+
+        with patch.object(tools, "RUN_ID_FILTER_CHUNK_SIZE", 2):
+            runs = tools.MLflowTools.search_runs_by_id(
+                client, ["a", "b", "c", "a", "deleted-exp", "gone"],
+            )
+
+        filters = [call.kwargs["filter_string"] for call in client.search_runs.call_args_list]
+        assert filters == [
+            "attributes.run_id IN ('a', 'b')",
+            "attributes.run_id IN ('c', 'deleted-exp')",
+            "attributes.run_id IN ('gone')",
+        ]
+        assert sorted(runs) == ["a", "b", "c", "deleted-exp"]
+        assert sorted(call.args[0] for call in client.get_run.call_args_list) == [
+            "deleted-exp", "gone",
+        ]
+
+    def test_search_runs_by_id_chunks_experiments(self):
+        """Test that experiment IDs are chunked and the search stops once runs are found."""
+        client = MagicMock()
+        client.search_experiments.return_value = _Page(
+            [MagicMock(experiment_id=str(i)) for i in range(5)],
+        )
+        # Run "a" lives in experiment 2, run "b" in experiment 3
+        location = {"a": "2", "b": "3"}
+        client.search_runs.side_effect = lambda experiment_ids, filter_string, **kwargs: _Page([
+            _search_run(run_id)
+            for run_id, experiment_id in location.items()
+            if experiment_id in experiment_ids and f"'{run_id}'" in filter_string
+        ])
+
+        with patch.object(tools, "SEARCH_RUNS_EXPERIMENT_CHUNK_SIZE", 2):
+            runs = tools.MLflowTools.search_runs_by_id(client, ["a", "b"])
+
+        assert sorted(runs) == ["a", "b"]
+        assert [
+            call.kwargs["experiment_ids"] for call in client.search_runs.call_args_list
+        ] == [["0", "1"], ["2", "3"]]
+        client.get_run.assert_not_called()
+
+    def test_compare_runs(self):
+        """Test the comparison output, with missing runs and metrics."""
+        runs = {
+            "a": _search_run("a", metrics={"f1": 0.8, "loss": 0.3}, params={"lr": "0.1"}),
+            "b": _search_run("b", metrics={"f1": 0.9}, params={"lr": "0.2"}),
+        }
+
+        with patch.object(tools, "get_client"), patch.object(
+            tools.MLflowTools, "search_runs_by_id", return_value=runs,
+        ):
+            text = tools.compare_runs.invoke({"run_ids": ["a", "b", "missing"]})
+
+        result = json.loads(text, parse_constant=_reject_constant)
+        assert result["baseline_run_id"] == "a"
+        assert result["missing_run_ids"] == ["missing"]
+        metrics = {row["metric"]: row for row in _rows(result["metrics"])}
+        assert metrics["f1"]["winner"] == "b"
+        assert metrics["loss"]["goal"] == "min"
+        assert metrics["loss"]["runs_reporting"] == 1
+        compared = {row["run_id"]: row for row in _rows(result["runs"])}
+        assert "loss" not in compared["b"]["metrics"]
+        assert compared["b"]["deltas"]["f1"] == pytest.approx(0.1)
+        assert compared["b"]["params"] == {"lr": "0.2"}
+
+    def test_compare_runs_requires_two_runs(self):
+        """Test the errors returned when fewer than two runs can be compared."""
+        with patch.object(tools, "get_client"), patch.object(
+            tools.MLflowTools, "search_runs_by_id", return_value={"a": _search_run("a")},
+        ):
+            too_few = json.loads(tools.compare_runs.invoke({"run_ids": ["a", "a"]}))
+            not_found = json.loads(tools.compare_runs.invoke({"run_ids": ["a", "b"]}))
+
+        assert "At least two distinct run IDs" in too_few["error"]
+        assert not_found["error"] == "Runs not found: ['b']"
+
+
+class TestMetricHistory:
+    """Tests for the get_metric_history tool."""
+
+    def test_history_is_ordered_and_summarized(self):
+        """Test that points are ordered by step and summarized over the full history."""
+        history = [
+            MagicMock(step=step, value=value, timestamp=timestamp)
+            for step, value, timestamp in [
+                (2, 0.5, 30), (0, 0.9, 10), (1, 0.7, 25), (1, 0.6, 20), (3, 0.4, 40),
+            ]
+        ]
+        client = MagicMock()
+        client.get_metric_history.return_value = history
+
+        with patch.object(tools, "get_client", return_value=client):
+            result = json.loads(tools.get_metric_history.invoke({
+                "run_id": "a", "metric_key": "loss", "max_points": 100,
+            }))
+
+        client.get_metric_history.assert_called_once_with("a", "loss")
+        assert result["points"]["rows"] == [
+            [0, 0.9], [1, 0.6], [1, 0.7], [2, 0.5], [3, 0.4],
+        ]
+        assert result["total_points"] == 5
+        assert result["first"] == {"step": 0, "value": 0.9}
+        assert result["last"] == {"step": 3, "value": 0.4}
+        assert result["min"] == {"step": 3, "value": 0.4}
+        assert result["max"] == {"step": 0, "value": 0.9}
+
+    def test_history_is_downsampled(self):
+        """Test that long histories are reduced to max_points."""
+        client = MagicMock()
+        client.get_metric_history.return_value = [
+            MagicMock(step=step, value=float(step % 7), timestamp=step) for step in range(1000)
+        ]
+
+        with patch.object(tools, "get_client", return_value=client):
+            result = json.loads(tools.get_metric_history.invoke({
+                "run_id": "a", "metric_key": "loss", "max_points": 20, "method": "minmax",
+            }))
+
+        assert result["total_points"] == 1000
+        assert result["returned_points"] <= 20
+        assert result["max"]["value"] == 6.0
+
+    def test_invalid_requests(self):
+        """Test the errors for an unknown method and a missing metric."""
+        client = MagicMock()
+        client.get_metric_history.return_value = []
+
+        with patch.object(tools, "get_client", return_value=client):
+            bad_method = json.loads(tools.get_metric_history.invoke({
+                "run_id": "a", "metric_key": "loss", "method": "mean",
+            }))
+            no_history = json.loads(tools.get_metric_history.invoke({
+                "run_id": "a", "metric_key": "loss",
+            }))
+
+        assert bad_method == {"error": "Unknown downsampling method: mean"}
+        assert no_history == {"error": "No history for metric 'loss' in run a"}
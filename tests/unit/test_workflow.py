@@ -1,6 +1,63 @@
-"""Unit tests for the provider module in MLflow Assistant.
+"""Unit tests for the workflow module in MLflow Assistant.
 
 This module contains unit tests for verifying the functionality of the
-`mlflow_assistant.core.provider` module, which integrates with various
-large language model (LLM) providers.
+`mlflow_assistant.engine.workflow` module, covering the process-level cache
+of compiled workflows.
 """
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mlflow_assistant.engine import workflow
+from mlflow_assistant.engine.tool_cache import ToolCallCache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    """Start every test with an empty workflow cache."""
+    workflow.clear_workflow_cache()
+    yield
+    workflow.clear_workflow_cache()
+
+
+class TestWorkflowCache:
+    """Tests for get_workflow."""
+
+    def test_reused_across_queries(self):
+        """Test that the workflow is compiled once for the same key."""
+        assert workflow.get_workflow() is workflow.get_workflow()
+
+    def test_keyed_by_tool_cache(self):
+        """Test that another session cache gets its own workflow."""
+        first = workflow.get_workflow()
+        assert workflow.get_workflow(ToolCallCache()) is not first
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache is bounded."""
+        caches = [ToolCallCache() for _ in range(3)]
+        with patch.object(workflow, "WORKFLOW_CACHE_MAX_SIZE", 2):
+            first = workflow.get_workflow(caches[0])
+            second = workflow.get_workflow(caches[1])
+            workflow.get_workflow(caches[0])
+            workflow.get_workflow(caches[2])
+            assert workflow.get_workflow(caches[0]) is first
+            assert workflow.get_workflow(caches[1]) is not second
+
+    def test_concurrent_callers_compile_once(self):
+        """Test that concurrent callers share a single compilation."""
+        results = []
+        with patch.object(
+            workflow, "create_workflow", wraps=workflow.create_workflow,
+        ) as create:
+            threads = [
+                threading.Thread(target=lambda: results.append(workflow.get_workflow()))
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert create.call_count == 1
+        assert all(result is results[0] for result in results)